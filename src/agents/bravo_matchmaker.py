@@ -14,16 +14,11 @@ Generates investment rationale (the "Why") for each buyer-target match.
 """
 
 import json
-import time
 import re
 from dataclasses import dataclass
 from typing import List, Literal, Optional, Dict
 from src.utils.llm_handler import LLMHandler
-
-try:
-    from ddgs import DDGS
-except ImportError:
-    from duckduckgo_search import DDGS
+from src.tools.search_service import get_search_service
 
 
 @dataclass
@@ -64,6 +59,7 @@ class BravoMatchmaker:
     
     def __init__(self):
         self.brain = LLMHandler()
+        self.search = get_search_service()
         self.role_prompt = """
         You are 'Agent BRAVO', a Senior M&A Strategist at MIRKWOOD Partners.
         
@@ -201,19 +197,12 @@ class BravoMatchmaker:
         
         activity_text = ""
         
-        try:
-            with DDGS() as ddgs:
-                for q in queries:
-                    try:
-                        results = ddgs.text(q, region='kr-kr', timelimit='y', max_results=1)
-                        if results:
-                            snippet = results[0].get('body', '')[:200]
-                            activity_text += f"{snippet}\n"
-                    except:
-                        pass
-                    time.sleep(0.3)
-        except:
-            pass
+        # 호출 간격은 공용 검색 서비스의 토큰 버킷이 제어
+        for q in queries:
+            results = self.search.text(q, region='kr-kr', timelimit='y', max_results=1)
+            if results:
+                snippet = results[0].get('body', '')[:200]
+                activity_text += f"{snippet}\n"
         
         return activity_text.strip()
     
@@ -248,6 +237,24 @@ class BravoMatchmaker:
         Returns:
             Professional rationale in Korean
         """
+        prompt = self._rationale_prompt(
+            target_name, target_sector, target_revenue,
+            buyer_name, buyer_type, recent_activity, buyer_context
+        )
+        rationale = self.brain.call_llm(self.role_prompt, prompt, mode="smart")
+        return self._finalize_rationale(rationale, target_name, target_sector, buyer_name, buyer_type)
+    
+    def _rationale_prompt(
+        self,
+        target_name: str,
+        target_sector: str,
+        target_revenue: Optional[float],
+        buyer_name: str,
+        buyer_type: str,
+        recent_activity: str,
+        buyer_context: str
+    ) -> str:
+        """Rationale LLM prompt (see _generate_rationale)"""
         revenue_str = f"{target_revenue:.0f}억 원" if target_revenue else "중견 규모"
         
         prompt = f"""
@@ -284,9 +291,17 @@ class BravoMatchmaker:
         
         Rationale:
         """
-        
-        rationale = self.brain.call_llm(self.role_prompt, prompt, mode="smart")
-        
+        return prompt
+    
+    def _finalize_rationale(
+        self,
+        rationale: str,
+        target_name: str,
+        target_sector: str,
+        buyer_name: str,
+        buyer_type: str
+    ) -> str:
+        """Clean LLM rationale, falling back to a template when empty/too short"""
         # Clean and validate
         rationale = rationale.strip()
         if not rationale or len(rationale) < 20:
@@ -416,7 +431,7 @@ class BravoMatchmaker:
             buyer_candidates = self._search_based_discovery(target_name, target_sector)
         
         # Step 2: Validate and enrich each candidate
-        buyer_profiles = []
+        shortlist = []
         seen_names = set()
         
         for candidate in buyer_candidates[:7]:  # Limit to 7 candidates
@@ -466,33 +481,32 @@ class BravoMatchmaker:
                 print(f"      ❌ Rejected: {buyer_name} (Sector Mismatch)")
                 continue
             
-            # Step 6: Generate rationale
-            rationale = self._generate_rationale(
-                target_name,
-                target_sector,
-                target_revenue,
-                buyer_name,
-                buyer_type,
-                recent_activity,
-                buyer_context
-            )
-            
-            # Step 7: Create BuyerProfile
-            profile = BuyerProfile(
-                name=buyer_name,
-                type=buyer_type,
-                fit_score=fit_score,
-                rationale=rationale,
-                recent_activity=recent_activity[:200] if recent_activity else ""
-            )
-            
-            buyer_profiles.append(profile)
+            shortlist.append((buyer_name, buyer_type, fit_score, recent_activity, buyer_context))
             print(f"      ✅ Added: {buyer_name} (Fit: {fit_score}/100)")
             
             # Limit to top 5
-            if len(buyer_profiles) >= 5:
+            if len(shortlist) >= 5:
                 break
         
+        # Step 6: Generate rationales (one concurrent LLM fan-out instead of one round trip per buyer)
+        prompts = [
+            self._rationale_prompt(target_name, target_sector, target_revenue, name, b_type, activity, context)
+            for name, b_type, _, activity, context in shortlist
+        ]
+        rationales = self.brain.map_llm(self.role_prompt, prompts, mode="smart")
+        
+        # Step 7: Create BuyerProfile
+        buyer_profiles = [
+            BuyerProfile(
+                name=name,
+                type=b_type,
+                fit_score=fit_score,
+                rationale=self._finalize_rationale(rationale, target_name, target_sector, name, b_type),
+                recent_activity=activity[:200] if activity else ""
+            )
+            for (name, b_type, fit_score, activity, _), rationale in zip(shortlist, rationales)
+        ]
+        
         # Sort by fit_score (descending)
         buyer_profiles.sort(key=lambda x: x.fit_score, reverse=True)
         
@@ -519,43 +533,41 @@ class BravoMatchmaker:
         
         candidates = []
         
-        try:
-            with DDGS() as ddgs:
-                for query in queries:
-                    try:
-                        results = ddgs.text(query, region='kr-kr', timelimit='y', max_results=2)
-                        if not results:
-                            continue
-                        
-                        for res in results:
-                            snippet = (res.get('title', '') + " " + res.get('body', ''))[:300]
-                            
-                            prompt = f"""
-                            Target: {target_name}
-                            Context: "{query}"
-                            Snippet: "{snippet}"
-                            
-                            Identify a SPECIFIC BUYER NAME.
-                            Rules: NO Generics ("Big Corp"), NO Advisory ("PwC").
-                            
-                            Return JSON: {{ "name": "Exact Name", "type": "SI" or "FI" }}
-                            """
-                            
-                            resp = self.brain.call_llm(self.role_prompt, prompt, mode="fast")
-                            data = self._clean_json(resp)
-                            
-                            if data and data.get('name') and "NO" not in data['name']:
-                                candidates.append(data)
-                                if len(candidates) >= 5:
-                                    break
-                        
+        for query in queries:
+            try:
+                results = self.search.text(query, region='kr-kr', timelimit='y', max_results=2)
+                if not results:
+                    continue
+                
+                prompts = []
+                for res in results:
+                    snippet = (res.get('title', '') + " " + res.get('body', ''))[:300]
+                    
+                    prompt = f"""
+                    Target: {target_name}
+                    Context: "{query}"
+                    Snippet: "{snippet}"
+                    
+                    Identify a SPECIFIC BUYER NAME.
+                    Rules: NO Generics ("Big Corp"), NO Advisory ("PwC").
+                    
+                    Return JSON: {{ "name": "Exact Name", "type": "SI" or "FI" }}
+                    """
+                    prompts.append(prompt)
+                
+                # 검색 결과별 추출 동시 호출 (결과 순서 유지)
+                for resp in self.brain.map_llm(self.role_prompt, prompts, mode="fast"):
+                    data = self._clean_json(resp)
+                    
+                    if data and data.get('name') and "NO" not in data['name']:
+                        candidates.append(data)
                         if len(candidates) >= 5:
                             break
-                    except:
-                        pass
-                    time.sleep(0.5)
-        except:
-            pass
+                
+                if len(candidates) >= 5:
+                    break
+            except:
+                pass
         
         return candidates
     
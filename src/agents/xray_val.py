@@ -4,12 +4,7 @@ from src.utils.llm_handler import LLMHandler
 from src.tools.dart_reader import DartReader
 from src.tools.multiple_lab import MultipleLab, FinancialInput
 from src.tools.naver_stock import NaverStockScout # [NEW] Phase 2
-
-# [Dependency Check] 검색 도구
-try:
-    from ddgs import DDGS
-except ImportError:
-    from duckduckgo_search import DDGS
+from src.tools.search_service import get_search_service
 
 class XrayValuation:
     def __init__(self):
@@ -17,6 +12,7 @@ class XrayValuation:
         self.dart = DartReader()
         self.lab = MultipleLab()
         self.market = NaverStockScout() # [NEW] Phase 2 Market Data
+        self.search = get_search_service() # 공용 웹 검색 (캐시 + 속도 제한)
 
     def _extract_json(self, text):
         try:
@@ -105,10 +101,9 @@ class XrayValuation:
         
         context = ""
         try:
-            with DDGS() as ddgs:
-                results = ddgs.text(query, region='kr-kr', timelimit='y', max_results=3)
-                for res in results:
-                    context += f"- {res['body']}\n"
+            results = self.search.text(query, region='kr-kr', timelimit='y', max_results=3)
+            for res in results:
+                context += f"- {res['body']}\n"
         except Exception as e:
             print(f"      ⚠️ Search Error: {e}")
         
@@ -126,6 +121,15 @@ class XrayValuation:
         resp = self.brain.call_llm("Financial Analyst", prompt, mode="smart")
         return self._extract_json(resp)
 
+    def prefetch(self, leads):
+        """
+        여러 리드의 시장 PER 동시 조회 (NaverStock 당일 캐시 워밍)
+        
+        이후 run_valuation(lead) 은 리드별 네이버 페이지 조회 없이 캐시 사용
+        """
+        names = [lead['company_name'] for lead in leads if lead.get('company_name')]
+        return self.market.prefetch(names)
+
     def run_valuation(self, lead_data):
         target_name = lead_data['company_name']
         summary = lead_data.get('summary', target_name)
@@ -138,7 +142,7 @@ class XrayValuation:
             sector_str = "Consumer" # Force Consumer for Beauty
         else:
             sector_prompt = f"Company: {target_name}, Biz: {summary}. Classify into [IT, Bio, Manu, Consumer, Finance]. Return Key."
-            sector_str = self.brain.call_llm("Sector Analyst", sector_prompt, mode="fast").strip()
+            sector_str = self.brain.call_llm("Sector Analyst", sector_prompt, mode="fast", cache_ttl=30 * 24 * 3600).strip()  # 섹터는 거의 불변 → 장기 캐시
             sector_str = re.sub(r'[^a-zA-Z]', '', sector_str)
         
         lead_data['sector'] = sector_str
@@ -2,16 +2,16 @@ import json
 import time
 import re
 from src.utils.llm_handler import LLMHandler
+from src.tools.search_service import get_search_service
 from difflib import SequenceMatcher # [NEW] 문자열 비교 도구
 
-try:
-    from ddgs import DDGS
-except ImportError:
-    from duckduckgo_search import DDGS
+# 스니펫 분석 배치 크기 (배치 단위 동시 호출, 유효 리드가 나오면 이후 배치는 호출 안 함)
+ANALYSIS_BATCH = 2
 
 class ZuluScout:
     def __init__(self):
         self.brain = LLMHandler()
+        self.search = get_search_service()
         self.role_prompt = "You are Agent ZULU. Find Targets. Accuracy is Key."
         self.blacklist = [
             "PEF", "사모펀드", "금융지주", "은행", "카드", "라이프", 
@@ -64,52 +64,64 @@ class ZuluScout:
                 continue
             effective_blacklist.append(bad)
         try:
-            with DDGS() as ddgs:
-                results = ddgs.news(query, region='kr-kr', timelimit=timelimit, max_results=5)
-                if not results:
-                    results = ddgs.text(query, region='kr-kr', timelimit=timelimit, max_results=5)
+            results = self.search.news(query, region='kr-kr', timelimit=timelimit, max_results=5)
+            if not results:
+                results = self.search.text(query, region='kr-kr', timelimit=timelimit, max_results=5)
 
-                if not results: return []
+            if not results: return []
 
-                for res in results:
-                    title = res.get('title', '')
-                    body = res.get('body') or res.get('text') or title
-                    
-                    if any(x in (title + body) for x in ["인수 완료", "매각 종결"]): continue
+            candidates, prompts = [], []
+            for res in results:
+                title = res.get('title', '')
+                body = res.get('body') or res.get('text') or title
+                
+                if any(x in (title + body) for x in ["인수 완료", "매각 종결"]): continue
 
-                    prompt = f"""
-                    Analyze this snippet for "{original_query}".
-                    News: {title}
-                    Context: {body}
-                    
-                    Task:
-                    1. Identify Company Name.
-                    2. Summarize Main Product/Business in 1 sentence.
-                    3. Determine Sector (Bio, IT, etc).
-                    
-                    Return JSON: {{ "company_name": "Name", "summary": "Biz", "sector": "Industry" }}
-                    """
+                prompt = f"""
+                Analyze this snippet for "{original_query}".
+                News: {title}
+                Context: {body}
+                
+                Task:
+                1. Identify Company Name.
+                2. Summarize Main Product/Business in 1 sentence.
+                3. Determine Sector (Bio, IT, etc).
+                
+                Return JSON: {{ "company_name": "Name", "summary": "Biz", "sector": "Industry" }}
+                """
+                candidates.append(res)
+                prompts.append(prompt)
 
-                    analysis = self.brain.call_llm(self.role_prompt, prompt, mode="fast")
-                    data = self._clean_json(analysis)
+            # 스니펫 분석: 작은 배치만 동시 호출 (검색 순서 유지 → 첫 번째 유효 리드 선택)
+            for i in range(0, len(prompts), ANALYSIS_BATCH):
+                analyses = self.brain.map_llm(self.role_prompt, prompts[i:i + ANALYSIS_BATCH], mode="fast")
+                leads = self._pick_lead(candidates[i:i + ANALYSIS_BATCH], analyses, original_query, effective_blacklist)
+                if leads: break
                     
-                    if data and data.get('company_name'):
-                        name = data['company_name']
-                        
-                        # [CRITICAL CHECK] 이름 검증
-                        if not self._is_similar(original_query, name):
-                            # print(f"   ❌ Rejected: {name} (Not matching {original_query})")
-                            continue
-
-                        if name.upper() in ["N/A", "UNKNOWN"]: continue
-                        if any(bad in name for bad in effective_blacklist): continue
-                        
-                        data['url'] = res.get('url')
-                        leads.append(data)
-                        print(f"   ✅ SIGNAL: {name} | {data.get('sector')} | {data.get('summary')}")
-                        if leads: break
-                        
         except Exception as e:
             print(f"   ⚠️ ZULU Error: {e}")
             
+        return leads
+
+    def _pick_lead(self, candidates, analyses, original_query, effective_blacklist):
+        """분석 결과 중 첫 번째 유효 리드 (없으면 빈 리스트)"""
+        leads = []
+        for res, analysis in zip(candidates, analyses):
+            data = self._clean_json(analysis)
+            
+            if data and data.get('company_name'):
+                name = data['company_name']
+                
+                # [CRITICAL CHECK] 이름 검증
+                if not self._is_similar(original_query, name):
+                    # print(f"   ❌ Rejected: {name} (Not matching {original_query})")
+                    continue
+
+                if name.upper() in ["N/A", "UNKNOWN"]: continue
+                if any(bad in name for bad in effective_blacklist): continue
+                
+                data['url'] = res.get('url')
+                leads.append(data)
+                print(f"   ✅ SIGNAL: {name} | {data.get('sector')} | {data.get('summary')}")
+                if leads: break
         return leads
\ No newline at end of file
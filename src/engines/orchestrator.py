@@ -19,6 +19,7 @@ from openpyxl import load_workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, numbers
 from openpyxl.utils import get_column_letter
 from .wood.wacc_logic import KoreanWACCCalculator
+from .wood.calculators.sensitivity import SensitivitySurface
 
 
 class WoodOrchestrator:
@@ -362,43 +363,20 @@ class WoodOrchestrator:
         """
         Generate WACC × Terminal Growth sensitivity table
         
+        Closed-form grid over the already-projected FCF vector
+        (see SensitivitySurface); no per-cell discount factor rebuild.
+        
         Returns:
             DataFrame with sensitivity matrix
         """
-        # Hardcoded sensitivity ranges (professional standard: ±1%, ±0.5%)
-        wacc_range = [-0.01, -0.005, 0.0, 0.005, 0.01]
-        tg_range = [-0.005, -0.0025, 0.0, 0.0025, 0.005]  # Relative to terminal_g
-        
-        base_wacc = base_scenario_result['wacc_result']['wacc']
-        fcf_series = base_scenario_result['fcf_df']['FCF'].tolist()
-        last_fcf = fcf_series[-1]
-        
-        # Build sensitivity matrix
-        results = []
-        for tg_delta in tg_range:
-            adj_tg = self.terminal_g + tg_delta
-            row_data = {'Terminal_Growth': f"{adj_tg*100:.2f}%"}
-            for wacc_delta in wacc_range:
-                adj_wacc = base_wacc + wacc_delta
-                
-                # Recalculate with adjusted assumptions
-                discount_factors = [1 / ((1 + adj_wacc) ** (i + 1)) for i in range(len(fcf_series))]
-                sum_pv_fcf = sum([fcf * df for fcf, df in zip(fcf_series, discount_factors)])
-                
-                if adj_wacc > adj_tg:
-                    tv = (last_fcf * (1 + adj_tg)) / (adj_wacc - adj_tg)
-                else:
-                    tv = last_fcf * 20
-                
-                pv_tv = tv * discount_factors[-1]
-                ev = sum_pv_fcf + pv_tv
-                
-                col_name = f"WACC_{adj_wacc*100:.2f}%"
-                row_data[col_name] = round(ev, 1)
-            
-            results.append(row_data)
+        # Professional standard: WACC ±1%, terminal growth ±0.5% (5 × 5)
+        surface = SensitivitySurface(
+            base_scenario_result['fcf_df']['FCF'].values,
+            base_scenario_result['wacc_result']['wacc'],
+            self.terminal_g
+        )
         
-        return pd.DataFrame(results)
+        return surface.table(wacc_points=5, growth_points=5, wacc_range=0.01, growth_range=0.005)
     
     # ========================================================================
     # EXCEL EXPORT (Professional Formatting)
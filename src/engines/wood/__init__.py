@@ -42,6 +42,7 @@ from .interface import MirkInput, WoodOutput, WoodWorkflowStatus
 
 # OPM Components
 from .opm_engine import OPMCalculator, TFEngine, HybridSecurity, IPOScenario
+from .opm_lsm import LSMEngine
 from .opm_excel import OPMExcelGenerator
 
 __all__ = [
@@ -66,6 +67,7 @@ __all__ = [
     # OPM
     'OPMCalculator',
     'TFEngine',
+    'LSMEngine',
     'HybridSecurity',
     'IPOScenario',
     'OPMExcelGenerator'
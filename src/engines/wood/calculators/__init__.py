@@ -6,10 +6,19 @@ Modular calculator components for DCF valuation:
 - wacc.py: Cost of capital calculation
 - fcf.py: Free cash flow projection
 - terminal_value.py: Terminal value calculation
+- dcf_batch.py: Vectorized multi-scenario DCF (FCF → PV → TV → EV)
+- monte_carlo.py: Chunked Monte Carlo DCF (EV distribution)
+- sensitivity.py: Cached WACC × terminal growth EV surface
 """
 
 from .wacc import WACCCalculator
 from .fcf import FCFCalculator
 from .terminal_value import TerminalValueCalculator
+from .dcf_batch import BatchDCFCalculator
+from .monte_carlo import MonteCarloDCFCalculator
+from .sensitivity import SensitivitySurface
 
-__all__ = ['WACCCalculator', 'FCFCalculator', 'TerminalValueCalculator']
+__all__ = [
+    'WACCCalculator', 'FCFCalculator', 'TerminalValueCalculator',
+    'BatchDCFCalculator', 'MonteCarloDCFCalculator', 'SensitivitySurface'
+]
@@ -0,0 +1,192 @@
+"""
+Batch DCF Calculator - WOOD V2 Engine
+
+[Methodology]
+Array-native version of the FCF waterfall + discounting + terminal value
+for S stacked scenarios at once (one NumPy pass, no per-row DataFrames):
+
+Revenue_t = Base × (1 + g)^t
+EBIT      = EBITDA - D&A
+FCF       = NOPAT + D&A - Capex - Δ NWC
+EV        = Σ FCF_t / (1 + WACC)^t + TV_Gordon / (1 + WACC)^n
+
+[Output]
+Dict of (S,) and (S, years) arrays; DataFrames are only built on export
+(see to_frame) so thousands of scenario variants stay cheap.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+wood_dir = os.path.dirname(current_dir)
+sys.path.insert(0, wood_dir)
+
+from models import ScenarioParameters
+
+
+SCENARIO_FIELDS = ['revenue_growth', 'ebitda_margin', 'da_ratio', 'capex_ratio', 'nwc_ratio', 'wacc_premium']
+
+
+def stack_scenarios(scenarios: List[ScenarioParameters]) -> Dict[str, np.ndarray]:
+    """
+    Stack scenario parameters into (S,) arrays
+    
+    Args:
+        scenarios: ScenarioParameters list
+    
+    Returns:
+        {field: np.ndarray} for each of SCENARIO_FIELDS
+    """
+    return {
+        name: np.array([getattr(s, name) for s in scenarios], dtype=float)
+        for name in SCENARIO_FIELDS
+    }
+
+
+class BatchDCFCalculator:
+    """
+    Vectorized DCF calculator (scenario × sensitivity)
+    
+    [IB Standard]
+    Same waterfall as FCFCalculator and same Gordon/exit-multiple logic as
+    TerminalValueCalculator, evaluated for all scenarios simultaneously.
+    """
+    
+    def __init__(self, exit_multiple: float = 8.0):
+        """
+        Args:
+            exit_multiple: Default EV/EBITDA exit multiple
+        """
+        self.exit_multiple = exit_multiple
+    
+    def run(
+        self,
+        base_revenue: float,
+        revenue_growth: np.ndarray,
+        ebitda_margin: np.ndarray,
+        da_ratio: np.ndarray,
+        capex_ratio: np.ndarray,
+        nwc_ratio: np.ndarray,
+        wacc: np.ndarray,
+        terminal_growth_rate: np.ndarray,
+        tax_rate: float,
+        projection_years: int = 5
+    ) -> Dict[str, np.ndarray]:
+        """
+        Run the DCF for S scenarios in one pass
+        
+        All parameter arguments broadcast to a common (S,) shape, so scalars
+        can be mixed with arrays.
+        
+        Args:
+            base_revenue: Base year revenue (억 원)
+            revenue_growth ... nwc_ratio: Scenario FCF drivers
+            wacc: Discount rate per scenario (premium already applied)
+            terminal_growth_rate: Perpetual growth rate (g)
+            tax_rate: Corporate tax rate
+            projection_years: Explicit forecast years
+        
+        Returns:
+            {
+                'revenue', 'ebitda', 'da', 'ebit', 'tax', 'nopat', 'capex',
+                'nwc', 'delta_nwc', 'fcf', 'discount_factor', 'pv_fcf': (S, years),
+                'sum_pv_fcf', 'tv_gordon', 'tv_exit_multiple',
+                'implied_ebitda_multiple', 'pv_terminal', 'enterprise_value',
+                'wacc', 'terminal_growth_rate': (S,)
+            }
+        """
+        growth, margin, da_r, capex_r, nwc_r, wacc, g = (
+            a[:, None] for a in np.broadcast_arrays(
+                *(np.atleast_1d(np.asarray(x, dtype=float)) for x in (
+                    revenue_growth, ebitda_margin, da_ratio, capex_ratio,
+                    nwc_ratio, wacc, terminal_growth_rate
+                ))
+            )
+        )
+        
+        years = np.arange(1, projection_years + 1)
+        
+        # FCF waterfall (S, years)
+        revenue = base_revenue * ((1 + growth) ** years)
+        ebitda = revenue * margin
+        da = revenue * da_r
+        ebit = ebitda - da
+        tax = np.where(ebit > 0, ebit * tax_rate, 0.0)
+        nopat = ebit - tax
+        capex = revenue * capex_r
+        nwc = revenue * nwc_r
+        delta_nwc = np.diff(nwc, axis=1, prepend=0.0)
+        fcf = nopat + da - capex - delta_nwc
+        
+        # Discounting
+        discount_factor = 1 / ((1 + wacc) ** years)
+        pv_fcf = fcf * discount_factor
+        sum_pv_fcf = pv_fcf.sum(axis=1)
+        
+        # Terminal value (Gordon, 20x FCF fallback when WACC <= g)
+        last_fcf = fcf[:, -1]
+        last_ebitda = ebitda[:, -1]
+        wacc = wacc[:, 0]
+        g = g[:, 0]
+        
+        spread = np.where(wacc > g, wacc - g, 1.0)
+        tv_gordon = np.where(wacc > g, (last_fcf * (1 + g)) / spread, last_fcf * 20)
+        tv_exit = last_ebitda * self.exit_multiple
+        implied_multiple = np.divide(
+            tv_gordon, last_ebitda,
+            out=np.zeros_like(tv_gordon), where=last_ebitda > 0
+        )
+        
+        pv_terminal = tv_gordon * discount_factor[:, -1]
+        
+        return {
+            'revenue': revenue,
+            'ebitda': ebitda,
+            'da': da,
+            'ebit': ebit,
+            'tax': tax,
+            'nopat': nopat,
+            'capex': capex,
+            'nwc': nwc,
+            'delta_nwc': delta_nwc,
+            'fcf': fcf,
+            'discount_factor': discount_factor,
+            'pv_fcf': pv_fcf,
+            'sum_pv_fcf': sum_pv_fcf,
+            'tv_gordon': tv_gordon,
+            'tv_exit_multiple': tv_exit,
+            'implied_ebitda_multiple': implied_multiple,
+            'pv_terminal': pv_terminal,
+            'enterprise_value': sum_pv_fcf + pv_terminal,
+            'wacc': wacc,
+            'terminal_growth_rate': g
+        }
+    
+    def to_frame(self, result: Dict[str, np.ndarray], index: int, start_year: int = 2026) -> pd.DataFrame:
+        """
+        FCF waterfall DataFrame for one scenario (export time only)
+        
+        Columns match FCFCalculator.project plus Discount_Factor / PV_FCF.
+        """
+        n_years = result['fcf'].shape[1]
+        
+        return pd.DataFrame({
+            'Year': list(range(start_year, start_year + n_years)),
+            'Revenue': result['revenue'][index],
+            'EBITDA': result['ebitda'][index],
+            'D&A': result['da'][index],
+            'EBIT': result['ebit'][index],
+            'Tax': result['tax'][index],
+            'NOPAT': result['nopat'][index],
+            'Add_DA': result['da'][index],
+            'Less_Capex': result['capex'][index],
+            'NWC': result['nwc'][index],
+            'Delta_NWC': result['delta_nwc'][index],
+            'FCF': result['fcf'][index],
+            'Discount_Factor': result['discount_factor'][index],
+            'PV_FCF': result['pv_fcf'][index]
+        })
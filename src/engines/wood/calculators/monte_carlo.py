@@ -0,0 +1,174 @@
+"""
+Monte Carlo DCF Calculator - WOOD V2 Engine
+
+[Methodology]
+Stochastic version of the scenario DCF:
+1. Sample revenue growth, EBITDA margin, WACC premium and terminal growth
+   from the distributions configured in config.json ("monte_carlo")
+2. Run each chunk of draws through BatchDCFCalculator (one NumPy pass)
+3. Keep only the EV vector (8 bytes per draw); projections are discarded
+   chunk by chunk so memory stays flat at 100k+ draws
+
+[Supported Distributions]
+- fixed:      {"value"}
+- normal:     {"mean", "std"}
+- uniform:    {"low", "high"}
+- triangular: {"low", "mode", "high"}
+Optional "min" / "max" clip any distribution (e.g. keep g >= 0).
+
+[Output]
+MonteCarloOutput: mean, std, percentiles, histogram, P(EV > price)
+"""
+
+import numpy as np
+from typing import Dict, Optional
+import sys
+import os
+
+current_dir = os.path.dirname(os.path.abspath(__file__))
+wood_dir = os.path.dirname(current_dir)
+sys.path.insert(0, wood_dir)
+
+from models import MonteCarloOutput
+from .dcf_batch import BatchDCFCalculator, SCENARIO_FIELDS
+
+
+STOCHASTIC_FIELDS = SCENARIO_FIELDS + ['terminal_growth_rate']
+
+PERCENTILES = [5, 10, 25, 50, 75, 90, 95]
+
+
+def sample_distribution(spec: dict, size: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Draw samples from one configured distribution
+    
+    Args:
+        spec: Distribution spec, e.g. {"dist": "normal", "mean": 0.10, "std": 0.03}
+        size: Number of draws
+        rng: NumPy random generator
+    
+    Returns:
+        (size,) array
+    """
+    dist = spec.get('dist', 'fixed')
+    
+    if dist == 'fixed':
+        draws = np.full(size, float(spec['value']))
+    elif dist == 'normal':
+        draws = rng.normal(spec['mean'], spec['std'], size)
+    elif dist == 'uniform':
+        draws = rng.uniform(spec['low'], spec['high'], size)
+    elif dist == 'triangular':
+        draws = rng.triangular(spec['low'], spec['mode'], spec['high'], size)
+    else:
+        raise ValueError(f"Unknown distribution: {dist}")
+    
+    if 'min' in spec or 'max' in spec:
+        draws = np.clip(draws, spec.get('min', -np.inf), spec.get('max', np.inf))
+    
+    return draws
+
+
+class MonteCarloDCFCalculator:
+    """
+    Chunked Monte Carlo DCF (EV distribution)
+    
+    [IB Standard]
+    Same FCF/TV logic as the point-estimate scenarios (BatchDCFCalculator);
+    only the inputs are random. Unsampled fields stay at the Base scenario.
+    """
+    
+    def __init__(
+        self,
+        batch_calculator: BatchDCFCalculator = None,
+        n_draws: int = 100_000,
+        chunk_size: int = 25_000,
+        histogram_bins: int = 50,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            batch_calculator: Vectorized DCF kernel (default: BatchDCFCalculator())
+            n_draws: Total draws
+            chunk_size: Draws per kernel pass (bounds peak memory)
+            histogram_bins: Number of EV histogram bins
+            seed: Random seed (None = non-reproducible)
+        """
+        self.batch = batch_calculator or BatchDCFCalculator()
+        self.n_draws = n_draws
+        self.chunk_size = chunk_size
+        self.histogram_bins = histogram_bins
+        self.seed = seed
+    
+    def run(
+        self,
+        base_revenue: float,
+        base_params: Dict[str, float],
+        base_wacc: float,
+        distributions: Dict[str, dict],
+        tax_rate: float,
+        projection_years: int = 5,
+        reference_price: Optional[float] = None
+    ) -> MonteCarloOutput:
+        """
+        Run the stochastic DCF
+        
+        Args:
+            base_revenue: Base year revenue (억 원)
+            base_params: Base scenario values for every STOCHASTIC_FIELDS entry
+            base_wacc: WACC before scenario premium (computed once)
+            distributions: {field: spec} for the sampled fields
+            tax_rate: Corporate tax rate
+            projection_years: Explicit forecast years
+            reference_price: EV threshold for P(EV > price) (optional)
+        
+        Returns:
+            MonteCarloOutput
+        """
+        unknown = set(distributions) - set(STOCHASTIC_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown stochastic fields: {sorted(unknown)}")
+        
+        rng = np.random.default_rng(self.seed)
+        ev = np.empty(self.n_draws)
+        
+        for start in range(0, self.n_draws, self.chunk_size):
+            size = min(self.chunk_size, self.n_draws - start)
+            
+            draws = {
+                name: sample_distribution(distributions[name], size, rng)
+                if name in distributions else base_params[name]
+                for name in STOCHASTIC_FIELDS
+            }
+            
+            result = self.batch.run(
+                base_revenue,
+                revenue_growth=draws['revenue_growth'],
+                ebitda_margin=draws['ebitda_margin'],
+                da_ratio=draws['da_ratio'],
+                capex_ratio=draws['capex_ratio'],
+                nwc_ratio=draws['nwc_ratio'],
+                wacc=base_wacc + np.broadcast_to(draws['wacc_premium'], (size,)),
+                terminal_growth_rate=draws['terminal_growth_rate'],
+                tax_rate=tax_rate,
+                projection_years=projection_years
+            )
+            
+            ev[start:start + size] = result['enterprise_value']
+        
+        counts, edges = np.histogram(ev, bins=self.histogram_bins)
+        
+        return MonteCarloOutput(
+            n_draws=self.n_draws,
+            ev_mean=float(ev.mean()),
+            ev_std=float(ev.std()),
+            percentiles={
+                p: float(v) for p, v in zip(PERCENTILES, np.percentile(ev, PERCENTILES))
+            },
+            histogram_counts=counts.tolist(),
+            histogram_edges=edges.tolist(),
+            reference_price=reference_price,
+            prob_above_price=float((ev > reference_price).mean()) if reference_price is not None else None,
+            distributions=dict(distributions),
+            seed=self.seed
+        )
@@ -0,0 +1,130 @@
+"""
+Sensitivity Surface - WOOD V2 Engine
+
+[Methodology]
+WACC × terminal growth sensitivity evaluated in closed form over a grid:
+
+PV_FCF(w)  = Σ FCF_t / (1 + w)^t              (W,)  one matrix-vector product
+TV(w, g)   = FCF_n × (1 + g) / (w - g)         (G, W) broadcast
+EV(w, g)   = PV_FCF(w) + TV(w, g) / (1 + w)^n
+
+The FCF vector is projected once and cached on the surface, so redrawing a
+finer grid (e.g. 50 × 50 heatmap) never re-runs the FCF waterfall.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Sequence
+
+
+class SensitivitySurface:
+    """
+    Cached WACC × terminal growth EV surface for one scenario
+    
+    [IB Standard]
+    Same Gordon Growth + 20x FCF fallback (WACC <= g) as TerminalValueCalculator
+    """
+    
+    def __init__(self, fcf: Sequence[float], base_wacc: float, base_growth: float):
+        """
+        Args:
+            fcf: Projected FCF (years 1..n), 억 원
+            base_wacc: Scenario WACC (grid center)
+            base_growth: Scenario terminal growth rate (grid center)
+        """
+        self.fcf = np.asarray(fcf, dtype=float)
+        self.base_wacc = base_wacc
+        self.base_growth = base_growth
+        self._years = np.arange(1, len(self.fcf) + 1)
+    
+    @classmethod
+    def from_dcf_output(cls, output) -> "SensitivitySurface":
+        """Build from a DCFOutput (uses its cached fcf_projection)"""
+        return cls(
+            output.fcf_projection,
+            output.wacc_output.wacc,
+            output.terminal_value_output.terminal_growth_rate
+        )
+    
+    def axes(
+        self,
+        wacc_points: int = 5,
+        growth_points: int = 5,
+        wacc_range: float = 0.01,
+        growth_range: float = 0.005
+    ):
+        """
+        Evenly spaced grid axes centered on the scenario values
+        
+        Args:
+            wacc_points / growth_points: Grid resolution
+            wacc_range / growth_range: Half-width (e.g. 0.01 = ±1%p)
+        
+        Returns:
+            (waccs, growths) arrays
+        """
+        waccs = self.base_wacc + np.linspace(-wacc_range, wacc_range, wacc_points)
+        growths = self.base_growth + np.linspace(-growth_range, growth_range, growth_points)
+        
+        return waccs, growths
+    
+    def evaluate(self, waccs: Sequence[float], growths: Sequence[float]) -> np.ndarray:
+        """
+        EV for every (g, WACC) pair
+        
+        Args:
+            waccs: WACC axis (W,)
+            growths: Terminal growth axis (G,)
+        
+        Returns:
+            (G, W) EV matrix (rows = growth, columns = WACC)
+        """
+        w = np.atleast_1d(np.asarray(waccs, dtype=float))
+        g = np.atleast_1d(np.asarray(growths, dtype=float))[:, None]
+        
+        discount = (1 + w[:, None]) ** -self._years  # (W, years)
+        sum_pv_fcf = discount @ self.fcf
+        last_discount = discount[:, -1]
+        
+        last_fcf = self.fcf[-1]
+        valid = w > g
+        spread = np.where(valid, w - g, 1.0)
+        tv = np.where(valid, last_fcf * (1 + g) / spread, last_fcf * 20)
+        
+        return sum_pv_fcf + tv * last_discount
+    
+    def grid(
+        self,
+        wacc_points: int = 50,
+        growth_points: int = 50,
+        wacc_range: float = 0.02,
+        growth_range: float = 0.01
+    ) -> pd.DataFrame:
+        """
+        Numeric EV grid for charts (index = growth, columns = WACC)
+        """
+        waccs, growths = self.axes(wacc_points, growth_points, wacc_range, growth_range)
+        
+        return pd.DataFrame(
+            self.evaluate(waccs, growths),
+            index=pd.Index(growths, name='Terminal_Growth'),
+            columns=pd.Index(waccs, name='WACC')
+        )
+    
+    def table(
+        self,
+        wacc_points: int = 5,
+        growth_points: int = 5,
+        wacc_range: float = 0.01,
+        growth_range: float = 0.005
+    ) -> pd.DataFrame:
+        """
+        Excel-style sensitivity table (Terminal_Growth column + WACC_x.xx% columns)
+        """
+        waccs, growths = self.axes(wacc_points, growth_points, wacc_range, growth_range)
+        ev = self.evaluate(waccs, growths).round(1)
+        
+        df = pd.DataFrame(ev, columns=[f"WACC_{w*100:.2f}%" for w in waccs])
+        df.insert(0, 'Terminal_Growth', [f"{g*100:.2f}%" for g in growths])
+        
+        return df
@@ -180,14 +180,28 @@ class WACCCalculator:
         peers: List[Dict]
     ) -> List[Dict]:
         """
-        Fetch live betas for peer group
+        Fetch live betas for peer group (single batch download)
         
         Args:
             peers: List of peer dicts with keys: name, ticker, static_beta, debt_equity_ratio, tax_rate
         
         Returns:
             List of peer dicts with added 'live_beta' and 'beta_source' keys
+            (Live 인 경우 'beta_r_squared', 'beta_std_error' 포함)
         """
+        live_betas = {}
+        
+        if self.use_live_beta and self.scanner:
+            fallbacks = {
+                peer['ticker']: peer.get('static_beta', 1.0)
+                for peer in peers if peer.get('ticker')
+            }
+            if fallbacks:
+                try:
+                    live_betas = self.scanner.get_beta_batch(list(fallbacks), fallback_beta=fallbacks)
+                except Exception as e:
+                    logging.warning(f"Failed to fetch peer betas: {e}")
+        
         results = []
         
         for peer in peers:
@@ -197,12 +211,14 @@ class WACCCalculator:
             static_beta = peer.get('static_beta', 1.0)
             
             if self.use_live_beta and ticker and self.scanner:
-                try:
-                    live_beta, source = self.scanner.get_beta(ticker, fallback_beta=static_beta)
-                    peer_result['live_beta'] = live_beta
-                    peer_result['beta_source'] = source
-                except Exception as e:
-                    logging.warning(f"Failed to fetch beta for {ticker}: {e}")
+                live = live_betas.get(ticker)
+                if live:
+                    peer_result['live_beta'] = live['beta']
+                    peer_result['beta_source'] = live['source']
+                    if live['source'] == "Live":
+                        peer_result['beta_r_squared'] = live['r_squared']
+                        peer_result['beta_std_error'] = live['std_error']
+                else:
                     peer_result['live_beta'] = static_beta
                     peer_result['beta_source'] = "Fallback"
             else:
@@ -213,6 +229,39 @@ class WACCCalculator:
         
         return results
     
+    def peer_beta_surface(
+        self, 
+        peers: List[Dict],
+        windows: Optional[Dict[str, int]] = None
+    ) -> List[Dict]:
+        """
+        Rolling daily/weekly/monthly betas for the peer group (audit trail)
+        
+        Args:
+            peers: List of peer dicts with keys: name, ticker
+            windows: {frequency: window periods} (default: MarketScanner.SURFACE_WINDOWS)
+        
+        Returns:
+            Tidy records: name, ticker, frequency, window, end_date,
+            raw_beta, adjusted_beta, r_squared, std_error, n_obs
+            (Live beta 비활성 또는 실패 시 빈 리스트)
+        """
+        names = {peer['ticker']: peer['name'] for peer in peers if peer.get('ticker')}
+        
+        if not (self.use_live_beta and self.scanner and names):
+            return []
+        
+        try:
+            surface = self.scanner.beta_surface(list(names), windows=windows)
+        except Exception as e:
+            logging.warning(f"Failed to build peer beta surface: {e}")
+            return []
+        
+        surface.insert(0, 'name', surface['ticker'].map(names))
+        surface['end_date'] = surface['end_date'].dt.strftime("%Y-%m-%d")
+        
+        return surface.to_dict('records')
+    
     def calculate(
         self, 
         assumptions: Assumptions, 
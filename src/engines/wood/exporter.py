@@ -10,6 +10,7 @@ Professional 9-sheet Excel model with Big 4 styling:
 7. Sensitivity
 8. Peer Group
 9. Data Source
+(+ Monte_Carlo / MC_Distribution when the stochastic mode ran)
 
 [Styling]
 - Blue font = Input values
@@ -27,6 +28,7 @@ from typing import List
 from datetime import datetime
 
 from .models import ValuationSummary, Assumptions
+from .calculators.sensitivity import SensitivitySurface
 
 
 class ExcelExporter:
@@ -106,6 +108,16 @@ class ExcelExporter:
         # Sheet 9: Data Source
         sheets['Data_Source'] = self._build_source_sheet(summary)
         
+        # Optional: Monte Carlo EV distribution
+        if summary.monte_carlo is not None:
+            sheets['Monte_Carlo'] = self._build_monte_carlo_sheet(summary.monte_carlo)
+            sheets['MC_Distribution'] = self._build_mc_distribution_sheet(summary.monte_carlo)
+        
+        # Optional: Rolling peer beta surface
+        if summary.beta_surface:
+            sheets['Beta_Surface'] = self._build_beta_surface_sheet(summary.beta_surface)
+            sheets['Beta_Rolling'] = pd.DataFrame(summary.beta_surface)
+        
         # Write to Excel
         with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
             for sheet_name, df in sheets.items():
@@ -231,23 +243,68 @@ class ExcelExporter:
         return df
     
     def _build_sensitivity_sheet(self, base_scenario, base_revenue: float) -> pd.DataFrame:
-        """Build sensitivity analysis sheet"""
-        # Simplified sensitivity table
-        wacc_range = [base_scenario.wacc_output.wacc + delta for delta in [-0.01, -0.005, 0, 0.005, 0.01]]
-        tg_range = [0.015, 0.0175, 0.02, 0.0225, 0.025]
+        """Build sensitivity analysis sheet (WACC ±1% × g ±0.5%, exact EV)"""
+        surface = SensitivitySurface.from_dcf_output(base_scenario)
+        
+        return surface.table(wacc_points=5, growth_points=5, wacc_range=0.01, growth_range=0.005)
+    
+    def _build_monte_carlo_sheet(self, mc) -> pd.DataFrame:
+        """Build Monte Carlo statistics sheet"""
+        items = ['Draws', 'Seed', 'Mean EV', 'Std EV']
+        values = [mc.n_draws, mc.seed if mc.seed is not None else '-', mc.ev_mean, mc.ev_std]
+        
+        for p, ev in mc.percentiles.items():
+            items.append(f"P{p} EV")
+            values.append(ev)
+        
+        if mc.prob_above_price is not None:
+            items += ['Reference Price', 'P(EV > Price)']
+            values += [mc.reference_price, f"{mc.prob_above_price*100:.1f}%"]
+        
+        for name, spec in mc.distributions.items():
+            items.append(f"Input: {name}")
+            values.append(", ".join(f"{k}={v}" for k, v in spec.items()))
         
+        return pd.DataFrame({'Item': items, 'Value': values})
+    
+    def _build_mc_distribution_sheet(self, mc) -> pd.DataFrame:
+        """Build Monte Carlo EV histogram sheet"""
+        counts = mc.histogram_counts
+        edges = mc.histogram_edges
+        total = sum(counts)
+        
+        cumulative = 0
         data = []
         
-        for tg in tg_range:
-            row = {'Terminal_Growth': f"{tg*100:.2f}%"}
-            for wacc in wacc_range:
-                # Simplified EV calculation
-                ev = base_scenario.enterprise_value * (1 + (base_scenario.wacc_output.wacc - wacc) * 5)
-                row[f"WACC_{wacc*100:.2f}%"] = round(ev, 1)
-            data.append(row)
+        for i, count in enumerate(counts):
+            cumulative += count
+            data.append({
+                'EV_From': edges[i],
+                'EV_To': edges[i + 1],
+                'Count': count,
+                'Frequency_%': count / total,
+                'Cumulative_%': cumulative / total
+            })
         
         return pd.DataFrame(data)
     
+    def _build_beta_surface_sheet(self, records: List[dict]) -> pd.DataFrame:
+        """Build rolling beta summary sheet (peer × frequency)"""
+        surface = pd.DataFrame(records).dropna(subset=['raw_beta']).sort_values('end_date')
+        grouped = surface.groupby(['name', 'ticker', 'frequency', 'window'], sort=False)
+        
+        summary = grouped['raw_beta'].agg(
+            Latest_Beta='last', Mean_Beta='mean', Std_Beta='std', Min_Beta='min', Max_Beta='max', Windows='count'
+        )
+        summary['Latest_Adj_Beta'] = grouped['adjusted_beta'].last()
+        summary['Latest_R2'] = grouped['r_squared'].last()
+        summary['Latest_SE'] = grouped['std_error'].last()
+        summary['As_Of'] = grouped['end_date'].last()
+        
+        return summary.reset_index().rename(columns={
+            'name': 'Name', 'ticker': 'Ticker', 'frequency': 'Frequency', 'window': 'Window'
+        })
+    
     def _build_peer_sheet(self, peers: List[dict]) -> pd.DataFrame:
         """Build peer group sheet"""
         data = []
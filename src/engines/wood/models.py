@@ -7,7 +7,7 @@ Using dataclasses for simplicity and type safety.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 # ==============================================================================
@@ -139,6 +139,34 @@ class DCFOutput:
     ebitda_projection: List[float] = field(default_factory=list)
 
 
+@dataclass
+class MonteCarloOutput:
+    """
+    Stochastic DCF output (EV distribution)
+    
+    [IB Transparency]
+    Keeps the sampling spec alongside the results for the audit trail
+    """
+    n_draws: int
+    ev_mean: float
+    ev_std: float
+    
+    # {5: P5 EV, 50: median EV, ...}
+    percentiles: Dict[int, float]
+    
+    # Histogram (len(edges) == len(counts) + 1)
+    histogram_counts: List[int]
+    histogram_edges: List[float]
+    
+    # P(EV > reference_price)
+    reference_price: Optional[float] = None
+    prob_above_price: Optional[float] = None
+    
+    # Metadata
+    distributions: Dict[str, dict] = field(default_factory=dict)
+    seed: Optional[int] = None
+
+
 @dataclass
 class ValuationSummary:
     """
@@ -157,3 +185,9 @@ class ValuationSummary:
     
     # Timestamp
     created_at: str = ""
+    
+    # Stochastic mode (optional)
+    monte_carlo: Optional[MonteCarloOutput] = None
+    
+    # Rolling peer beta surface (optional, tidy records)
+    beta_surface: Optional[List[dict]] = None
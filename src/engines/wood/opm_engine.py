@@ -17,9 +17,11 @@ Implements Tsiveriotis-Fernandes (TF) Model for valuing:
 """
 
 import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -28,6 +30,7 @@ class IPOScenario:
     check_date: datetime
     threshold_price: float
     failure_refix_ratio: float  # e.g., 0.70 (30% down)
+    averaging_days: int = 0  # Trailing-average window for the threshold test (0 = spot, lattice-compatible)
 
 
 @dataclass
@@ -58,6 +61,84 @@ class HybridSecurity:
     
     # Optional features
     ipo_scenario: Optional[IPOScenario] = None
+    staged_ipo_scenarios: List[IPOScenario] = field(default_factory=list)  # Later IPO deadlines
+
+
+@dataclass
+class RefixSchedule:
+    """
+    IPO refix terms compiled onto lattice step indices
+    
+    Event k is active from step start_steps[k] onward (N+1 = never) and
+    refixes nodes priced below thresholds[k] to refixed_cp[k]. When several
+    events trigger at a node, the lowest conversion price applies.
+    """
+    start_steps: np.ndarray
+    thresholds: np.ndarray
+    refixed_cp: np.ndarray
+    averaging_steps: np.ndarray  # Trailing-average window in steps (1 = spot)
+
+
+def compile_refix_schedule(
+    security: HybridSecurity,
+    N: int,
+    T_days: int
+) -> RefixSchedule:
+    """
+    Map IPO check dates to time-grid step indices (once per security)
+    
+    Step t is active when valuation_date + t * (T_days / N) days is on or
+    after the check date. The first active step is estimated arithmetically
+    and snapped against that exact datetime rule.
+    
+    Args:
+        security: HybridSecurity (ipo_scenario + staged_ipo_scenarios)
+        N: Number of time steps to maturity
+        T_days: Days to maturity
+    
+    Returns:
+        RefixSchedule (empty without IPO scenarios)
+    """
+    events = []
+    if security.ipo_scenario:
+        events.append(security.ipo_scenario)
+    events.extend(security.staged_ipo_scenarios)
+    
+    step_days = T_days / N
+    
+    def is_active(t: int, check_date: datetime) -> bool:
+        return security.valuation_date + timedelta(days=t * step_days) >= check_date
+    
+    start_steps = []
+    for event in events:
+        offset_days = (event.check_date - security.valuation_date).total_seconds() / 86400
+        t = int(np.clip(np.ceil(offset_days / step_days), 0, N+1))
+        
+        while t > 0 and is_active(t-1, event.check_date):
+            t -= 1
+        while t <= N and not is_active(t, event.check_date):
+            t += 1
+        
+        start_steps.append(t)
+    
+    return RefixSchedule(
+        start_steps=np.array(start_steps, dtype=int),
+        thresholds=np.array([e.threshold_price for e in events], dtype=float),
+        refixed_cp=np.array([
+            max(security.refix_floor, security.conversion_price * e.failure_refix_ratio)
+            for e in events
+        ], dtype=float),
+        averaging_steps=np.array([
+            max(1, int(round(e.averaging_days / step_days))) for e in events
+        ], dtype=int)
+    )
+
+
+def _price_in_worker(args: Tuple[int, str, int, HybridSecurity]) -> Dict:
+    """Process-pool entry point (module level so it can be pickled)"""
+    max_steps, method, audit_slices, security = args
+    engine = TFEngine(max_steps=max_steps, method=method)
+    return engine.price_hybrid_security(security, audit_slices=audit_slices)
 
 
 class TFEngine:
@@ -70,19 +151,34 @@ class TFEngine:
     Journal of Fixed Income, 8(2), 95-102.
     """
     
-    def __init__(self, max_steps: int = 300):
+    def __init__(self, max_steps: int = 300, method: str = 'vectorized'):
         """
         Args:
             max_steps: Maximum lattice steps (performance cap for large maturities)
+            method: 'vectorized' (NumPy slices, handles 1,000-3,000 daily steps)
+                    or 'loop' (node-by-node reference implementation)
         """
+        if method not in ('vectorized', 'loop'):
+            raise ValueError(f"Unknown lattice method: {method}")
+        
         self.max_steps = max_steps
+        self.method = method
     
-    def price_hybrid_security(self, security: HybridSecurity) -> Dict:
+    def price_hybrid_security(
+        self,
+        security: HybridSecurity,
+        audit_slices: int = 0
+    ) -> Dict:
         """
         Price hybrid security using TF model
         
+        The vectorized engine rolls two lattice slices backward, so memory
+        is O(N) regardless of step count. Set audit_slices to keep a sampled
+        subset of time slices for the Excel lattice audit sheet.
+        
         Args:
             security: HybridSecurity specification
+            audit_slices: Number of evenly spaced time slices to keep (0 = none)
         
         Returns:
             {
@@ -105,10 +201,6 @@ class TFEngine:
         rf = security.risk_free_rate
         cs = security.credit_spread
         
-        face = security.face_value
-        redemption_value = face * (1 + security.redemption_premium)
-        floor = security.refix_floor
-        
         # ================================================================
         # 1. LATTICE SETUP (Date-Adaptive)
         # ================================================================
@@ -137,48 +229,436 @@ class TFEngine:
         print(f"      Discount: Risky {df_risky:.6f}, RF {df_rf:.6f}")
         
         # ================================================================
-        # 3. FORWARD PASS: Stock Price & Conversion Price
+        # 3-4. FORWARD PASS + BACKWARD INDUCTION (TF Split)
         # ================================================================
         
+        schedule = self._compile_refix_schedule(security, N, T_days)
+        audit_steps = self._audit_steps(N, audit_slices)
+        
+        if self.method == 'loop':
+            induct = self._induct_loop
+        else:
+            induct = self._induct_vectorized
+        
+        per_unit_host, per_unit_equity, cp_0, lattice_audit = induct(
+            security, N, u, d, q, df_risky, df_rf, schedule, audit_steps
+        )
+        
+        # ================================================================
+        # 5. RESULTS
+        # ================================================================
+        
+        per_unit_total = per_unit_host + per_unit_equity
+        
+        total_host = per_unit_host * security.num_shares
+        total_equity = per_unit_equity * security.num_shares
+        total_value = per_unit_total * security.num_shares
+        
+        print(f"      Host (Debt): {total_host:,.0f}")
+        print(f"      Equity (Option): {total_equity:,.0f}")
+        print(f"      Total: {total_value:,.0f}")
+        
+        return {
+            'total_value': total_value,
+            'debt_component': total_host,
+            'equity_component': total_equity,
+            'per_share_value': per_unit_total,
+            'conversion_price_final': cp_0,
+            'lattice_steps': N,
+            'model': 'TF',
+            'split_ratio': total_equity / total_value if total_value > 0 else 0,
+            'lattice_size': (N+1, N+1),
+            'lattice_audit': lattice_audit,
+            # For audit trail
+            'parameters': {
+                'S0': S0,
+                'K_init': K_init,
+                'vol': vol,
+                'rf': rf,
+                'cs': cs,
+                'T_years': T_years,
+                'u': u,
+                'd': d,
+                'q': q,
+                'df_risky': df_risky,
+                'df_rf': df_rf
+            }
+        }
+    
+    def price_grid(
+        self,
+        security: HybridSecurity,
+        volatilities: Optional[List[float]] = None,
+        credit_spreads: Optional[List[float]] = None,
+        stock_prices: Optional[List[float]] = None,
+        ipo_thresholds: Optional[List[float]] = None
+    ) -> pd.DataFrame:
+        """
+        Price a sensitivity grid in one batched lattice pass
+        
+        All grid points share the step count and the IPO date-to-step
+        schedule, so these are built once; the lattice itself is inducted
+        for every point simultaneously (one (G, t+1) array per slice).
+        
+        Args:
+            security: Base HybridSecurity (axes left as None use its value)
+            volatilities: σ values
+            credit_spreads: Credit spread values
+            stock_prices: S0 values
+            ipo_thresholds: IPO threshold prices (requires security.ipo_scenario)
+        
+        Returns:
+            DataFrame indexed by (volatility, credit_spread, stock_price,
+            ipo_threshold) with total_value, debt_component, equity_component,
+            per_share_value and split_ratio columns. Use .unstack() for heatmaps.
+        """
+        ipo = security.ipo_scenario
+        
+        if ipo_thresholds is not None and not ipo:
+            raise ValueError("ipo_thresholds requires security.ipo_scenario")
+        
+        axes = {
+            'volatility': volatilities if volatilities is not None else [security.volatility],
+            'credit_spread': credit_spreads if credit_spreads is not None else [security.credit_spread],
+            'stock_price': stock_prices if stock_prices is not None else [security.current_stock_price],
+            'ipo_threshold': ipo_thresholds if ipo_thresholds is not None else [ipo.threshold_price if ipo else np.nan]
+        }
+        
+        index = pd.MultiIndex.from_product(list(axes.values()), names=list(axes.keys()))
+        vol = index.get_level_values('volatility').to_numpy(dtype=float)
+        cs = index.get_level_values('credit_spread').to_numpy(dtype=float)
+        S0 = index.get_level_values('stock_price').to_numpy(dtype=float)
+        thresholds = index.get_level_values('ipo_threshold').to_numpy(dtype=float)
+        
+        # Shared lattice setup (parameter independent)
+        T_days = (security.maturity_date - security.valuation_date).days
+        T_years = T_days / 365.0
+        N = min(T_days, self.max_steps)
+        dt = T_years / N
+        schedule = self._compile_refix_schedule(security, N, T_days)
+        
+        # Per-point CRR parameters
+        rf = security.risk_free_rate
+        u = np.exp(vol * np.sqrt(dt))
+        d = 1 / u
+        q = (np.exp(rf * dt) - d) / (u - d)
+        df_risky = np.exp(-(rf + cs) * dt)
+        df_rf = np.full(len(index), np.exp(-rf * dt))
+        
+        print(f"   🌲 TF Grid: {security.security_id}")
+        print(f"      Points: {len(index)}, Steps: {N}, Days: {T_days}")
+        
+        D_0, E_0, _, _ = self._induct_batch(
+            security, N, S0, u, d, q, df_risky, df_rf, schedule, [],
+            primary_thresholds=thresholds if ipo else None
+        )
+        
+        total = (D_0 + E_0) * security.num_shares
+        
+        return pd.DataFrame({
+            'total_value': total,
+            'debt_component': D_0 * security.num_shares,
+            'equity_component': E_0 * security.num_shares,
+            'per_share_value': D_0 + E_0,
+            'split_ratio': np.divide(
+                E_0 * security.num_shares, total,
+                out=np.zeros_like(total), where=total > 0
+            )
+        }, index=index)
+    
+    def _compile_refix_schedule(
+        self,
+        security: HybridSecurity,
+        N: int,
+        T_days: int
+    ) -> RefixSchedule:
+        """
+        Compile IPO refix terms for the lattice (spot-price tests only)
+        
+        Raises:
+            ValueError: If any scenario uses trailing-average refixing
+        """
+        schedule = compile_refix_schedule(security, N, T_days)
+        
+        events = [security.ipo_scenario] if security.ipo_scenario else []
+        if any(e.averaging_days > 0 for e in events + security.staged_ipo_scenarios):
+            raise ValueError(
+                "Trailing-average refixing is path-dependent; price it with LSMEngine"
+            )
+        
+        return schedule
+    
+    def _audit_steps(self, N: int, audit_slices: int) -> List[int]:
+        """
+        Evenly spaced time steps to keep for the lattice audit (t=0 and t=N included)
+        """
+        if audit_slices <= 0:
+            return []
+        
+        if audit_slices == 1:
+            return [0]
+        
+        return sorted(set(np.linspace(0, N, audit_slices).round().astype(int).tolist()))
+    
+    def _induct_vectorized(
+        self,
+        security: HybridSecurity,
+        N: int,
+        u: float,
+        d: float,
+        q: float,
+        df_risky: float,
+        df_rf: float,
+        schedule: RefixSchedule,
+        audit_steps: List[int]
+    ) -> Tuple[float, float, float, List[Dict]]:
+        """
+        NumPy lattice for a single security (batch of one)
+        
+        Returns:
+            (D[0,0], E[0,0], CP[0,0], sampled audit slices)
+        """
+        D_0, E_0, CP_0, lattice_audit = self._induct_batch(
+            security, N,
+            S0=np.array([security.current_stock_price]),
+            u=np.array([u]),
+            d=np.array([d]),
+            q=np.array([q]),
+            df_risky=np.array([df_risky]),
+            df_rf=np.array([df_rf]),
+            schedule=schedule,
+            audit_steps=audit_steps
+        )
+        
+        lattice_audit = [
+            {key: (value[0] if key != 't' else value) for key, value in audit_slice.items()}
+            for audit_slice in lattice_audit
+        ]
+        
+        return float(D_0[0]), float(E_0[0]), float(CP_0[0]), lattice_audit
+    
+    def _induct_batch(
+        self,
+        security: HybridSecurity,
+        N: int,
+        S0: np.ndarray,
+        u: np.ndarray,
+        d: np.ndarray,
+        q: np.ndarray,
+        df_risky: np.ndarray,
+        df_rf: np.ndarray,
+        schedule: RefixSchedule,
+        audit_steps: List[int],
+        primary_thresholds: Optional[np.ndarray] = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[Dict]]:
+        """
+        NumPy lattice over G parameter sets at once, O(G x N) memory
+        
+        Each time slice is one (G, t+1) array operation and only the current
+        and next slices are alive during backward induction. Node (t, i) uses
+        the same S0 * u^i * d^(t-i) formula as the loop engine, so both
+        engines agree to floating-point tolerance.
+        
+        IPO refix masks come from a precompiled cutoff table (see
+        _refix_cutoffs); with staged events a reverse running minimum lays
+        out CP, keeping the per-node cost flat as events are added.
+        
+        Args:
+            S0, u, d, q, df_risky, df_rf: Arrays of shape (G,)
+            schedule: Refix schedule shared by all grid points
+            primary_thresholds: Per-point override of the first event's threshold, shape (G,)
+        
+        Returns:
+            (D[0,0], E[0,0], CP[0,0]) arrays of shape (G,), sampled audit slices
+        """
+        K_init = security.conversion_price
+        face = security.face_value
+        redemption_value = face * (1 + security.redemption_premium)
+        rows = np.arange(len(S0))[:, None]
+        
+        # Column vectors broadcast against (G, t+1) slices
+        S0 = S0[:, None]
+        q = q[:, None]
+        df_risky = df_risky[:, None]
+        df_rf = df_rf[:, None]
+        
+        # Powers of u and d, shared by every slice
+        steps = np.arange(N+1)
+        pow_u = u[:, None] ** steps
+        pow_d = d[:, None] ** steps
+        
+        cutoffs = self._refix_cutoffs(N, S0, u, d, pow_u, pow_d, schedule, primary_thresholds)
+        refixed_cp = schedule.refixed_cp
+        n_events = len(refixed_cp)
+        
+        def price_slice(t: int) -> Tuple[np.ndarray, np.ndarray]:
+            S_t = S0 * pow_u[:, :t+1] * pow_d[:, t::-1]
+            
+            if n_events == 0:
+                CP_t = np.full(S_t.shape, K_init, dtype=float)
+            elif n_events == 1:
+                CP_t = np.where(steps[:t+1] < cutoffs[t], refixed_cp[0], K_init)
+            else:
+                # Node i takes the lowest refixed CP among events with i < k
+                k = cutoffs[t]
+                hit = k > 0
+                lowest = np.full(S_t.shape, np.inf)
+                np.minimum.at(
+                    lowest,
+                    (np.broadcast_to(rows, k.shape)[hit], k[hit] - 1),
+                    np.broadcast_to(refixed_cp, k.shape)[hit]
+                )
+                lowest = np.minimum.accumulate(lowest[:, ::-1], axis=1)[:, ::-1]
+                CP_t = np.where(np.isinf(lowest), K_init, lowest)
+            
+            return S_t, CP_t
+        
+        audit_set = set(audit_steps)
+        lattice_audit = []
+        
+        # Terminal nodes (t = N, maturity)
+        S_t, CP_t = price_slice(N)
+        conversion_value = S_t * (face / CP_t)
+        convert = conversion_value > redemption_value
+        D_t = np.where(convert, 0.0, redemption_value)
+        E_t = np.where(convert, conversion_value, 0.0)
+        
+        if N in audit_set:
+            lattice_audit.append(self._audit_slice(N, S_t, CP_t, D_t, E_t))
+        
+        # Step backward (rolling: slice t replaces slice t+1)
+        for t in range(N-1, -1, -1):
+            cont_D = (q * D_t[:, 1:] + (1-q) * D_t[:, :-1]) * df_risky
+            cont_E = (q * E_t[:, 1:] + (1-q) * E_t[:, :-1]) * df_rf
+            
+            S_t, CP_t = price_slice(t)
+            conversion_value = S_t * (face / CP_t)
+            
+            # American exercise check
+            convert = conversion_value > cont_D + cont_E
+            D_t = np.where(convert, 0.0, cont_D)
+            E_t = np.where(convert, conversion_value, cont_E)
+            
+            if t in audit_set:
+                lattice_audit.append(self._audit_slice(t, S_t, CP_t, D_t, E_t))
+        
+        lattice_audit.reverse()
+        
+        return D_t[:, 0], E_t[:, 0], CP_t[:, 0], lattice_audit
+    
+    def _audit_slice(
+        self,
+        t: int,
+        S_t: np.ndarray,
+        CP_t: np.ndarray,
+        D_t: np.ndarray,
+        E_t: np.ndarray
+    ) -> Dict:
+        """Copy one lattice time slice for the audit trail"""
+        return {
+            't': t,
+            'S': np.array(S_t, copy=True),
+            'CP': np.array(CP_t, copy=True),
+            'D': np.array(D_t, copy=True),
+            'E': np.array(E_t, copy=True)
+        }
+    
+    def _refix_cutoffs(
+        self,
+        N: int,
+        S0: np.ndarray,
+        u: np.ndarray,
+        d: np.ndarray,
+        pow_u: np.ndarray,
+        pow_d: np.ndarray,
+        schedule: RefixSchedule,
+        primary_thresholds: Optional[np.ndarray]
+    ) -> np.ndarray:
+        """
+        Compile IPO refix node masks for every step at once
+        
+        S(t, i) is ascending in i, so the nodes below a threshold are the
+        prefix i < k. k is solved from logs and snapped against the exact
+        S0 * u^i * d^(t-i) comparison used by the loop engine; steps before
+        an event's start step get k = 0.
+        
+        Args:
+            S0: Column vector of shape (G, 1)
+            pow_u, pow_d: Powers of u and d, shape (G, N+1)
+            primary_thresholds: Per-point override of the first event's threshold, shape (G,)
+        
+        Returns:
+            Integer cutoffs of shape (N+1, G, m)
+        """
+        G = len(u)
+        m = len(schedule.start_steps)
+        
+        # Event thresholds per grid point, shape (G, m)
+        thresholds = np.tile(schedule.thresholds, (G, 1))
+        if primary_thresholds is not None:
+            thresholds[:, 0] = primary_thresholds
+        
+        # S(t, i) = thr  <=>  i = (log(thr / S0) - t log d) / (log u - log d)
+        t = np.arange(N+1)[:, None, None]
+        log_u = np.log(u)[None, :, None]
+        log_d = np.log(d)[None, :, None]
+        x = (np.log(thresholds / S0)[None, :, :] - t * log_d) / (log_u - log_d)
+        k = np.clip(np.ceil(x), 0, t + 1).astype(int)
+        
+        g = np.arange(G)[None, :, None]
+        
+        def node_price(i: np.ndarray) -> np.ndarray:
+            i = np.clip(i, 0, t)
+            return S0[g, 0] * pow_u[g, i] * pow_d[g, t - i]
+        
+        for _ in range(2):
+            k = np.where((k > 0) & (node_price(k - 1) >= thresholds), k - 1, k)
+            k = np.where((k <= t) & (node_price(k) < thresholds), k + 1, k)
+        
+        # Events only refix from their start step onward
+        return np.where(t >= schedule.start_steps[None, None, :], k, 0)
+    
+    def _induct_loop(
+        self,
+        security: HybridSecurity,
+        N: int,
+        u: float,
+        d: float,
+        q: float,
+        df_risky: float,
+        df_rf: float,
+        schedule: RefixSchedule,
+        audit_steps: List[int]
+    ) -> Tuple[float, float, float, List[Dict]]:
+        """
+        Reference node-by-node lattice (slow, dense (N+1)x(N+1) memory)
+        
+        Returns:
+            (D[0,0], E[0,0], CP[0,0], sampled audit slices)
+        """
+        S0 = security.current_stock_price
+        K_init = security.conversion_price
+        face = security.face_value
+        redemption_value = face * (1 + security.redemption_premium)
+        n_events = len(schedule.start_steps)
+        
         S = np.zeros((N+1, N+1))
         CP = np.zeros((N+1, N+1))
         
         for t in range(N+1):
-            # Current date of this step
-            step_days = t * (T_days / N)
-            step_date = security.valuation_date + timedelta(days=step_days)
-            
-            # Check IPO event trigger
-            is_ipo_trigger = False
-            if security.ipo_scenario:
-                ipo_date = security.ipo_scenario.check_date
-                days_diff = abs((step_date - ipo_date).days)
-                
-                # Within 1 step of IPO date
-                if days_diff <= (T_days / N) / 2 + 0.5:
-                    is_ipo_trigger = True
-            
             for i in range(t+1):
                 # Stock price at node (t, i)
                 S[t, i] = S0 * (u ** i) * (d ** (t - i))
                 
-                # Conversion price at node
-                node_cp = K_init
+                # IPO conditional refixing: active events with S < threshold
+                triggered = [
+                    schedule.refixed_cp[k]
+                    for k in range(n_events)
+                    if t >= schedule.start_steps[k] and S[t, i] < schedule.thresholds[k]
+                ]
                 
-                # IPO conditional refixing
-                if security.ipo_scenario and step_date >= security.ipo_scenario.check_date:
-                    # If stock price < threshold, apply refixing
-                    if S[t, i] < security.ipo_scenario.threshold_price:
-                        node_cp = max(
-                            floor,
-                            node_cp * security.ipo_scenario.failure_refix_ratio
-                        )
-                
-                CP[t, i] = node_cp
-        
-        # ================================================================
-        # 4. BACKWARD INDUCTION (TF Split)
-        # ================================================================
+                # Conversion price at node (lowest triggered refix applies)
+                CP[t, i] = min(triggered) if triggered else K_init
         
         D = np.zeros((N+1, N+1))  # Debt component
         E = np.zeros((N+1, N+1))  # Equity component
@@ -224,54 +704,30 @@ class TFEngine:
                     D[t, i] = cont_D
                     E[t, i] = cont_E
         
-        # ================================================================
-        # 5. RESULTS
-        # ================================================================
-        
-        per_unit_host = D[0, 0]
-        per_unit_equity = E[0, 0]
-        per_unit_total = per_unit_host + per_unit_equity
-        
-        total_host = per_unit_host * security.num_shares
-        total_equity = per_unit_equity * security.num_shares
-        total_value = per_unit_total * security.num_shares
-        
-        print(f"      Host (Debt): {total_host:,.0f}")
-        print(f"      Equity (Option): {total_equity:,.0f}")
-        print(f"      Total: {total_value:,.0f}")
+        lattice_audit = [
+            self._audit_slice(t, S[t, :t+1], CP[t, :t+1], D[t, :t+1], E[t, :t+1])
+            for t in audit_steps
+        ]
         
-        return {
-            'total_value': total_value,
-            'debt_component': total_host,
-            'equity_component': total_equity,
-            'per_share_value': per_unit_total,
-            'conversion_price_final': CP[0, 0],
-            'lattice_steps': N,
-            'model': 'TF',
-            'split_ratio': total_equity / total_value if total_value > 0 else 0,
-            'lattice_size': (N+1, N+1),
-            # For audit trail
-            'parameters': {
-                'S0': S0,
-                'K_init': K_init,
-                'vol': vol,
-                'rf': rf,
-                'cs': cs,
-                'T_years': T_years,
-                'u': u,
-                'd': d,
-                'q': q,
-                'df_risky': df_risky,
-                'df_rf': df_rf
-            }
-        }
+        return D[0, 0], E[0, 0], CP[0, 0], lattice_audit
     
-    def price_portfolio(self, securities: List[HybridSecurity]) -> Dict:
+    def price_portfolio(
+        self,
+        securities: List[HybridSecurity],
+        max_workers: int = 1,
+        audit_slices: int = 0
+    ) -> Dict:
         """
         Price multiple hybrid securities
         
+        Each security is an independent lattice, so with max_workers > 1 the
+        tranches are priced in a process pool. Results keep the input order
+        and match the serial path exactly.
+        
         Args:
             securities: List of HybridSecurity objects
+            max_workers: Worker processes (1 = serial, None = os.cpu_count())
+            audit_slices: Lattice slices to keep per security (see price_hybrid_security)
         
         Returns:
             {
@@ -282,13 +738,26 @@ class TFEngine:
                 'summary': str
             }
         """
+        if max_workers == 1 or len(securities) <= 1:
+            priced = [
+                self.price_hybrid_security(sec, audit_slices=audit_slices)
+                for sec in securities
+            ]
+        else:
+            jobs = [
+                (self.max_steps, self.method, audit_slices, sec)
+                for sec in securities
+            ]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                # map() yields in submission order -> deterministic output
+                priced = list(executor.map(_price_in_worker, jobs))
+        
         results = []
         total_value = 0
         total_debt = 0
         total_equity = 0
         
-        for sec in securities:
-            result = self.price_hybrid_security(sec)
+        for sec, result in zip(securities, priced):
             results.append({
                 'security_id': sec.security_id,
                 'type': sec.security_type,
@@ -361,6 +830,66 @@ class OPMCalculator:
         Returns:
             Valuation result dict
         """
+        security = self._build_rcps_security(
+            company_name, stock_price, conversion_price, face_value,
+            num_shares, years_to_maturity, volatility, ipo_scenario
+        )
+        
+        result = self.engine.price_hybrid_security(security)
+        
+        return result
+    
+    def rcps_sensitivity_grid(
+        self,
+        company_name: str,
+        stock_price: float,
+        conversion_price: float,
+        face_value: float,
+        num_shares: float,
+        years_to_maturity: float,
+        volatility: float = 0.35,
+        ipo_scenario: Optional[Dict] = None,
+        volatilities: Optional[List[float]] = None,
+        credit_spreads: Optional[List[float]] = None,
+        stock_prices: Optional[List[float]] = None,
+        ipo_thresholds: Optional[List[float]] = None
+    ) -> pd.DataFrame:
+        """
+        RCPS sensitivity cube (e.g. 10x10 vol/spread heatmap) in one batched pass
+        
+        Args:
+            (base terms): Same as quick_rcps_valuation
+            volatilities / credit_spreads / stock_prices / ipo_thresholds:
+                Grid axes (None = base value)
+        
+        Returns:
+            DataFrame indexed by grid axes (see TFEngine.price_grid)
+        """
+        security = self._build_rcps_security(
+            company_name, stock_price, conversion_price, face_value,
+            num_shares, years_to_maturity, volatility, ipo_scenario
+        )
+        
+        return self.engine.price_grid(
+            security,
+            volatilities=volatilities,
+            credit_spreads=credit_spreads,
+            stock_prices=stock_prices,
+            ipo_thresholds=ipo_thresholds
+        )
+    
+    def _build_rcps_security(
+        self,
+        company_name: str,
+        stock_price: float,
+        conversion_price: float,
+        face_value: float,
+        num_shares: float,
+        years_to_maturity: float,
+        volatility: float,
+        ipo_scenario: Optional[Dict]
+    ) -> HybridSecurity:
+        """Build an RCPS HybridSecurity with market defaults"""
         val_date = datetime.now()
         mat_date = val_date + timedelta(days=int(years_to_maturity * 365))
         
@@ -373,7 +902,7 @@ class OPMCalculator:
                 failure_refix_ratio=ipo_scenario['ratio']
             )
         
-        security = HybridSecurity(
+        return HybridSecurity(
             security_id=company_name,
             security_type="RCPS",
             valuation_date=val_date,
@@ -390,7 +919,3 @@ class OPMCalculator:
             num_shares=num_shares,
             ipo_scenario=ipo_obj
         )
-        
-        result = self.engine.price_hybrid_security(security)
-        
-        return result
@@ -183,7 +183,8 @@ class OPMExcelGenerator:
         """
         Create lattice audit trail
         
-        Shows sample nodes from the lattice for verification
+        Shows sample nodes (bottom, middle, top of each sampled time slice)
+        from results priced with TFEngine.price_hybrid_security(audit_slices=k)
         """
         ws = self.wb.create_sheet("Lattice_Audit")
         
@@ -191,10 +192,28 @@ class OPMExcelGenerator:
         ws.append([])
         ws.append(['Node (t,i)', 'Stock Price', 'Conversion Price', 'Debt Value', 'Equity Value', 'Total Value'])
         
-        # Mock data (in real implementation, pass lattice nodes)
-        ws.append(['(0,0) Start', 20000, 25000, 45000, 8000, 53000])
-        ws.append(['(50,25) Mid', 22500, 25000, 48000, 12000, 60000])
-        ws.append(['(100,50) Late', 25000, 25000, 52000, 18000, 70000])
+        has_nodes = False
+        
+        for r in results:
+            for audit_slice in r.get('lattice_audit') or []:
+                t = audit_slice['t']
+                
+                for i in sorted({0, t // 2, t}):
+                    debt = float(audit_slice['D'][i])
+                    equity = float(audit_slice['E'][i])
+                    
+                    ws.append([
+                        f"{r.get('security_id', 'Unknown')} ({t},{i})",
+                        float(audit_slice['S'][i]),
+                        float(audit_slice['CP'][i]),
+                        debt,
+                        equity,
+                        debt + equity
+                    ])
+                    has_nodes = True
+        
+        if not has_nodes:
+            ws.append(['No lattice slices recorded', 'Price with audit_slices > 0 to sample nodes'])
         
         ws.append([])
         ws.append(['Audit Note:', 'Verify that Debt is discounted at (Rf + CS) and Equity at (Rf)'])
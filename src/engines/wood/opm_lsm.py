@@ -0,0 +1,376 @@
+"""
+OPM LSM Engine - Monte Carlo Pricing for Path-Dependent Hybrid Securities
+
+[Financial Logic]
+Longstaff-Schwartz (LSM) Monte Carlo counterpart of the TF lattice for
+RCPS / CB / CPS whose refixing depends on the price path, e.g. a trailing
+average over the N days before an IPO deadline (IPOScenario.averaging_days).
+
+[Core Principles]
+1. Same TF split as the lattice:
+   - Redemption cash flows (Debt) discounted at Rf + Credit Spread
+   - Conversion cash flows (Equity) discounted at Rf
+2. Refixing semantics per IPOScenario.averaging_days:
+   - 0 (spot): same rule as the lattice - from the check date onward, CP is
+     refixed at every date where spot is below the threshold (path-independent)
+   - > 0 (trailing average): the average is tested once at the check date
+     and the refixed CP sticks for the rest of the path (path-dependent)
+3. Two-pass LSM:
+   - Training paths: regress continuation value on conversion value
+   - Pricing paths: fresh paths apply the fitted exercise rule forward
+4. Bounded memory: pricing paths are simulated in chunks, and only the
+   steps that matter (exercise dates + averaging windows) are drawn;
+   GBM increments between them are sampled exactly
+
+[Reference]
+Longstaff, F., & Schwartz, E. (2001).
+"Valuing American options by simulation: a simple least-squares approach."
+Review of Financial Studies, 14(1), 113-147.
+"""
+
+import numpy as np
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .opm_engine import HybridSecurity, RefixSchedule, compile_refix_schedule
+
+
+class LSMEngine:
+    """
+    Longstaff-Schwartz Monte Carlo Engine (TF split)
+    
+    Accepts the same HybridSecurity / IPOScenario inputs as TFEngine and
+    returns the same result dict (model = 'LSM').
+    """
+    
+    def __init__(
+        self,
+        n_paths: int = 100_000,
+        train_paths: int = 20_000,
+        chunk_size: int = 25_000,
+        exercise_per_year: int = 12,
+        poly_degree: int = 3,
+        antithetic: bool = True,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            n_paths: Pricing paths
+            train_paths: Paths used to fit the exercise rule (held in memory)
+            chunk_size: Pricing paths simulated at once (memory bound)
+            exercise_per_year: Conversion decision dates per year (Bermudan approximation)
+            poly_degree: Polynomial degree of the continuation regression
+            antithetic: Pair every normal draw with its negative
+            seed: RNG seed (None = non-deterministic)
+        """
+        self.n_paths = n_paths
+        self.train_paths = train_paths
+        self.chunk_size = chunk_size
+        self.exercise_per_year = exercise_per_year
+        self.poly_degree = poly_degree
+        self.antithetic = antithetic
+        self.seed = seed
+    
+    def price_hybrid_security(self, security: HybridSecurity) -> Dict:
+        """
+        Price hybrid security using LSM Monte Carlo with TF split discounting
+        
+        Args:
+            security: HybridSecurity specification
+        
+        Returns:
+            {
+                'total_value': float,
+                'debt_component': float,
+                'equity_component': float,
+                'per_share_value': float,
+                'conversion_price_final': float (average CP at maturity),
+                'standard_error': float (per unit),
+                'model': 'LSM'
+            }
+        """
+        S0 = security.current_stock_price
+        K_init = security.conversion_price
+        vol = security.volatility
+        T_days = (security.maturity_date - security.valuation_date).days
+        T_years = T_days / 365.0
+        
+        rf = security.risk_free_rate
+        cs = security.credit_spread
+        
+        face = security.face_value
+        redemption_value = face * (1 + security.redemption_premium)
+        
+        # ================================================================
+        # 1. TIME GRID (Daily) + EXERCISE DATES
+        # ================================================================
+        
+        N = T_days
+        dt = 1 / 365.0
+        schedule = compile_refix_schedule(security, N, T_days)
+        
+        n_exercise = max(1, int(round(T_years * self.exercise_per_year)))
+        exercise_steps = np.unique(np.linspace(0, N, n_exercise + 1).round().astype(int)[1:])
+        
+        print(f"   🎲 LSM Engine: {security.security_id}")
+        print(f"      Paths: {self.n_paths:,}, Exercise dates: {len(exercise_steps)}, Days: {T_days}")
+        
+        seq = np.random.SeedSequence(self.seed)
+        train_rng, price_rng = [np.random.default_rng(s) for s in seq.spawn(2)]
+        
+        # ================================================================
+        # 2. TRAINING PASS: Fit continuation regressions (backward)
+        # ================================================================
+        
+        S_ex = np.empty((self.train_paths, len(exercise_steps)))
+        CP_ex = np.empty((self.train_paths, len(exercise_steps)))
+        
+        for m, (t, S_t, CP_t) in enumerate(
+            self._simulate(security, schedule, exercise_steps, dt, self.train_paths, train_rng)
+        ):
+            S_ex[:, m] = S_t
+            CP_ex[:, m] = CP_t
+        
+        # Terminal cash flows
+        conversion_value = S_ex[:, -1] * (face / CP_ex[:, -1])
+        convert = conversion_value > redemption_value
+        cash_D = np.where(convert, 0.0, redemption_value)
+        cash_E = np.where(convert, conversion_value, 0.0)
+        tau = np.full(self.train_paths, N)
+        
+        coefficients = [None] * len(exercise_steps)
+        
+        for m in range(len(exercise_steps) - 2, -1, -1):
+            t = exercise_steps[m]
+            
+            # Realized continuation value, discounted back to t (TF split)
+            continuation = (
+                cash_D * np.exp(-(rf + cs) * (tau - t) * dt)
+                + cash_E * np.exp(-rf * (tau - t) * dt)
+            )
+            
+            conversion_value = S_ex[:, m] * (face / CP_ex[:, m])
+            basis = self._basis(S_ex[:, m] / K_init, conversion_value / face)
+            coef, *_ = np.linalg.lstsq(basis, continuation / face, rcond=None)
+            coefficients[m] = coef
+            
+            convert = conversion_value > basis @ coef * face
+            cash_D = np.where(convert, 0.0, cash_D)
+            cash_E = np.where(convert, conversion_value, cash_E)
+            tau = np.where(convert, t, tau)
+        
+        del S_ex, CP_ex
+        
+        # ================================================================
+        # 3. PRICING PASS: Fresh paths, chunked (forward)
+        # ================================================================
+        
+        chunk_sizes = self._chunk_sizes()
+        n_priced = sum(chunk_sizes)
+        
+        sum_D = 0.0
+        sum_E = 0.0
+        sum_cp = 0.0
+        sample_values = []  # Per-pair (antithetic) or per-path values for the standard error
+        
+        for n_chunk in chunk_sizes:
+            alive = np.ones(n_chunk, dtype=bool)
+            pv_D = np.zeros(n_chunk)
+            pv_E = np.zeros(n_chunk)
+            
+            for m, (t, S_t, CP_t) in enumerate(
+                self._simulate(security, schedule, exercise_steps, dt, n_chunk, price_rng)
+            ):
+                conversion_value = S_t * (face / CP_t)
+                
+                if t == N:
+                    # Rational decision at maturity
+                    convert = alive & (conversion_value > redemption_value)
+                    redeem = alive & ~convert
+                    pv_D[redeem] = redemption_value * np.exp(-(rf + cs) * N * dt)
+                    sum_cp += CP_t.sum()
+                else:
+                    convert = alive & (
+                        conversion_value > self._basis(S_t / K_init, conversion_value / face) @ coefficients[m] * face
+                    )
+                
+                pv_E[convert] = conversion_value[convert] * np.exp(-rf * t * dt)
+                alive &= ~convert
+            
+            sum_D += pv_D.sum()
+            sum_E += pv_E.sum()
+            
+            values = pv_D + pv_E
+            if self.antithetic:
+                half = n_chunk // 2
+                values = (values[:half] + values[half:]) / 2
+            sample_values.append(values)
+        
+        # ================================================================
+        # 4. RESULTS
+        # ================================================================
+        
+        per_unit_host = sum_D / n_priced
+        per_unit_equity = sum_E / n_priced
+        
+        sample_values = np.concatenate(sample_values)
+        standard_error = sample_values.std(ddof=1) / np.sqrt(len(sample_values))
+        
+        # Conversion at t=0 (all paths identical)
+        cp_0 = self._initial_conversion_price(security, schedule)
+        conversion_value_0 = S0 * (face / cp_0)
+        if conversion_value_0 > per_unit_host + per_unit_equity:
+            per_unit_host, per_unit_equity = 0.0, conversion_value_0
+        
+        per_unit_total = per_unit_host + per_unit_equity
+        
+        total_host = per_unit_host * security.num_shares
+        total_equity = per_unit_equity * security.num_shares
+        total_value = per_unit_total * security.num_shares
+        
+        print(f"      Host (Debt): {total_host:,.0f}")
+        print(f"      Equity (Option): {total_equity:,.0f}")
+        print(f"      Total: {total_value:,.0f} (± {standard_error * security.num_shares:,.0f} s.e.)")
+        
+        return {
+            'total_value': total_value,
+            'debt_component': total_host,
+            'equity_component': total_equity,
+            'per_share_value': per_unit_total,
+            'conversion_price_final': sum_cp / n_priced,
+            'lattice_steps': N,
+            'model': 'LSM',
+            'split_ratio': total_equity / total_value if total_value > 0 else 0,
+            'standard_error': standard_error,
+            'n_paths': n_priced,
+            'exercise_dates': len(exercise_steps),
+            'lattice_audit': [],
+            # For audit trail
+            'parameters': {
+                'S0': S0,
+                'K_init': K_init,
+                'vol': vol,
+                'rf': rf,
+                'cs': cs,
+                'T_years': T_years,
+                'df_risky': np.exp(-(rf + cs) * dt),
+                'df_rf': np.exp(-rf * dt),
+                'seed': self.seed
+            }
+        }
+    
+    def _chunk_sizes(self) -> List[int]:
+        """Split n_paths into chunks (antithetic chunks are rounded up to even sizes)"""
+        chunk = max(2, self.chunk_size - self.chunk_size % 2)
+        sizes = [chunk] * (self.n_paths // chunk)
+        remainder = self.n_paths % chunk
+        if remainder:
+            sizes.append(remainder + remainder % 2 if self.antithetic else remainder)
+        return sizes
+    
+    def _basis(self, s: np.ndarray, x: np.ndarray) -> np.ndarray:
+        """
+        Regression basis [1, s, ..., s^degree, x, ..., x^degree]
+        
+        s = S / CP_init, x = conversion value / face. With spot refixing
+        x jumps when S crosses a threshold, so it is not a function of S alone.
+        """
+        return np.hstack([
+            np.vander(s, self.poly_degree + 1, increasing=True),
+            np.vander(x, self.poly_degree + 1, increasing=True)[:, 1:]
+        ])
+    
+    def _initial_conversion_price(self, security: HybridSecurity, schedule: RefixSchedule) -> float:
+        """CP at t=0 (events whose check date is on or before the valuation date)"""
+        cp = security.conversion_price
+        for k in np.flatnonzero(schedule.start_steps == 0):
+            if security.current_stock_price < schedule.thresholds[k]:
+                cp = min(cp, schedule.refixed_cp[k])
+        return cp
+    
+    def _spot_events(self, security: HybridSecurity) -> np.ndarray:
+        """Per-event flag (compile_refix_schedule order): True = spot test, lattice rule"""
+        events = ([security.ipo_scenario] if security.ipo_scenario else []) + list(security.staged_ipo_scenarios)
+        return np.array([e.averaging_days <= 0 for e in events], dtype=bool)
+    
+    def _simulate(
+        self,
+        security: HybridSecurity,
+        schedule: RefixSchedule,
+        exercise_steps: np.ndarray,
+        dt: float,
+        n_paths: int,
+        rng: np.random.Generator
+    ) -> Iterator[Tuple[int, np.ndarray, np.ndarray]]:
+        """
+        Simulate GBM paths and yield (t, S_t, CP_t) at each exercise step
+        
+        Only exercise steps and refix averaging windows are drawn; the
+        log-price increment between two drawn steps is sampled exactly.
+        Trailing-average events test their average once at the start step
+        and lower CP (never below the refixed CP) for the rest of the path.
+        Spot events (averaging_days = 0) follow TFEngine: at every step from
+        the start step onward, CP_t is refixed where S_t < threshold.
+        """
+        S0 = security.current_stock_price
+        vol = security.volatility
+        drift = security.risk_free_rate - 0.5 * vol ** 2
+        N = int(exercise_steps[-1])
+        
+        # Spot events are re-tested at each step (lattice rule), not observed
+        spot = self._spot_events(security)
+        
+        # Averaging windows [start - window + 1, start], clipped to the grid
+        live = (schedule.start_steps <= N) & ~spot
+        window_lo = np.maximum(schedule.start_steps - schedule.averaging_steps + 1, 0)
+        window_hi = schedule.start_steps
+        
+        exercise_set = set(exercise_steps.tolist())
+        steps = set(exercise_set)
+        for k in np.flatnonzero(live):
+            steps.update(range(window_lo[k], window_hi[k] + 1))
+        steps.discard(0)
+        
+        log_S = np.full(n_paths, np.log(S0))
+        S_t = np.full(n_paths, float(S0))
+        CP_t = np.full(n_paths, float(security.conversion_price))
+        price_sum = np.zeros((n_paths, len(schedule.start_steps)))
+        
+        def observe(t: int):
+            nonlocal CP_t
+            in_window = live & (window_lo <= t) & (t <= window_hi)
+            for k in np.flatnonzero(in_window):
+                price_sum[:, k] += S_t
+                if t == window_hi[k]:
+                    average = price_sum[:, k] / (window_hi[k] - window_lo[k] + 1)
+                    CP_t = np.where(
+                        average < schedule.thresholds[k],
+                        np.minimum(CP_t, schedule.refixed_cp[k]),
+                        CP_t
+                    )
+        
+        def conversion_price(t: int) -> np.ndarray:
+            cp = CP_t
+            for k in np.flatnonzero(spot & (schedule.start_steps <= t)):
+                cp = np.where(S_t < schedule.thresholds[k], np.minimum(cp, schedule.refixed_cp[k]), cp)
+            return cp
+        
+        observe(0)
+        
+        prev = 0
+        for t in sorted(steps):
+            span = (t - prev) * dt
+            
+            if self.antithetic:
+                z = rng.standard_normal((n_paths + 1) // 2)
+                z = np.concatenate([z, -z])[:n_paths]
+            else:
+                z = rng.standard_normal(n_paths)
+            
+            log_S += drift * span + vol * np.sqrt(span) * z
+            S_t = np.exp(log_S)
+            prev = t
+            
+            observe(t)
+            
+            if t in exercise_set:
+                yield t, S_t, conversion_price(t)
@@ -8,7 +8,8 @@ Modular, testable, IB-grade DCF valuation system with:
 3. Full FCF build-up (EBIT → NOPAT → FCF)
 4. Dual terminal value methods
 5. Multi-scenario analysis
-6. Professional Excel export
+6. Monte Carlo EV distribution (optional)
+7. Professional Excel export
 
 [Changes from V1]
 - Modular calculator structure (wacc/, fcf/, terminal_value/)
@@ -20,18 +21,24 @@ Modular, testable, IB-grade DCF valuation system with:
 import os
 import json
 import logging
+from dataclasses import replace
 from datetime import datetime
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional, Sequence
+import numpy as np
 import pandas as pd
 
 # Local imports
 from .models import (
     Assumptions, ScenarioParameters, PeerCompany,
-    DCFOutput, ValuationSummary, WACCOutput
+    DCFOutput, ValuationSummary, WACCOutput, TerminalValueOutput,
+    MonteCarloOutput
 )
 from .calculators.wacc import WACCCalculator
 from .calculators.fcf import FCFCalculator
 from .calculators.terminal_value import TerminalValueCalculator
+from .calculators.dcf_batch import BatchDCFCalculator, stack_scenarios, SCENARIO_FIELDS
+from .calculators.monte_carlo import MonteCarloDCFCalculator
+from .calculators.sensitivity import SensitivitySurface
 
 
 class WoodOrchestratorV2:
@@ -78,6 +85,10 @@ class WoodOrchestratorV2:
         self.wacc_calculator = WACCCalculator(use_live_beta=use_live_beta)
         self.fcf_calculator = FCFCalculator()
         self.tv_calculator = TerminalValueCalculator(exit_multiple=8.0)
+        self.dcf_batch = BatchDCFCalculator(exit_multiple=self.tv_calculator.exit_multiple)
+        
+        # Per-scenario sensitivity surfaces (FCF cached from the last run)
+        self.sensitivity_surfaces: Dict[str, SensitivitySurface] = {}
         
         logging.info("🌲 WOOD V2 Engine initialized (Nexflex Standard)")
         if use_live_beta:
@@ -139,111 +150,257 @@ class WoodOrchestratorV2:
         
         return peers
     
-    def _calculate_dcf_scenario(
+    def _calculate_dcf_scenarios(
         self,
-        scenario: ScenarioParameters,
+        scenarios: List[ScenarioParameters],
         base_revenue: float,
         assumptions: Assumptions,
         peers: List[dict]
-    ) -> DCFOutput:
+    ) -> List[DCFOutput]:
         """
-        Execute DCF valuation for one scenario
+        Execute DCF valuation for all scenarios in one vectorized pass
         
         [Process]
-        1. Calculate WACC (live beta + SRP)
-        2. Project FCF (detailed waterfall)
+        1. Calculate base WACC once (live beta + SRP), add scenario premiums
+        2. Project FCF (detailed waterfall) for all scenarios
         3. Discount FCFs to present value
         4. Calculate terminal value (dual method)
         5. Sum to enterprise value
         
         Args:
-            scenario: Scenario parameters
+            scenarios: Scenario parameters
             base_revenue: Base revenue
             assumptions: Core assumptions
             peers: Peer company list
         
         Returns:
-            DCFOutput with full results
+            DCFOutput per scenario (same order)
         """
-        logging.info(f"   📊 Scenario: {scenario.name}")
-        
         # ============================================================
-        # STEP 1: WACC
+        # STEP 1: WACC (peer betas fetched once, premium per scenario)
         # ============================================================
-        wacc_output = self.wacc_calculator.calculate(
-            assumptions, 
-            peers,
-            scenario_wacc_premium=scenario.wacc_premium
-        )
+        base_wacc_output = self.wacc_calculator.calculate(assumptions, peers)
         
-        wacc = wacc_output.wacc
-        logging.info(f"      WACC: {wacc*100:.2f}%")
+        wacc_outputs = [
+            replace(base_wacc_output, wacc=base_wacc_output.wacc + scenario.wacc_premium)
+            for scenario in scenarios
+        ]
         
         # ============================================================
-        # STEP 2: FCF PROJECTION
+        # STEPS 2-5: FCF → PV → TV → EV (all scenarios at once)
         # ============================================================
-        fcf_df = self.fcf_calculator.project(
-            base_revenue, 
-            scenario, 
-            assumptions
-        )
+        params = stack_scenarios(scenarios)
         
-        fcf_series = fcf_df['FCF'].tolist()
+        result = self.dcf_batch.run(
+            base_revenue,
+            revenue_growth=params['revenue_growth'],
+            ebitda_margin=params['ebitda_margin'],
+            da_ratio=params['da_ratio'],
+            capex_ratio=params['capex_ratio'],
+            nwc_ratio=params['nwc_ratio'],
+            wacc=np.array([w.wacc for w in wacc_outputs]),
+            terminal_growth_rate=assumptions.terminal_growth_rate,
+            tax_rate=assumptions.tax_rate,
+            projection_years=assumptions.projection_years
+        )
         
         # ============================================================
-        # STEP 3: DISCOUNT FCFs
+        # BUILD OUTPUT
         # ============================================================
-        discount_factors = [1 / ((1 + wacc) ** i) for i in range(1, len(fcf_series) + 1)]
-        pv_fcfs = [fcf * df for fcf, df in zip(fcf_series, discount_factors)]
-        sum_pv_fcf = sum(pv_fcfs)
+        outputs = []
         
-        # Add PV columns to DataFrame
-        fcf_df['Discount_Factor'] = discount_factors
-        fcf_df['PV_FCF'] = pv_fcfs
+        for i, scenario in enumerate(scenarios):
+            logging.info(
+                f"   📊 Scenario: {scenario.name} | WACC: {wacc_outputs[i].wacc*100:.2f}% | "
+                f"EV: {result['enterprise_value'][i]:.1f}억 원"
+            )
+            
+            outputs.append(DCFOutput(
+                scenario_name=scenario.name,
+                enterprise_value=float(result['enterprise_value'][i]),
+                pv_fcf=float(result['sum_pv_fcf'][i]),
+                pv_terminal=float(result['pv_terminal'][i]),
+                wacc_output=wacc_outputs[i],
+                terminal_value_output=TerminalValueOutput(
+                    tv_gordon=float(result['tv_gordon'][i]),
+                    tv_exit_multiple=float(result['tv_exit_multiple'][i]),
+                    implied_ebitda_multiple=float(result['implied_ebitda_multiple'][i]),
+                    terminal_growth_rate=assumptions.terminal_growth_rate,
+                    exit_multiple_assumption=self.dcf_batch.exit_multiple
+                ),
+                fcf_projection=result['fcf'][i].tolist(),
+                revenue_projection=result['revenue'][i].tolist(),
+                ebitda_projection=result['ebitda'][i].tolist()
+            ))
+            
+            self.sensitivity_surfaces[scenario.name] = SensitivitySurface.from_dcf_output(outputs[-1])
         
-        # ============================================================
-        # STEP 4: TERMINAL VALUE
-        # ============================================================
-        last_fcf = fcf_series[-1]
-        last_ebitda = fcf_df['EBITDA'].iloc[-1]
-        
-        tv_output = self.tv_calculator.calculate(
-            last_fcf,
-            last_ebitda,
-            wacc,
-            assumptions.terminal_growth_rate
+        return outputs
+    
+    def sensitivity_surface(self, scenario_name: str = "Base") -> SensitivitySurface:
+        """
+        Cached WACC × terminal growth surface from the last valuation run
+        
+        Redrawing any grid resolution reuses the scenario's FCF vector:
+            orchestrator.sensitivity_surface("Base").grid(50, 50)
+        
+        Args:
+            scenario_name: Scenario name (Base/Bull/Bear)
+        
+        Returns:
+            SensitivitySurface
+        """
+        if scenario_name not in self.sensitivity_surfaces:
+            raise KeyError(f"No valuation run for scenario '{scenario_name}' (call run_valuation first)")
+        
+        return self.sensitivity_surfaces[scenario_name]
+    
+    def run_range_analysis(
+        self,
+        base_revenue: float,
+        variants: Dict[str, Sequence[float]]
+    ) -> pd.DataFrame:
+        """
+        Evaluate many scenario variants (e.g. thousands) in one NumPy pass
+        
+        Args:
+            base_revenue: Base year revenue (억 원)
+            variants: Equal-length arrays keyed by scenario field
+                (revenue_growth, ebitda_margin, da_ratio, capex_ratio,
+                nwc_ratio, wacc_premium); missing fields use the Base scenario
+        
+        Returns:
+            DataFrame with one row per variant: inputs + WACC, PV_FCF,
+            PV_Terminal, TV_Gordon and Enterprise_Value
+        """
+        unknown = set(variants) - set(SCENARIO_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown scenario fields: {sorted(unknown)}")
+        
+        assumptions = self._build_assumptions()
+        peers = self._build_peers()
+        
+        base_name, base_params = next(iter(self.config['scenarios'].items()))
+        base = stack_scenarios([self._build_scenario(base_name, base_params)])
+        
+        params = {
+            name: np.asarray(variants[name], dtype=float) if name in variants else base[name]
+            for name in SCENARIO_FIELDS
+        }
+        params = dict(zip(params, np.broadcast_arrays(*params.values())))
+        
+        base_wacc = self.wacc_calculator.calculate(assumptions, peers).wacc
+        
+        result = self.dcf_batch.run(
+            base_revenue,
+            revenue_growth=params['revenue_growth'],
+            ebitda_margin=params['ebitda_margin'],
+            da_ratio=params['da_ratio'],
+            capex_ratio=params['capex_ratio'],
+            nwc_ratio=params['nwc_ratio'],
+            wacc=base_wacc + params['wacc_premium'],
+            terminal_growth_rate=assumptions.terminal_growth_rate,
+            tax_rate=assumptions.tax_rate,
+            projection_years=assumptions.projection_years
+        )
+        
+        return pd.DataFrame({
+            **params,
+            'WACC': result['wacc'],
+            'PV_FCF': result['sum_pv_fcf'],
+            'PV_Terminal': result['pv_terminal'],
+            'TV_Gordon': result['tv_gordon'],
+            'Enterprise_Value': result['enterprise_value']
+        })
+    
+    def run_monte_carlo(
+        self,
+        base_revenue: float,
+        reference_price: Optional[float] = None,
+        n_draws: Optional[int] = None
+    ) -> MonteCarloOutput:
+        """
+        Stochastic DCF: EV distribution from config.json "monte_carlo"
+        
+        Args:
+            base_revenue: Base year revenue (억 원)
+            reference_price: EV threshold for P(EV > price) (optional)
+            n_draws: Override configured draw count
+        
+        Returns:
+            MonteCarloOutput (percentiles, histogram, P(EV > price))
+        """
+        assumptions = self._build_assumptions()
+        peers = self._build_peers()
+        
+        base_wacc = self.wacc_calculator.calculate(assumptions, peers).wacc
+        
+        return self._simulate_ev_distribution(
+            base_revenue, base_wacc, assumptions, reference_price, n_draws
         )
+    
+    def _simulate_ev_distribution(
+        self,
+        base_revenue: float,
+        base_wacc: float,
+        assumptions: Assumptions,
+        reference_price: Optional[float] = None,
+        n_draws: Optional[int] = None
+    ) -> MonteCarloOutput:
+        """
+        Run the chunked Monte Carlo DCF around the Base scenario
         
-        # PV of Terminal Value
-        pv_terminal = tv_output.tv_gordon * discount_factors[-1]
+        Args:
+            base_revenue: Base year revenue (억 원)
+            base_wacc: WACC before scenario premium
+            assumptions: Core assumptions
+            reference_price: EV threshold for P(EV > price)
+            n_draws: Override configured draw count
         
-        # ============================================================
-        # STEP 5: ENTERPRISE VALUE
-        # ============================================================
-        enterprise_value = sum_pv_fcf + pv_terminal
+        Returns:
+            MonteCarloOutput
+        """
+        mc_config = self.config.get('monte_carlo', {})
+        
+        base_name, base_params = next(iter(self.config['scenarios'].items()))
+        base = stack_scenarios([self._build_scenario(base_name, base_params)])
+        base = {name: float(value[0]) for name, value in base.items()}
+        base['terminal_growth_rate'] = assumptions.terminal_growth_rate
+        
+        simulator = MonteCarloDCFCalculator(
+            batch_calculator=self.dcf_batch,
+            n_draws=n_draws or mc_config.get('n_draws', 100_000),
+            chunk_size=mc_config.get('chunk_size', 25_000),
+            histogram_bins=mc_config.get('histogram_bins', 50),
+            seed=mc_config.get('seed')
+        )
         
-        logging.info(f"      EV: {enterprise_value:.1f}억 원")
+        output = simulator.run(
+            base_revenue,
+            base_params=base,
+            base_wacc=base_wacc,
+            distributions=mc_config.get('distributions', {}),
+            tax_rate=assumptions.tax_rate,
+            projection_years=assumptions.projection_years,
+            reference_price=reference_price
+        )
         
-        # ============================================================
-        # BUILD OUTPUT
-        # ============================================================
-        return DCFOutput(
-            scenario_name=scenario.name,
-            enterprise_value=enterprise_value,
-            pv_fcf=sum_pv_fcf,
-            pv_terminal=pv_terminal,
-            wacc_output=wacc_output,
-            terminal_value_output=tv_output,
-            fcf_projection=fcf_series,
-            revenue_projection=fcf_df['Revenue'].tolist(),
-            ebitda_projection=fcf_df['EBITDA'].tolist()
+        logging.info(
+            f"   🎲 Monte Carlo: {output.n_draws:,} draws | "
+            f"P50 EV: {output.percentiles[50]:.1f}억 원 | "
+            f"P5~P95: {output.percentiles[5]:.1f}~{output.percentiles[95]:.1f}억 원"
         )
+        
+        return output
     
     def run_valuation(
         self,
         project_name: str,
         base_revenue: float = 100.0,
-        data_source: str = "User Input"
+        data_source: str = "User Input",
+        monte_carlo: bool = False,
+        reference_price: Optional[float] = None,
+        beta_surface: bool = False
     ) -> Tuple[str, str]:
         """
         Execute full multi-scenario DCF valuation
@@ -252,6 +409,10 @@ class WoodOrchestratorV2:
             project_name: Company/project name
             base_revenue: Base year revenue (억 원)
             data_source: Data attribution (e.g., "DART 2024.3Q")
+            monte_carlo: Also run the stochastic EV distribution
+            reference_price: EV threshold for P(EV > price)
+                (default: Base case EV)
+            beta_surface: Also export rolling daily/weekly/monthly peer betas
         
         Returns:
             (filepath, summary_text): Excel file path and summary
@@ -270,25 +431,34 @@ class WoodOrchestratorV2:
         # ============================================================
         # RUN SCENARIOS
         # ============================================================
-        dcf_results: List[DCFOutput] = []
-        
-        for scenario_name, scenario_params in scenarios_config.items():
-            scenario = self._build_scenario(scenario_name, scenario_params)
-            
-            result = self._calculate_dcf_scenario(
-                scenario,
-                base_revenue,
-                assumptions,
-                peers
-            )
-            
-            dcf_results.append(result)
+        scenarios = [
+            self._build_scenario(scenario_name, scenario_params)
+            for scenario_name, scenario_params in scenarios_config.items()
+        ]
+        
+        dcf_results: List[DCFOutput] = self._calculate_dcf_scenarios(
+            scenarios,
+            base_revenue,
+            assumptions,
+            peers
+        )
         
         # ============================================================
         # VALUATION SUMMARY
         # ============================================================
         evs = [r.enterprise_value for r in dcf_results]
         
+        mc_output = None
+        if monte_carlo:
+            mc_output = self._simulate_ev_distribution(
+                base_revenue,
+                base_wacc=dcf_results[0].wacc_output.wacc - scenarios[0].wacc_premium,
+                assumptions=assumptions,
+                reference_price=reference_price if reference_price is not None else dcf_results[0].enterprise_value
+            )
+        
+        surface_records = self.wacc_calculator.peer_beta_surface(peers) if beta_surface else None
+        
         valuation_summary = ValuationSummary(
             project_name=project_name,
             data_source=data_source,
@@ -297,7 +467,9 @@ class WoodOrchestratorV2:
             ev_min=min(evs),
             ev_max=max(evs),
             ev_base=dcf_results[0].enterprise_value,  # Base scenario
-            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            created_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            monte_carlo=mc_output,
+            beta_surface=surface_records or None
         )
         
         # ============================================================
@@ -326,6 +498,13 @@ class WoodOrchestratorV2:
             wacc = scenario.wacc_output.wacc
             text += f"**[{scenario.scenario_name}]** EV: **{scenario.enterprise_value:.1f}억** (WACC {wacc*100:.2f}%)\n"
         
+        mc = summary.monte_carlo
+        if mc is not None:
+            text += f"\n🎲 **Monte Carlo ({mc.n_draws:,} draws)**\n"
+            text += f"P5 / P50 / P95: {mc.percentiles[5]:.0f} / {mc.percentiles[50]:.0f} / {mc.percentiles[95]:.0f}억\n"
+            if mc.prob_above_price is not None:
+                text += f"P(EV > {mc.reference_price:.0f}억): **{mc.prob_above_price*100:.1f}%**\n"
+        
         text += "\n⚡ *WOOD V2 Engine with live market beta integration*"
         
         return text
@@ -349,6 +528,7 @@ class WoodOrchestratorV2:
         7. Sensitivity
         8. Peer Group
         9. Data Source
+        (+ Monte_Carlo / MC_Distribution when the stochastic mode ran)
         
         Args:
             summary: Valuation summary
@@ -0,0 +1,208 @@
+"""
+Test Batch DCF Calculator (WOOD V2)
+
+Usage:
+    python -m src.engines.wood.test_dcf_batch
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
+
+import numpy as np
+
+from src.engines.wood.models import Assumptions, ScenarioParameters
+from src.engines.wood.calculators.fcf import FCFCalculator
+from src.engines.wood.calculators.terminal_value import TerminalValueCalculator
+from src.engines.wood.calculators.dcf_batch import BatchDCFCalculator, stack_scenarios
+from src.engines.wood.calculators.monte_carlo import MonteCarloDCFCalculator
+from src.engines.wood.calculators.sensitivity import SensitivitySurface
+
+
+def test_batch_matches_scalar():
+    """Batch kernel must reproduce the row-by-row FCF/TV calculators"""
+    print("=" * 70)
+    print("⚡ Testing Batch DCF vs Scalar Calculators")
+    print("=" * 70)
+    
+    assumptions = Assumptions(tax_rate=0.22, terminal_growth_rate=0.015)
+    
+    scenarios = [
+        ScenarioParameters("Base", 0.10, 0.18, 0.15, da_ratio=0.03, capex_ratio=0.03, nwc_ratio=0.05),
+        ScenarioParameters("Bull", 0.15, 0.23, 0.20, da_ratio=0.02, capex_ratio=0.04, nwc_ratio=0.04, wacc_premium=-0.01),
+        ScenarioParameters("Bear", -0.05, 0.02, 0.08, da_ratio=0.04, capex_ratio=0.02, nwc_ratio=0.06, wacc_premium=0.02)
+    ]
+    waccs = np.array([0.12, 0.11, 0.01])  # Bear: WACC < g triggers TV fallback
+    
+    params = stack_scenarios(scenarios)
+    batch = BatchDCFCalculator().run(
+        500.0,
+        revenue_growth=params['revenue_growth'],
+        ebitda_margin=params['ebitda_margin'],
+        da_ratio=params['da_ratio'],
+        capex_ratio=params['capex_ratio'],
+        nwc_ratio=params['nwc_ratio'],
+        wacc=waccs,
+        terminal_growth_rate=assumptions.terminal_growth_rate,
+        tax_rate=assumptions.tax_rate
+    )
+    
+    fcf_calc = FCFCalculator()
+    tv_calc = TerminalValueCalculator()
+    
+    for i, scenario in enumerate(scenarios):
+        df = fcf_calc.project(500.0, scenario, assumptions)
+        discount_factors = [1 / ((1 + waccs[i]) ** t) for t in range(1, len(df) + 1)]
+        pv_fcf = sum(f * d for f, d in zip(df['FCF'], discount_factors))
+        tv = tv_calc.calculate(df['FCF'].iloc[-1], df['EBITDA'].iloc[-1], waccs[i], assumptions.terminal_growth_rate)
+        ev = pv_fcf + tv.tv_gordon * discount_factors[-1]
+        
+        print(f"   {scenario.name}: scalar EV {ev:,.2f} | batch EV {batch['enterprise_value'][i]:,.2f}")
+        
+        assert np.allclose(df['FCF'].values, batch['fcf'][i])
+        assert abs(ev - batch['enterprise_value'][i]) <= 1e-9 * abs(ev)
+    
+    frame = BatchDCFCalculator().to_frame(batch, 0)
+    assert list(frame.columns[:12]) == list(fcf_calc.project(500.0, scenarios[0], assumptions).columns)
+    
+    print("   ✅ Batch kernel matches scalar calculators")
+    print("=" * 70)
+
+
+def test_thousands_of_variants():
+    """Range analysis over thousands of scenario variants"""
+    print("\n" + "=" * 70)
+    print("📊 Testing Scenario Variant Range Analysis")
+    print("=" * 70)
+    
+    rng = np.random.default_rng(0)
+    n = 10000
+    
+    start = time.perf_counter()
+    result = BatchDCFCalculator().run(
+        500.0,
+        revenue_growth=rng.uniform(0.0, 0.20, n),
+        ebitda_margin=rng.uniform(0.10, 0.25, n),
+        da_ratio=0.03,
+        capex_ratio=0.03,
+        nwc_ratio=0.05,
+        wacc=rng.uniform(0.10, 0.15, n),
+        terminal_growth_rate=0.015,
+        tax_rate=0.22
+    )
+    elapsed = time.perf_counter() - start
+    
+    ev = result['enterprise_value']
+    print(f"\n   Variants: {n:,} in {elapsed*1000:.1f} ms")
+    print(f"   EV P10/P50/P90: {np.percentile(ev, 10):,.0f} / {np.percentile(ev, 50):,.0f} / {np.percentile(ev, 90):,.0f}억")
+    
+    assert ev.shape == (n,)
+    assert result['fcf'].shape == (n, 5)
+    
+    print("=" * 70)
+
+
+def test_monte_carlo_distribution():
+    """Chunked Monte Carlo DCF: degenerate case + distribution output"""
+    print("\n" + "=" * 70)
+    print("🎲 Testing Monte Carlo EV Distribution")
+    print("=" * 70)
+    
+    base = {
+        'revenue_growth': 0.10, 'ebitda_margin': 0.18, 'da_ratio': 0.03,
+        'capex_ratio': 0.03, 'nwc_ratio': 0.05, 'wacc_premium': 0.0,
+        'terminal_growth_rate': 0.015
+    }
+    point_ev = BatchDCFCalculator().run(500.0, wacc=0.12, tax_rate=0.22, **{
+        k: v for k, v in base.items() if k != 'wacc_premium'
+    })['enterprise_value'][0]
+    
+    # Fixed distributions collapse to the point estimate
+    fixed = MonteCarloDCFCalculator(n_draws=1000, chunk_size=300, seed=1).run(
+        500.0, base, 0.12,
+        distributions={'revenue_growth': {'dist': 'fixed', 'value': 0.10}},
+        tax_rate=0.22
+    )
+    assert abs(fixed.percentiles[5] - point_ev) < 1e-9
+    assert abs(fixed.percentiles[95] - point_ev) < 1e-9
+    
+    distributions = {
+        'revenue_growth': {'dist': 'normal', 'mean': 0.10, 'std': 0.04},
+        'ebitda_margin': {'dist': 'triangular', 'low': 0.11, 'mode': 0.18, 'high': 0.23},
+        'wacc_premium': {'dist': 'normal', 'mean': 0.0, 'std': 0.01},
+        'terminal_growth_rate': {'dist': 'uniform', 'low': 0.005, 'high': 0.025, 'max': 0.02}
+    }
+    
+    start = time.perf_counter()
+    mc = MonteCarloDCFCalculator(n_draws=150_000, chunk_size=25_000, seed=42).run(
+        500.0, base, 0.12, distributions, tax_rate=0.22, reference_price=point_ev
+    )
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n   Draws: {mc.n_draws:,} in {elapsed*1000:.0f} ms")
+    print(f"   Point EV: {point_ev:,.1f} | P50: {mc.percentiles[50]:,.1f} | P(EV > point): {mc.prob_above_price*100:.1f}%")
+    
+    assert sum(mc.histogram_counts) == mc.n_draws
+    assert len(mc.histogram_edges) == len(mc.histogram_counts) + 1
+    assert mc.percentiles[5] < mc.percentiles[50] < mc.percentiles[95]
+    assert 0.0 < mc.prob_above_price < 1.0
+    
+    try:
+        MonteCarloDCFCalculator(n_draws=10).run(500.0, base, 0.12, {'beta': {'dist': 'fixed', 'value': 1}}, 0.22)
+        assert False, "unknown field accepted"
+    except ValueError:
+        pass
+    
+    print("   ✅ Monte Carlo distribution OK")
+    print("=" * 70)
+
+
+def test_sensitivity_surface():
+    """Closed-form WACC × g surface vs per-cell discount factor loop"""
+    print("\n" + "=" * 70)
+    print("🌡️ Testing Sensitivity Surface")
+    print("=" * 70)
+    
+    fcf = [40.0, 45.0, 50.0, 55.0, 61.0]
+    surface = SensitivitySurface(fcf, base_wacc=0.12, base_growth=0.015)
+    
+    waccs, growths = surface.axes(7, 5, wacc_range=0.12, growth_range=0.005)
+    ev = surface.evaluate(waccs, growths)
+    
+    for gi, g in enumerate(growths):
+        for wi, w in enumerate(waccs):
+            discount_factors = [1 / ((1 + w) ** (t + 1)) for t in range(len(fcf))]
+            tv = fcf[-1] * (1 + g) / (w - g) if w > g else fcf[-1] * 20
+            expected = sum(f * d for f, d in zip(fcf, discount_factors)) + tv * discount_factors[-1]
+            assert abs(ev[gi, wi] - expected) <= 1e-9 * abs(expected)
+    
+    start = time.perf_counter()
+    grid = surface.grid(100, 100)
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n   100 × 100 grid in {elapsed*1000:.2f} ms")
+    print(surface.table().to_string(index=False))
+    
+    assert grid.shape == (100, 100)
+    assert surface.table().shape == (5, 6)
+    
+    print("   ✅ Surface matches scalar loop")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_batch_matches_scalar()
+        test_thousands_of_variants()
+        test_monte_carlo_distribution()
+        test_sensitivity_surface()
+        
+        print("\n✅ ALL BATCH DCF TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
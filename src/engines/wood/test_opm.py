@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../../..')))
 
 from src.engines.wood.opm_engine import OPMCalculator, HybridSecurity, IPOScenario, TFEngine
+from src.engines.wood.opm_lsm import LSMEngine
 
 
 def test_basic_opm():
@@ -177,6 +178,348 @@ def test_ipo_sensitivity():
     print("=" * 70)
 
 
+def test_vectorized_matches_loop():
+    """Verify NumPy lattice against the node-by-node reference engine"""
+    print("\n" + "=" * 70)
+    print("⚡ Testing Vectorized Lattice vs Loop Reference")
+    print("=" * 70)
+    
+    val_date = datetime(2026, 1, 1)
+    
+    security = HybridSecurity(
+        security_id="VEC_TEST",
+        security_type="RCPS",
+        valuation_date=val_date,
+        maturity_date=val_date + timedelta(days=365 * 3),
+        current_stock_price=20000,
+        volatility=0.35,
+        risk_free_rate=0.035,
+        credit_spread=0.020,
+        conversion_price=25000,
+        face_value=50000,
+        redemption_premium=0.05,
+        refix_floor=17500,
+        total_amount=500000000,
+        num_shares=10000,
+        ipo_scenario=IPOScenario(
+            check_date=val_date + timedelta(days=180),
+            threshold_price=28000,
+            failure_refix_ratio=0.70
+        )
+    )
+    
+    loop_result = TFEngine(method='loop').price_hybrid_security(security)
+    vec_result = TFEngine(method='vectorized').price_hybrid_security(security)
+    
+    for key in ('total_value', 'debt_component', 'equity_component'):
+        assert abs(loop_result[key] - vec_result[key]) <= 1e-9 * abs(loop_result[key])
+    
+    print(f"\n   Loop:       {loop_result['total_value']:,.2f}")
+    print(f"   Vectorized: {vec_result['total_value']:,.2f}")
+    
+    # Daily-step lattice on a long maturity
+    import time
+    start = time.perf_counter()
+    daily_result = TFEngine(max_steps=3000).price_hybrid_security(security)
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n   Daily lattice ({daily_result['lattice_steps']} steps): {elapsed:.3f}s")
+    print("   ✅ Vectorized engine matches loop reference")
+    print("=" * 70)
+
+
+def test_rolling_lattice_audit_slices():
+    """Verify rolling lattice keeps O(N) state and samples audit slices"""
+    print("\n" + "=" * 70)
+    print("🧾 Testing Rolling Lattice + Audit Slices")
+    print("=" * 70)
+    
+    import tracemalloc
+    
+    val_date = datetime(2026, 1, 1)
+    
+    security = HybridSecurity(
+        security_id="ROLL_TEST",
+        security_type="CB",
+        valuation_date=val_date,
+        maturity_date=val_date + timedelta(days=5000),
+        current_stock_price=20000,
+        volatility=0.35,
+        risk_free_rate=0.035,
+        credit_spread=0.020,
+        conversion_price=25000,
+        face_value=50000,
+        redemption_premium=0.05,
+        refix_floor=17500,
+        total_amount=500000000,
+        num_shares=10000
+    )
+    
+    engine = TFEngine(max_steps=5000)
+    
+    tracemalloc.start()
+    result = engine.price_hybrid_security(security, audit_slices=5)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    
+    audit_steps = [s['t'] for s in result['lattice_audit']]
+    
+    print(f"\n   Steps: {result['lattice_steps']}, Peak memory: {peak / 1e6:.1f} MB")
+    print(f"   Audit slices: {audit_steps}")
+    
+    assert peak < 50e6
+    assert audit_steps == [0, 1250, 2500, 3750, 5000]
+    assert len(result['lattice_audit'][-1]['S']) == 5001
+    
+    print("   ✅ Dense (N+1)x(N+1) lattice avoided")
+    print("=" * 70)
+
+
+def test_parallel_portfolio():
+    """Verify process-pool portfolio pricing matches the serial path"""
+    print("\n" + "=" * 70)
+    print("🧮 Testing Parallel Portfolio Pricing")
+    print("=" * 70)
+    
+    val_date = datetime(2026, 1, 1)
+    
+    securities = [
+        HybridSecurity(
+            security_id=f"TRANCHE_{k}",
+            security_type="RCPS" if k % 2 == 0 else "CB",
+            valuation_date=val_date,
+            maturity_date=val_date + timedelta(days=730 + 180 * k),
+            current_stock_price=20000,
+            volatility=0.30 + 0.02 * k,
+            risk_free_rate=0.035,
+            credit_spread=0.020,
+            conversion_price=25000,
+            face_value=50000,
+            redemption_premium=0.05,
+            refix_floor=17500,
+            total_amount=500000000,
+            num_shares=10000
+        )
+        for k in range(4)
+    ]
+    
+    engine = TFEngine()
+    serial = engine.price_portfolio(securities)
+    parallel = engine.price_portfolio(securities, max_workers=2)
+    
+    assert serial['total_value'] == parallel['total_value']
+    assert [r['security_id'] for r in parallel['securities']] == [s.security_id for s in securities]
+    
+    print(f"\n   Serial:   {serial['total_value']:,.0f}")
+    print(f"   Parallel: {parallel['total_value']:,.0f}")
+    print("   ✅ Parallel results match serial path (same order)")
+    print("=" * 70)
+
+
+def test_sensitivity_grid():
+    """Verify batched vol/spread grid against single-point pricing"""
+    print("\n" + "=" * 70)
+    print("🗺️ Testing Batched Sensitivity Grid")
+    print("=" * 70)
+    
+    calculator = OPMCalculator()
+    
+    base_params = {
+        'company_name': "GridTest",
+        'stock_price': 20000,
+        'conversion_price': 25000,
+        'face_value': 50000,
+        'num_shares': 10000,
+        'years_to_maturity': 3.0,
+        'volatility': 0.35,
+        'ipo_scenario': {
+            'check_date': datetime.now() + timedelta(days=180),
+            'threshold': 28000,
+            'ratio': 0.70
+        }
+    }
+    
+    volatilities = [0.25, 0.35, 0.45]
+    credit_spreads = [0.01, 0.02, 0.03]
+    
+    grid = calculator.rcps_sensitivity_grid(
+        **base_params,
+        volatilities=volatilities,
+        credit_spreads=credit_spreads
+    )
+    
+    heatmap = grid['total_value'].droplevel(['stock_price', 'ipo_threshold']).unstack('credit_spread')
+    print("\n" + heatmap.to_string(float_format=lambda x: f"{x:,.0f}"))
+    
+    # Base point (σ=35%, CS=2%) must match the single-lattice result
+    single = calculator.quick_rcps_valuation(**base_params)
+    assert abs(heatmap.loc[0.35, 0.02] - single['total_value']) <= 1e-6 * single['total_value']
+    assert heatmap.shape == (3, 3)
+    
+    print("\n   ✅ Grid matches single-point valuation")
+    print("=" * 70)
+
+
+def test_staged_ipo_refix():
+    """Verify compiled refix schedule with staged IPO deadlines"""
+    print("\n" + "=" * 70)
+    print("📅 Testing Staged IPO Refix Schedule")
+    print("=" * 70)
+    
+    val_date = datetime(2026, 1, 1)
+    
+    security = HybridSecurity(
+        security_id="STAGED_TEST",
+        security_type="RCPS",
+        valuation_date=val_date,
+        maturity_date=val_date + timedelta(days=365 * 3),
+        current_stock_price=20000,
+        volatility=0.35,
+        risk_free_rate=0.035,
+        credit_spread=0.020,
+        conversion_price=25000,
+        face_value=50000,
+        redemption_premium=0.05,
+        refix_floor=15000,
+        total_amount=500000000,
+        num_shares=10000,
+        ipo_scenario=IPOScenario(
+            check_date=val_date + timedelta(days=365),
+            threshold_price=28000,
+            failure_refix_ratio=0.80
+        ),
+        staged_ipo_scenarios=[
+            IPOScenario(
+                check_date=val_date + timedelta(days=730),
+                threshold_price=24000,
+                failure_refix_ratio=0.70
+            )
+        ]
+    )
+    
+    engine = TFEngine()
+    schedule = engine._compile_refix_schedule(security, 300, 365 * 3)
+    
+    loop_result = TFEngine(method='loop').price_hybrid_security(security)
+    vec_result = engine.price_hybrid_security(security)
+    
+    print(f"\n   Event start steps: {schedule.start_steps.tolist()}")
+    print(f"   Refixed CPs: {schedule.refixed_cp.tolist()}")
+    print(f"   Loop:       {loop_result['total_value']:,.2f}")
+    print(f"   Vectorized: {vec_result['total_value']:,.2f}")
+    
+    assert schedule.start_steps.tolist() == [100, 200]
+    assert abs(loop_result['total_value'] - vec_result['total_value']) <= 1e-9 * loop_result['total_value']
+    
+    print("   ✅ Staged refix schedule matches node-by-node reference")
+    print("=" * 70)
+
+
+def test_lsm_trailing_average_refix():
+    """Test LSM Monte Carlo against the lattice and with trailing-average refixing"""
+    print("\n" + "=" * 70)
+    print("🎲 Testing LSM Monte Carlo Engine")
+    print("=" * 70)
+    
+    val_date = datetime(2026, 1, 1)
+    
+    def make_security(ipo_scenario=None):
+        return HybridSecurity(
+            security_id="LSM_TEST",
+            security_type="RCPS",
+            valuation_date=val_date,
+            maturity_date=val_date + timedelta(days=365 * 3),
+            current_stock_price=20000,
+            volatility=0.35,
+            risk_free_rate=0.035,
+            credit_spread=0.020,
+            conversion_price=25000,
+            face_value=50000,
+            redemption_premium=0.05,
+            refix_floor=17500,
+            total_amount=500000000,
+            num_shares=10000,
+            ipo_scenario=ipo_scenario
+        )
+    
+    # Without refixing the MC value should sit close to the daily lattice
+    lattice = TFEngine(max_steps=1095).price_hybrid_security(make_security())
+    mc = LSMEngine(seed=42).price_hybrid_security(make_security())
+    
+    gap = abs(mc['per_share_value'] - lattice['per_share_value']) / lattice['per_share_value']
+    print(f"\n   Lattice: {lattice['per_share_value']:,.2f}  LSM: {mc['per_share_value']:,.2f} (gap {gap:.2%})")
+    assert gap < 0.02
+    
+    # 20-day trailing average test at the IPO deadline (lattice can't price this)
+    averaged = IPOScenario(
+        check_date=val_date + timedelta(days=180),
+        threshold_price=28000,
+        failure_refix_ratio=0.70,
+        averaging_days=20
+    )
+    
+    result1 = LSMEngine(seed=7).price_hybrid_security(make_security(averaged))
+    result2 = LSMEngine(seed=7).price_hybrid_security(make_security(averaged))
+    
+    print(f"   Trailing-average RCPS: {result1['total_value']:,.0f} (± {result1['standard_error'] * 10000:,.0f})")
+    print(f"   Average CP at maturity: {result1['conversion_price_final']:,.0f}")
+    
+    assert result1['total_value'] == result2['total_value']  # Seeded RNG is reproducible
+    assert 17500 <= result1['conversion_price_final'] < 25000
+    
+    try:
+        TFEngine().price_hybrid_security(make_security(averaged))
+        raise AssertionError("Lattice should reject trailing-average refixing")
+    except ValueError:
+        print("   ✅ Lattice rejects path-dependent refixing (use LSMEngine)")
+    
+    print("=" * 70)
+
+
+def test_lsm_matches_lattice_spot_refix():
+    """Test both engines price the same spot IPO refix (averaging_days=0) consistently"""
+    print("\n" + "=" * 70)
+    print("🎲 Testing LSM vs Lattice (Spot IPO Refix)")
+    print("=" * 70)
+    
+    val_date = datetime(2026, 1, 1)
+    security = HybridSecurity(
+        security_id="LSM_SPOT_REFIX",
+        security_type="RCPS",
+        valuation_date=val_date,
+        maturity_date=val_date + timedelta(days=365 * 3),
+        current_stock_price=20000,
+        volatility=0.35,
+        risk_free_rate=0.035,
+        credit_spread=0.020,
+        conversion_price=25000,
+        face_value=50000,
+        redemption_premium=0.05,
+        refix_floor=17500,
+        total_amount=500000000,
+        num_shares=10000,
+        ipo_scenario=IPOScenario(
+            check_date=val_date + timedelta(days=180),
+            threshold_price=28000,
+            failure_refix_ratio=0.70
+        )
+    )
+    
+    lattice = TFEngine(max_steps=1095).price_hybrid_security(security)
+    mc = LSMEngine(seed=42, exercise_per_year=52).price_hybrid_security(security)
+    
+    gap = (mc['per_share_value'] - lattice['per_share_value']) / lattice['per_share_value']
+    se = mc['standard_error'] / lattice['per_share_value']
+    print(f"\n   Lattice: {lattice['per_share_value']:,.2f}  LSM: {mc['per_share_value']:,.2f} (gap {gap:+.2%}, s.e. {se:.2%})")
+    
+    # Weekly Bermudan exercise + regression rule → LSM is biased low vs daily American lattice
+    assert gap < 3 * se
+    assert gap > -0.01
+    
+    print("   ✅ Same refix semantics in both engines")
+    print("=" * 70)
+
+
 if __name__ == "__main__":
     try:
         print("\n")
@@ -188,6 +531,13 @@ if __name__ == "__main__":
         test_basic_opm()
         test_tf_split_verification()
         test_ipo_sensitivity()
+        test_vectorized_matches_loop()
+        test_rolling_lattice_audit_slices()
+        test_parallel_portfolio()
+        test_sensitivity_grid()
+        test_staged_ipo_refix()
+        test_lsm_trailing_average_refix()
+        test_lsm_matches_lattice_spot_refix()
         
         print("\n")
         print("═" * 70)
@@ -2,6 +2,7 @@ import sys
 import os
 import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pytz import timezone
 
@@ -34,6 +35,8 @@ from src.agents.xray_val import XrayValuation
 from src.agents.bravo_matchmaker import BravoMatchmaker
 from src.agents.alpha_chief import AlphaChief
 from src.utils.llm_handler import LLMHandler
+from src.utils.stage_graph import Stage, StageGraph, StageFailed
+from src.utils.job_queue import JobQueue
 from src.agents.structuring_agent import StructuringAgent
 
 # [Engines]
@@ -114,8 +117,6 @@ async def _safe_send_teaser(update: Update, teaser_text: str, filename_prefix: s
 class DealSession:
     def __init__(self, chat_id):
         self.chat_id = chat_id
-        self.is_running = False
-        self.stop_flag = False
         self.mode = None # 'PIPELINE', 'DCF', 'STRUCT'
         self.data = {
             "target": None,
@@ -124,8 +125,12 @@ class DealSession:
             "dcf_result": None
         }
 
+    @property
+    def is_running(self):
+        # 실행 상태는 작업 대기열이 관리 (채팅별 실행 중 작업 수)
+        return JOB_QUEUE.active(self.chat_id) > 0
+
     def reset(self):
-        self.stop_flag = False
         self.mode = None
         self.data = {k: None for k in self.data}
 
@@ -138,6 +143,23 @@ def get_session(chat_id):
 
 scheduler = AsyncIOScheduler(timezone=timezone('Asia/Seoul'))
 
+# 작업 대기열: 전체 동시 작업 수 / 채팅별 동시 작업 수
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "4"))
+JOB_PER_USER = int(os.getenv("JOB_PER_USER", "1"))
+JOB_QUEUE = JobQueue(workers=JOB_WORKERS, per_user_limit=JOB_PER_USER)
+
+# /run 파이프라인 전용 스레드 풀 (작업당 최대 4단계 동시 실행)
+PIPELINE_POOL = ThreadPoolExecutor(max_workers=4 * JOB_WORKERS, thread_name_prefix="pipeline")
+
+# 단계별 타임아웃 (초)
+STAGE_TIMEOUTS = {
+    "dart": 60,
+    "market": 60,
+    "xray": 180,
+    "bravo": 240,
+    "alpha": 180,
+}
+
 # ==============================================================================
 # 💬 Chat Logic (Interactive Agent)
 # ==============================================================================
@@ -177,7 +199,7 @@ async def agent_chat_response(agent_name, user_input, session):
     Task: Answer professionally in Korean. Be concise.
     """
     return await asyncio.get_running_loop().run_in_executor(
-        None, lambda: brain.call_llm(system_prompt, user_input, mode="smart")
+        None, lambda: brain.call_llm(system_prompt, user_input, mode="smart", use_cache=False)  # 대화형 응답은 캐시 제외
     )
 
 # ==============================================================================
@@ -196,38 +218,68 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
 `/struct_legacy` : 기존 OPM(단발성) 커맨드
 
 **3. ⚙️ Controls**
-`잠깐`, `중단` : 프로세스 강제 종료
+`잠깐`, `중단` : 실행/대기 중인 작업 강제 종료
+`/queue` : 작업 대기열 현황
 `@X-RAY [질문]` : 에이전트와 대화
 `@ALPHA [질문]` : ALPHA에게 후속 질문
 `/id` : 현재 채팅방 ID 확인
     """
     await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN)
 
-async def run_pipeline(update: Update, context: ContextTypes.DEFAULT_TYPE):
+async def _enqueue(update: Update, kind: str, func):
+    """작업 대기열 등록 → 바로 시작하지 못하면 대기 순번 안내"""
+    chat_id = update.effective_chat.id
+    busy = JOB_QUEUE.stats()["running"] >= JOB_QUEUE.workers or JOB_QUEUE.active(chat_id) >= JOB_QUEUE.per_user_limit
+    job = JOB_QUEUE.submit(chat_id, kind, func)
+    if busy:
+        await update.message.reply_text(
+            f"⏳ 작업 #{job.id} (/{kind}) 대기열 {JOB_QUEUE.position(job)}번째. `중단` 으로 취소 가능."
+        )
+    return job
+
+async def queue_status(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """/queue: 대기열 깊이 / 대기시간 지표 + 내 작업 목록"""
     chat_id = update.effective_chat.id
+    stats = JOB_QUEUE.stats()
+    by_kind = ", ".join(f"/{k} {n}" for k, n in stats["by_kind"].items()) or "-"
+    
+    lines = [
+        "📊 **Job Queue**",
+        f"• 실행 중: {stats['running']}/{stats['workers']} | 대기: {stats['depth']} ({by_kind})",
+        f"• 대기시간: 평균 {stats['wait_avg']:.1f}s | p95 {stats['wait_p95']:.1f}s | 최대 {stats['wait_max']:.1f}s",
+        f"• 최장 대기 중: {stats['oldest_wait']:.1f}s",
+        f"• 완료 {stats['done']} | 실패 {stats['failed']} | 취소 {stats['cancelled']}",
+    ]
+    mine = JOB_QUEUE.jobs(chat_id)
+    if mine:
+        lines.append("\n**내 작업**")
+        for job in mine:
+            state = "▶️ 실행 중" if job.status == "running" else f"⏳ {JOB_QUEUE.position(job)}번째"
+            lines.append(f"#{job.id} /{job.kind} {state} ({job.wait_seconds:.0f}s 대기)")
+    await update.message.reply_text("\n".join(lines), parse_mode='Markdown')
+
+async def run_pipeline(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = " ".join(context.args)
     
     if not query:
         await update.message.reply_text("⚠️ 사용법: `/run [기업명]`")
         return
 
-    session = get_session(chat_id)
-    if session.is_running:
-        await update.message.reply_text("⚠️ 이미 작업 중입니다. `중단` 후 다시 시도하세요.")
-        return
+    await _enqueue(update, "run", lambda job: _pipeline_job(update, query, job))
 
+async def _pipeline_job(update: Update, query: str, job):
+    session = get_session(update.effective_chat.id)
     session.reset()
-    session.is_running = True
     session.mode = 'PIPELINE'
     
     try:
         # 1. ZULU
-        if session.stop_flag: raise InterruptedError()
+        if job.is_cancelled(): raise InterruptedError()
         await update.message.reply_text(f"🕵️ **ZULU**: '{query}' 타겟팅 시작...")
         
         zulu = ZuluScout()
         loop = asyncio.get_running_loop()
-        leads = await loop.run_in_executor(None, zulu.search_leads, query)
+        leads = await loop.run_in_executor(PIPELINE_POOL, zulu.search_leads, query)
 
         if not leads:
             await update.message.reply_text("💤 **ZULU**: 타겟 발굴 실패.")
@@ -237,44 +289,56 @@ async def run_pipeline(update: Update, context: ContextTypes.DEFAULT_TYPE):
         if "N/A" in target['company_name']: target['company_name'] = query
         session.data['target'] = target
         
-        await update.message.reply_text(f"✅ **ZULU**: {target['company_name']} ({target.get('sector')})\n👉 X-RAY 이관")
+        await update.message.reply_text(f"✅ **ZULU**: {target['company_name']} ({target.get('sector')})\n👉 X-RAY / BRAVO 병렬 착수")
 
-        # 2. X-RAY
-        if session.stop_flag: raise InterruptedError()
-        await update.message.reply_text("⚡ **X-RAY**: 재무 분석 및 Quick Valuation...")
-        
+        # 2. X-RAY ∥ BRAVO → ALPHA (의존성 그래프)
+        #    dart, market: X-RAY 데이터 선조회 (캐시 워밍, 실패해도 X-RAY 가 직접 재조회)
+        #    bravo: ZULU 리드만 필요 → X-RAY 와 동시 실행
         xray = XrayValuation()
-        val_result = await loop.run_in_executor(None, xray.run_valuation, target)
-        session.data['valuation'] = val_result
-        
-        val = val_result['valuation']
-        await update.message.reply_text(f"⚡ **X-RAY**: {val['target_value']}억 (Method: {val['method']})\n👉 BRAVO 이관")
-
-        # 3. BRAVO
-        if session.stop_flag: raise InterruptedError()
-        await update.message.reply_text("🤝 **BRAVO**: 인수 후보자 스크리닝...")
-        
         bravo = BravoMatchmaker()
-        industry = val_result['financials'].get('sector') or target.get('sector', 'General')
-        buyers = await loop.run_in_executor(None, bravo.find_potential_buyers, target, industry)
-        session.data['buyers'] = buyers
+        alpha = AlphaChief()
+        company = target['company_name']
+        industry = target.get('sector') or 'General'  # X-RAY 가 target['sector'] 를 갱신하므로 미리 고정
+        lead = dict(target)
         
-        b_list = ", ".join([b['buyer_name'] for b in buyers]) if buyers else "없음"
-        await update.message.reply_text(f"🤝 **BRAVO**: {b_list}\n👉 ALPHA 리포트 작성")
+        graph = StageGraph([
+            Stage("dart", lambda r: xray.dart.get_financial_summary(company), timeout=STAGE_TIMEOUTS["dart"], required=False),
+            Stage("market", lambda r: xray.prefetch([target]), timeout=STAGE_TIMEOUTS["market"], required=False),
+            Stage("bravo", lambda r: bravo.find_potential_buyers(lead, industry), timeout=STAGE_TIMEOUTS["bravo"], required=False),
+            Stage("xray", lambda r: xray.run_valuation(target), deps=("dart", "market"), timeout=STAGE_TIMEOUTS["xray"]),
+            Stage("alpha", lambda r: alpha.generate_teaser(target, r["xray"], r["bravo"] or []), deps=("xray", "bravo"), timeout=STAGE_TIMEOUTS["alpha"]),
+        ])
+
+        async def on_stage(result):
+            """단계 완료 순서대로 채팅에 중간 결과 전송"""
+            if result.name == "xray" and result.ok:
+                session.data['valuation'] = result.value
+                val = result.value['valuation']
+                await update.message.reply_text(f"⚡ **X-RAY**: {val['target_value']}억 (Method: {val['method']}) [{result.elapsed:.0f}s]")
+            elif result.name == "bravo":
+                buyers = result.value or []
+                session.data['buyers'] = buyers
+                b_list = ", ".join([b['buyer_name'] for b in buyers]) if buyers else "없음"
+                note = "" if result.ok else " (스크리닝 실패/시간 초과)"
+                await update.message.reply_text(f"🤝 **BRAVO**: {b_list}{note} [{result.elapsed:.0f}s]")
+            elif result.name == "alpha" and result.ok:
+                await _safe_send_teaser(update, result.value, filename_prefix=target.get("company_name", "Teaser"))
 
-        # 4. ALPHA
-        if session.stop_flag: raise InterruptedError()
-        alpha = AlphaChief()
-        teaser = await loop.run_in_executor(None, alpha.generate_teaser, target, val_result, buyers)
-        await _safe_send_teaser(update, teaser, filename_prefix=target.get("company_name", "Teaser"))
+        try:
+            await graph.run(PIPELINE_POOL, on_result=on_stage, should_stop=job.is_cancelled)
+        except StageFailed as e:
+            label = {"xray": "X-RAY", "alpha": "ALPHA"}.get(e.result.name, e.result.name)
+            if isinstance(e.result.error, asyncio.TimeoutError):
+                await update.message.reply_text(f"⏱️ **{label}**: 시간 초과 ({STAGE_TIMEOUTS[e.result.name]}s)")
+            else:
+                await update.message.reply_text(f"❌ **{label}** Error: {e.result.error}")
+            print(f"Pipeline Error: {e}")
 
     except InterruptedError:
         await update.message.reply_text("🛑 프로세스 중단됨.")
     except Exception as e:
         await update.message.reply_text(f"❌ Error: {str(e)}")
         print(f"Pipeline Error: {e}")
-    finally:
-        session.is_running = False
 
 async def run_dcf(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
@@ -287,9 +351,6 @@ async def run_dcf(update: Update, context: ContextTypes.DEFAULT_TYPE):
     2. 데이터 출처를 사용자에게 고지
     3. Big 4 스타일 엑셀 생성 및 전송
     """
-    from src.tools.smart_ingestor import SmartFinancialIngestor
-    
-    chat_id = update.effective_chat.id
     args = context.args
     if not args:
         await update.message.reply_text(
@@ -303,9 +364,13 @@ async def run_dcf(update: Update, context: ContextTypes.DEFAULT_TYPE):
     company_name = args[0]
     manual_revenue = float(args[1]) if len(args) > 1 else None
 
-    session = get_session(chat_id)
+    await _enqueue(update, "dcf", lambda job: _dcf_job(update, company_name, manual_revenue, job))
+
+async def _dcf_job(update: Update, company_name: str, manual_revenue, job):
+    from src.tools.smart_ingestor import SmartFinancialIngestor
+
+    session = get_session(update.effective_chat.id)
     session.reset()
-    session.is_running = True
     session.mode = 'DCF'
 
     try:
@@ -415,8 +480,6 @@ async def run_dcf(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text(f"❌ WOOD Error: {e}")
         import traceback
         traceback.print_exc()
-    finally:
-        session.is_running = False
 
 async def run_struct(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """
@@ -424,8 +487,6 @@ async def run_struct(update: Update, context: ContextTypes.DEFAULT_TYPE):
     
     Usage: /struct [기업명] [주가] [전환가]
     """
-    from src.engines.wood.opm_engine import OPMCalculator
-    
     args = context.args
     if len(args) < 3:
         await update.message.reply_text(
@@ -446,6 +507,12 @@ async def run_struct(update: Update, context: ContextTypes.DEFAULT_TYPE):
     stock_price = float(args[1])
     conversion_price = float(args[2])
     
+    # 빠른 추정 → 대기열 최우선 (전체 /run 보다 먼저 처리)
+    await _enqueue(update, "struct", lambda job: _struct_job(update, company_name, stock_price, conversion_price))
+
+async def _struct_job(update: Update, company_name: str, stock_price: float, conversion_price: float):
+    from src.engines.wood.opm_engine import OPMCalculator
+    
     await update.message.reply_text(
         f"🏗️ **OPM Engine**\n"
         f"'{company_name}' 하이브리드 증권 평가 중...\n\n"
@@ -508,9 +575,9 @@ async def handle_text(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
     # 1. 제어 명령
     if text in ["잠깐", "멈춰", "중단", "stop"]:
-        if session.is_running:
-            session.stop_flag = True
-            await update.message.reply_text("🛑 중단 신호 접수.")
+        cancelled = JOB_QUEUE.cancel(chat_id)
+        if cancelled:
+            await update.message.reply_text(f"🛑 작업 {cancelled}건 중단 (실행 중 + 대기).")
         else:
             await update.message.reply_text("💤 실행 중인 프로세스 없음.")
         return
@@ -554,12 +621,14 @@ async def post_init(application):
         ("run", "🚀 Deal Pipeline (Full)"),
         ("dcf", "📉 DCF Scenario Tool (Excel)"),
         ("struct", "🏗️ Structuring Tool"),
+        ("queue", "📊 Job Queue Status"),
         ("help", "📚 Manual"),
         ("id", "🆔 Check Chat ID")
     ]
     await application.bot.set_my_commands(commands)
     
-    # 2. 스케줄러 시작
+    # 2. 작업 대기열 워커 + 스케줄러 시작
+    JOB_QUEUE.start()
     scheduler.start()
     scheduler.add_job(scheduled_alert, 'cron', hour=9, args=[application, '"법인회생" 제조'])
     scheduler.add_job(scheduled_alert, 'cron', hour=14, args=[application, '"스타트업" M&A'])
@@ -603,6 +672,7 @@ if __name__ == '__main__':
     app.add_handler(CommandHandler("dcf", run_dcf))
     # Legacy OPM command preserved
     app.add_handler(CommandHandler("struct_legacy", run_struct))
+    app.add_handler(CommandHandler("queue", queue_status))
     app.add_handler(CommandHandler("help", help_command))
     app.add_handler(MessageHandler(filters.TEXT & (~filters.COMMAND), handle_text))
     app.add_handler(struct_handler)
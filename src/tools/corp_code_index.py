@@ -0,0 +1,248 @@
+"""
+DART Corp Code Index
+
+[Purpose]
+corp_code.xml (~100k 기업, 3.4MB) 를 매 조회마다 ET.parse 하지 않도록
+최초 1회 인덱스를 만들어 디스크(pickle)에 저장하고 재사용
+
+[Index]
+1. 정확 일치: 기업명 → 위치
+2. 정규화 일치: 정규화명((주)/주식회사/괄호 제거) → 위치
+3. 부분 일치: 정규화명 bigram posting list (포함 검색 후보 축소)
+4. Fuzzy: bigram Dice 유사도 top-k 후보
+
+[Invalidation]
+XML 파일의 mtime/size 가 바뀌면 자동 재생성
+"""
+
+import os
+import re
+import pickle
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+
+INDEX_VERSION = 2
+
+# 프로세스 내 캐시: {index_path: CorpCodeIndex}
+_LOADED: Dict[str, "CorpCodeIndex"] = {}
+
+
+def normalize_corp_name(name: str) -> str:
+    """
+    기업명 정규화
+    
+    "삼성전자(주)" → "삼성전자", "주식회사 카카오" → "카카오"
+    """
+    if not name:
+        return ""
+    # 괄호 내용 제거
+    name = re.sub(r'\([^)]*\)', '', name)
+    # 주식회사, (주) 등 제거
+    name = name.replace('주식회사', '').replace('(주)', '').replace('(유)', '').strip()
+    return name
+
+
+def _bigrams(text: str) -> List[str]:
+    """문자 bigram (1글자면 자기 자신)"""
+    if len(text) < 2:
+        return [text] if text else []
+    return [text[i:i + 2] for i in range(len(text) - 1)]
+
+
+class CorpCodeIndex:
+    """
+    corp_code.xml 검색 인덱스
+    
+    [Match Order] (기존 DartReader._get_corp_code 와 동일)
+    1차 정확 일치 → 2차 정규화 일치 → 3차 부분 포함 (XML 순서상 첫 번째)
+    """
+    
+    def __init__(self, names: List[str], codes: List[str], source_mtime: int = 0, source_size: int = 0):
+        self.names = names
+        self.codes = codes
+        self.source_mtime = source_mtime
+        self.source_size = source_size
+        
+        self.normalized = [normalize_corp_name(n) for n in names]
+        
+        # 동명 기업은 XML 순서상 첫 번째를 유지
+        self.exact: Dict[str, int] = {}
+        self.by_code: Dict[str, int] = {}
+        self.by_normalized: Dict[str, int] = {}
+        self.postings: Dict[str, List[int]] = {}
+        self.gram_counts: List[int] = []
+        
+        for i, (name, norm) in enumerate(zip(names, self.normalized)):
+            self.exact.setdefault(name, i)
+            self.by_code.setdefault(codes[i], i)
+            if norm:
+                self.by_normalized.setdefault(norm, i)
+            grams = set(_bigrams(norm))
+            self.gram_counts.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(i)
+    
+    # ------------------------------------------------------------------
+    # Build / Load
+    # ------------------------------------------------------------------
+    
+    @classmethod
+    def from_xml(cls, xml_file: str) -> "CorpCodeIndex":
+        """
+        corp_code.xml 파싱 (DART 원본 zip 도 허용)
+        """
+        stat = os.stat(xml_file)
+        
+        if zipfile.is_zipfile(xml_file):
+            with zipfile.ZipFile(xml_file) as zf:
+                with zf.open(zf.namelist()[0]) as f:
+                    root = ET.parse(f).getroot()
+        else:
+            root = ET.parse(xml_file).getroot()
+        
+        names, codes = [], []
+        for child in root.iter('list'):
+            name = (child.findtext('corp_name') or '').strip()
+            code = (child.findtext('corp_code') or '').strip()
+            if name and code:
+                names.append(name)
+                codes.append(code)
+        
+        return cls(names, codes, stat.st_mtime_ns, stat.st_size)
+    
+    @classmethod
+    def load(cls, xml_file: str, index_file: Optional[str] = None) -> "CorpCodeIndex":
+        """
+        인덱스 로드 (메모리 → 디스크 → XML 재생성 순)
+        
+        Args:
+            xml_file: corp_code.xml 경로
+            index_file: pickle 경로 (default: <xml_file>.idx.pkl)
+        
+        Returns:
+            CorpCodeIndex
+        """
+        index_file = index_file or f"{xml_file}.idx.pkl"
+        stat = os.stat(xml_file)
+        
+        cached = _LOADED.get(index_file)
+        if cached is not None and cached.is_fresh(stat):
+            return cached
+        
+        index = None
+        if os.path.exists(index_file):
+            try:
+                with open(index_file, 'rb') as f:
+                    version, candidate = pickle.load(f)
+                if version == INDEX_VERSION and candidate.is_fresh(stat):
+                    index = candidate
+            except Exception as e:
+                print(f"   ⚠️ Corp code index unreadable, rebuilding: {e}")
+        
+        if index is None:
+            print("   🔧 Building corp code index...")
+            index = cls.from_xml(xml_file)
+            try:
+                tmp_file = f"{index_file}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump((INDEX_VERSION, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, index_file)
+                print(f"   ✅ Indexed {len(index.names):,} companies")
+            except OSError as e:
+                print(f"   ⚠️ Could not save corp code index: {e}")
+        
+        _LOADED[index_file] = index
+        return index
+    
+    def is_fresh(self, stat: os.stat_result) -> bool:
+        """XML 파일이 인덱스 생성 이후 변경되지 않았는지"""
+        return self.source_mtime == stat.st_mtime_ns and self.source_size == stat.st_size
+    
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+    
+    def lookup(self, company_name: str) -> Optional[Tuple[str, str, str]]:
+        """
+        기업명 → (corp_code, corp_name, match_type)
+        
+        match_type: 'exact' | 'normalized' | 'partial'
+        """
+        # 1차: 정확 일치
+        i = self.exact.get(company_name)
+        if i is not None:
+            return self.codes[i], self.names[i], 'exact'
+        
+        normalized_input = normalize_corp_name(company_name)
+        if not normalized_input:
+            return None
+        
+        # 2차: 정규화 후 일치
+        i = self.by_normalized.get(normalized_input)
+        if i is not None:
+            return self.codes[i], self.names[i], 'normalized'
+        
+        # 3차: 부분 포함 (양방향, 최소 2글자) - XML 순서상 첫 번째
+        i = self._first_partial(normalized_input)
+        if i is not None:
+            return self.codes[i], self.names[i], 'partial'
+        
+        return None
+    
+    def name_of(self, corp_code: str) -> Optional[str]:
+        """corp_code → 기업명 (없으면 None)"""
+        i = self.by_code.get(corp_code)
+        return self.names[i] if i is not None else None
+    
+    def _first_partial(self, query: str) -> Optional[int]:
+        """
+        query ⊂ 기업명 또는 기업명 ⊂ query 인 첫 번째 위치
+        """
+        if len(query) < 2:
+            return None
+        
+        best = None
+        
+        # query ⊂ 기업명: 가장 드문 bigram 의 posting 만 검증 (오름차순 → 첫 일치가 최소 위치)
+        rarest = min(set(_bigrams(query)), key=lambda g: len(self.postings.get(g, ())))
+        for i in self.postings.get(rarest, ()):
+            if query in self.normalized[i]:
+                best = i
+                break
+        
+        # 기업명 ⊂ query: query 의 모든 부분 문자열(2글자 이상)을 정규화명으로 조회
+        n = len(query)
+        for start in range(n):
+            for end in range(start + 2, n + 1):
+                i = self.by_normalized.get(query[start:end])
+                if i is not None and (best is None or i < best):
+                    best = i
+        
+        return best
+    
+    def top_k(self, query: str, k: int = 5) -> List[Tuple[str, str, float]]:
+        """
+        Fuzzy 후보 (bigram Dice 유사도 순)
+        
+        Returns:
+            [(corp_name, corp_code, score), ...]
+        """
+        normalized_query = normalize_corp_name(query)
+        grams = set(_bigrams(normalized_query))
+        if not grams:
+            return []
+        
+        overlap = Counter()
+        for gram in grams:
+            overlap.update(self.postings.get(gram, ()))
+        
+        scores = {
+            i: 2 * shared / (len(grams) + self.gram_counts[i])
+            for i, shared in overlap.items()
+        }
+        best = sorted(scores, key=lambda i: (-scores[i], i))[:k]
+        
+        return [(self.names[i], self.codes[i], round(scores[i], 4)) for i in best]
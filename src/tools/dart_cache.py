@@ -0,0 +1,173 @@
+"""
+DART Statement Cache
+
+[Purpose]
+DART 주요계정(fnlttSinglAcnt) 응답을 로컬 SQLite 에 저장하여
+동일 기업/연도/보고서 재조회 시 네트워크 호출 0회
+
+[Key]
+(corp_code, bsns_year, reprt_code, fs_div)
+- fs_div: 'CFS' (연결) / 'OFS' (별도) / '' (보고서 없음)
+
+[TTL]
+- 정상 응답 (000): 7일 (정정공시 반영 주기)
+- 보고서 없음 (013): 12시간 (신규 공시 가능성 → 짧게 유지)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_NEGATIVE_TTL = 12 * 3600
+
+STATUS_OK = '000'
+STATUS_NO_REPORT = '013'
+
+
+def _default_path() -> str:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'cache', 'dart_statements.sqlite')
+
+
+class DartStatementCache:
+    """
+    SQLite 기반 DART 재무제표 응답 캐시 (프로세스/인스턴스 간 공유)
+    
+    [Usage]
+    cache = DartStatementCache()
+    res = cache.get(corp_code, '2024', '11011')   # None = miss/만료
+    cache.put(corp_code, '2024', '11011', response_json)
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        negative_ttl: float = DEFAULT_NEGATIVE_TTL
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (default: vault/cache/dart_statements.sqlite)
+            ttl: 정상 응답 유효기간 (초)
+            negative_ttl: 013 (보고서 없음) 유효기간 (초)
+        """
+        self.path = path or _default_path()
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS statements (
+                    corp_code TEXT NOT NULL,
+                    bsns_year TEXT NOT NULL,
+                    reprt_code TEXT NOT NULL,
+                    fs_div TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (corp_code, bsns_year, reprt_code, fs_div)
+                )
+                """
+            )
+    
+    @contextmanager
+    def _connect(self):
+        # 호출마다 새 연결 → 스레드 간 공유 문제 없음
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    def get(self, corp_code: str, bsns_year: str, reprt_code: str) -> Optional[Dict]:
+        """
+        캐시된 DART 응답 조회
+        
+        Returns:
+            {'status': '000', 'list': [...]} / {'status': '013', 'list': []}
+            None: 미존재 또는 TTL 만료
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT fs_div, status, payload, fetched_at FROM statements "
+                "WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ? "
+                "ORDER BY fs_div",
+                (corp_code, str(bsns_year), reprt_code)
+            ).fetchall()
+        
+        now = time.time()
+        items: List[dict] = []
+        status = None
+        
+        for fs_div, row_status, payload, fetched_at in rows:
+            ttl = self.negative_ttl if row_status == STATUS_NO_REPORT else self.ttl
+            if now - fetched_at > ttl:
+                status = None
+                break
+            status = row_status
+            items.extend(json.loads(payload))
+        
+        with self._lock:
+            if status is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        
+        return {'status': status, 'list': items}
+    
+    def put(self, corp_code: str, bsns_year: str, reprt_code: str, response: Dict):
+        """
+        DART 응답 저장 (000 / 013 만 캐시, 그 외 오류는 저장하지 않음)
+        
+        Args:
+            response: fnlttSinglAcnt JSON 응답
+        """
+        status = response.get('status')
+        if status not in (STATUS_OK, STATUS_NO_REPORT):
+            return
+        
+        grouped: Dict[str, List[dict]] = {}
+        if status == STATUS_OK:
+            for item in response.get('list') or []:
+                grouped.setdefault(item.get('fs_div', ''), []).append(item)
+        if not grouped:
+            grouped[''] = []
+        
+        now = time.time()
+        key = (corp_code, str(bsns_year), reprt_code)
+        
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM statements WHERE corp_code = ? AND bsns_year = ? AND reprt_code = ?",
+                key
+            )
+            conn.executemany(
+                "INSERT INTO statements VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (*key, fs_div, status, json.dumps(items, ensure_ascii=False), now)
+                    for fs_div, items in grouped.items()
+                ]
+            )
+    
+    def invalidate(self, corp_code: Optional[str] = None):
+        """캐시 삭제 (corp_code 지정 시 해당 기업만)"""
+        with self._connect() as conn:
+            if corp_code:
+                conn.execute("DELETE FROM statements WHERE corp_code = ?", (corp_code,))
+            else:
+                conn.execute("DELETE FROM statements")
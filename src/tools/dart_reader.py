@@ -10,20 +10,98 @@ DART Reader V2.0
 [Fix]
 - 모비릭스 같은 게임사의 "영업수익" 인식
 - 2026년 1월 기준 최신 보고서 검색
+
+[Cache]
+- 주요계정 응답은 DartStatementCache (SQLite) 에 저장 → 재조회 시 네트워크 0회
+
+[Concurrency]
+- 1개 연도의 보고서 4종을 pooled Session 으로 동시 조회, 우선순위 확정 즉시 반환
+- 해당 연도가 전부 miss 일 때만 다음 연도 조회 (DART 일일 호출 한도 보호)
+
+[Bulk]
+- get_financial_summaries: 다중회사 주요계정(fnlttMultiAcnt, 100개/호출) 일괄 조회
 """
 
 import os
+import re
+import time
+import random
+import threading
 import requests
-import xml.etree.ElementTree as ET
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from dotenv import load_dotenv
 
+from .corp_code_index import CorpCodeIndex
+from .dart_cache import DartStatementCache
+
 load_dotenv()
 
 
+MULTI_ACNT_URL = "https://opendart.fss.or.kr/api/fnlttMultiAcnt.json"
+MULTI_ACNT_MAX_CORPS = 100
+
+# 재시도 대상: HTTP 429/5xx, DART 020 (요청 제한 초과)
+RETRY_HTTP_STATUS = {429, 500, 502, 503, 504}
+RETRY_DART_STATUS = {'020'}
+
+BULK_COLUMNS = [
+    'query', 'corp_code', 'corp_name', 'match_type', 'status',
+    'bsns_year', 'period', 'revenue_bn', 'op_bn', 'source'
+]
+
+
+class _RateLimiter:
+    """최소 호출 간격 보장 (스레드 안전)"""
+    
+    def __init__(self, min_interval):
+        self.min_interval = min_interval
+        self._next_at = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.min_interval
+        if delay > 0:
+            time.sleep(delay)
+
+
 class DartReader:
-    def __init__(self):
+    def __init__(
+        self,
+        cache=None,
+        use_cache=True,
+        concurrent=True,
+        max_workers=4,
+        min_interval=0.2,
+        max_retries=3,
+        backoff=1.0
+    ):
+        """
+        Args:
+            cache: DartStatementCache (default: vault/cache/dart_statements.sqlite)
+            use_cache: False 면 항상 DART API 직접 호출
+            concurrent: 연도 × 보고서 동시 조회 (False = 기존 순차 조회)
+            max_workers: 동시 조회 스레드 수 (= 한 번에 조회하는 보고서 수, 기본 1개 연도분)
+            min_interval: 일괄 조회 최소 호출 간격 (초)
+            max_retries: 일괄 조회 재시도 횟수
+            backoff: 재시도 대기 기본값 (초, 지수 증가 + jitter)
+        """
         self.api_key = os.getenv("DART_API_KEY")
+        self.cache = (cache or DartStatementCache()) if use_cache else None
+        self.concurrent = concurrent
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._rate_limiter = _RateLimiter(min_interval)
+        
+        # 연결 재사용 (TLS handshake 1회)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max_workers))
         if not self.api_key:
             print("⚠️ DART_API_KEY is missing. Please check .env file")
             print("   DART features will be disabled.")
@@ -57,7 +135,7 @@ class DartReader:
         - 괄호/주식회사 등 제거 후 비교
         
         [Note]
-        corpCode.xml을 매번 다운받으면 느리므로 로컬 캐싱 권장
+        corp_code.xml 은 최초 1회만 파싱 → corp_code.xml.idx.pkl 인덱스 재사용
         """
         xml_file = 'corp_code.xml'
         
@@ -66,6 +144,35 @@ class DartReader:
             print("   ❌ DART_API_KEY is missing. Cannot search DART.")
             return None
         
+        index = self._load_corp_index(xml_file)
+        if index is None:
+            return None
+        
+        match = index.lookup(company_name)
+        if match:
+            corp_code, corp_name, match_type = match
+            if match_type == 'exact':
+                print(f"   ✅ Exact match found: '{corp_name}'")
+            elif match_type == 'normalized':
+                print(f"   ✅ Normalized match found: '{corp_name}' (input: '{company_name}')")
+            else:
+                print(f"   ⚠️ Partial match found: '{corp_name}' (input: '{company_name}')")
+            return corp_code
+        
+        print(f"   ❌ No matching company found in DART for '{company_name}'")
+        candidates = index.top_k(company_name, k=3)
+        if candidates:
+            print(f"      Did you mean: {', '.join(name for name, _, _ in candidates)}?")
+        print(f"      Hint: Try using exact legal name (e.g., '삼성전자(주)')")
+        return None
+    
+    def _load_corp_index(self, xml_file='corp_code.xml'):
+        """
+        corp_code.xml 확보 (없으면 다운로드) 후 CorpCodeIndex 로드
+        
+        Returns:
+            CorpCodeIndex or None
+        """
         # XML 파일이 없으면 다운로드
         if not os.path.exists(xml_file):
             url = 'https://opendart.fss.or.kr/api/corpCode.xml'
@@ -85,74 +192,27 @@ class DartReader:
                 print(f"   ❌ Failed to download corp_code.xml: {e}")
                 return None
         
-        # 입력 기업명 정규화 (괄호, 주식회사 등 제거)
-        def normalize_name(name):
-            """기업명 정규화"""
-            if not name:
-                return ""
-            # 괄호 내용 제거: "삼성전자(주)" → "삼성전자"
-            import re
-            name = re.sub(r'\([^)]*\)', '', name)
-            # 주식회사, (주) 등 제거
-            name = name.replace('주식회사', '').replace('(주)', '').replace('(유)', '').strip()
-            return name
-        
-        normalized_input = normalize_name(company_name)
-        
-        # XML 파싱
+        # 인덱스 조회 (최초 1회 XML 파싱 후 pickle 재사용, XML 변경 시 재생성)
         try:
-            tree = ET.parse(xml_file)
-            root = tree.getroot()
-            
-            # 1차: 정확 일치
-            for child in root.findall('list'):
-                nm = child.find('corp_name')
-                if nm is not None and nm.text:
-                    corp_name = nm.text.strip()
-                    if corp_name == company_name:
-                        code = child.find('corp_code')
-                        if code is not None and code.text:
-                            print(f"   ✅ Exact match found: '{corp_name}'")
-                            return code.text.strip()
-            
-            # 2차: 정규화 후 일치
-            for child in root.findall('list'):
-                nm = child.find('corp_name')
-                if nm is not None and nm.text:
-                    corp_name = nm.text.strip()
-                    normalized_corp = normalize_name(corp_name)
-                    if normalized_corp == normalized_input and normalized_input:
-                        code = child.find('corp_code')
-                        if code is not None and code.text:
-                            print(f"   ✅ Normalized match found: '{corp_name}' (input: '{company_name}')")
-                            return code.text.strip()
-            
-            # 3차: 부분 포함 검색 (입력이 회사명에 포함되거나 그 반대)
-            for child in root.findall('list'):
-                nm = child.find('corp_name')
-                if nm is not None and nm.text:
-                    corp_name = nm.text.strip()
-                    normalized_corp = normalize_name(corp_name)
-                    
-                    # 양방향 포함 검색
-                    if normalized_input and normalized_corp:
-                        if normalized_input in normalized_corp or normalized_corp in normalized_input:
-                            # 최소 길이 체크 (너무 짧은 매칭 방지)
-                            min_len = min(len(normalized_input), len(normalized_corp))
-                            if min_len >= 2:  # 최소 2글자 이상
-                                code = child.find('corp_code')
-                                if code is not None and code.text:
-                                    print(f"   ⚠️ Partial match found: '{corp_name}' (input: '{company_name}')")
-                                    return code.text.strip()
-            
+            index = CorpCodeIndex.load(xml_file)
         except Exception as e:
             print(f"   ❌ Error parsing corp_code.xml: {e}")
             import traceback
             traceback.print_exc()
+            return None
         
-        print(f"   ❌ No matching company found in DART for '{company_name}'")
-        print(f"      Hint: Try using exact legal name (e.g., '삼성전자(주)')")
-        return None
+        return index
+    
+    def search_corp_candidates(self, company_name, k=5):
+        """
+        기업명 fuzzy 후보 top-k (bigram 유사도)
+        
+        Returns:
+            [(corp_name, corp_code, score), ...] (corp_code.xml 없으면 [])
+        """
+        if not os.path.exists('corp_code.xml'):
+            return []
+        return CorpCodeIndex.load('corp_code.xml').top_k(company_name, k=k)
     
     def _find_value_by_keys(self, row_dict, keys):
         """
@@ -180,7 +240,7 @@ class DartReader:
         
         return None
     
-    def get_financial_summary(self, company_name):
+    def get_financial_summary(self, company_name, concurrent=None):
         """
         DART에서 최신 재무 데이터 조회
         
@@ -193,6 +253,7 @@ class DartReader:
         
         Args:
             company_name: 회사명 (정확한 법인명)
+            concurrent: 보고서 동시 조회 여부 (None = 생성자 설정)
         
         Returns:
             {
@@ -220,129 +281,26 @@ class DartReader:
         # 보고서 코드 우선순위: 11011(사업), 11014(3분기), 11012(반기), 11013(1분기)
         report_codes = ['11011', '11014', '11012', '11013']
         
-        final_data = {}
-        found_report = False
-        source_tag = ""
+        # (연도, 보고서) 우선순위: 최신 연도 → 사업(11011) > 3Q(11014) > 반기(11012) > 1Q(11013)
+        probes = [(year, reprt_code) for year in target_years for reprt_code in report_codes]
         
         print(f"   🔎 Searching DART for '{company_name}' (Corp Code: {corp_code})...")
         
-        for year in target_years:
-            if found_report:
-                break
-            
-            # 단일판매 공급계약 등 수시공시는 제외, 정기공시만 조회
-            # 주요 계정 조회 API (fnlttSinglAcnt) 사용
-            url = "https://opendart.fss.or.kr/api/fnlttSinglAcnt.json"
-            
-            for reprt_code in report_codes:
-                params = {
-                    'crtfc_key': self.api_key,
-                    'corp_code': corp_code,
-                    'bsns_year': str(year),
-                    'reprt_code': reprt_code,
-                }
-                
-                try:
-                    response = requests.get(url, params=params, timeout=10)
-                    
-                    # HTTP 에러 체크
-                    if response.status_code != 200:
-                        if response.status_code == 401:
-                            print(f"   ❌ DART API Authentication Error (401)")
-                            print(f"      Hint: Check if DART_API_KEY is valid")
-                            return None
-                        continue  # 다음 보고서 시도
-                    
-                    res = response.json()
-                    
-                    # API 응답 상태 체크
-                    status = res.get('status')
-                    if status != '000':
-                        error_msg = res.get('message', 'Unknown error')
-                        if status == '013':
-                            # 해당 보고서 없음 - 정상 (다음 보고서 시도)
-                            continue
-                        elif status == '800' or status == '900':
-                            print(f"   ❌ DART API Error: {error_msg} (Status: {status})")
-                            if status == '800':
-                                print(f"      Hint: API key may be invalid or expired")
-                            return None
-                        # 기타 에러는 무시하고 다음 시도
-                        continue
-                    
-                    if res.get('list'):
-                        # 데이터 찾음!
-                        data_list = res['list']
-                        
-                        rev = 0
-                        op = 0
-                        
-                        # 연결재무제표 우선 (CFS), 없으면 별도(OFS)
-                        # DART API는 섞여서 오므로 'fs_div' 확인 필요
-                        # 'CFS': 연결, 'OFS': 별도
-                        
-                        is_consolidated = False
-                        
-                        # 1차 패스: 연결(CFS) 찾기
-                        for item in data_list:
-                            if item.get('fs_div') == 'CFS':
-                                is_consolidated = True
-                                
-                                v_rev = self._find_value_by_keys(item, self.ACCOUNT_MAP['revenue'])
-                                if v_rev and rev == 0:
-                                    rev = v_rev
-                                
-                                v_op = self._find_value_by_keys(item, self.ACCOUNT_MAP['profit'])
-                                if v_op and op == 0:
-                                    op = v_op
-                        
-                        # 연결 데이터가 없거나 0이면 별도(OFS)로 재시도
-                        if rev == 0:
-                            for item in data_list:
-                                if item.get('fs_div') == 'OFS':
-                                    v_rev = self._find_value_by_keys(item, self.ACCOUNT_MAP['revenue'])
-                                    if v_rev and rev == 0:
-                                        rev = v_rev
-                                    
-                                    v_op = self._find_value_by_keys(item, self.ACCOUNT_MAP['profit'])
-                                    if v_op and op == 0:
-                                        op = v_op
-                        
-                        # 단위 보정 (DART는 기본 단위가 원)
-                        # 억 단위로 변환
-                        rev_bn = rev / 100000000
-                        op_bn = op / 100000000
-                        
-                        # 보고서 이름 매핑
-                        report_name_map = {
-                            '11011': '4Q(Year)', 
-                            '11012': '2Q', 
-                            '11013': '1Q', 
-                            '11014': '3Q'
-                        }
-                        period_name = report_name_map.get(reprt_code, reprt_code)
-                        
-                        source_tag = f"DART {year}.{period_name} ({'CFS' if is_consolidated else 'OFS'})"
-                        
-                        final_data = {
-                            "revenue_bn": rev_bn,
-                            "op_bn": op_bn,
-                            "source": source_tag,
-                            "period": f"{year}.{period_name}"
-                        }
-                        
-                        print(f"      ✅ Found: {source_tag}")
-                        print(f"         Revenue: {rev_bn:.1f}억, OP: {op_bn:.1f}억")
-                        
-                        found_report = True
-                        break  # Break report code loop
-                
-                except requests.exceptions.Timeout:
-                    print(f"      ⏱️ DART API timeout for {year}.{reprt_code}")
-                    continue
-                except Exception as e:
-                    print(f"      ⚠️ Error parsing DART {year}.{reprt_code}: {e}")
-                    continue
+        use_concurrent = self.concurrent if concurrent is None else concurrent
+        if use_concurrent:
+            selected = self._probe_concurrent(corp_code, probes)
+        else:
+            selected = self._probe_sequential(corp_code, probes)
+        
+        final_data = {}
+        if selected is not None:
+            kind, payload = selected
+            if kind == 'fatal':
+                print("\n".join(payload))
+                return None
+            final_data = payload
+            print(f"      ✅ Found: {final_data['source']}")
+            print(f"         Revenue: {final_data['revenue_bn']:.1f}억, OP: {final_data['op_bn']:.1f}억")
         
         if not final_data:
             print("   ❌ No data found in DART")
@@ -353,3 +311,361 @@ class DartReader:
             return None
         
         return final_data
+    
+    def _probe_report(self, corp_code, year, reprt_code):
+        """
+        단일 (연도, 보고서) 조회 (캐시 → DART API)
+        
+        Returns:
+            ('hit', final_data): 데이터 있음
+            ('miss', None): 보고서 없음(013) / 일시 오류 → 다음 순위
+            ('fatal', messages): 인증 오류(401/800/900) → 검색 중단
+        """
+        # 단일판매 공급계약 등 수시공시는 제외, 정기공시만 조회
+        # 주요 계정 조회 API (fnlttSinglAcnt) 사용
+        url = "https://opendart.fss.or.kr/api/fnlttSinglAcnt.json"
+        params = {
+            'crtfc_key': self.api_key,
+            'corp_code': corp_code,
+            'bsns_year': str(year),
+            'reprt_code': reprt_code,
+        }
+        
+        try:
+            # 캐시 우선 (013 "보고서 없음" 도 짧은 TTL 로 캐시됨)
+            res = self.cache.get(corp_code, str(year), reprt_code) if self.cache else None
+            
+            if res is None:
+                response = self.session.get(url, params=params, timeout=10)
+                
+                # HTTP 에러 체크
+                if response.status_code != 200:
+                    if response.status_code == 401:
+                        return 'fatal', [
+                            "   ❌ DART API Authentication Error (401)",
+                            "      Hint: Check if DART_API_KEY is valid"
+                        ]
+                    return 'miss', None  # 다음 보고서 시도
+                
+                res = response.json()
+                
+                if self.cache:
+                    self.cache.put(corp_code, str(year), reprt_code, res)
+            
+            # API 응답 상태 체크
+            status = res.get('status')
+            if status != '000':
+                error_msg = res.get('message', 'Unknown error')
+                if status == '800' or status == '900':
+                    messages = [f"   ❌ DART API Error: {error_msg} (Status: {status})"]
+                    if status == '800':
+                        messages.append("      Hint: API key may be invalid or expired")
+                    return 'fatal', messages
+                # 013 (해당 보고서 없음) 및 기타 에러는 다음 시도
+                return 'miss', None
+            
+            if res.get('list'):
+                # 데이터 찾음!
+                return 'hit', self._parse_report(res['list'], year, reprt_code)
+            
+            return 'miss', None
+        
+        except requests.exceptions.Timeout:
+            print(f"      ⏱️ DART API timeout for {year}.{reprt_code}")
+            return 'miss', None
+        except Exception as e:
+            print(f"      ⚠️ Error parsing DART {year}.{reprt_code}: {e}")
+            return 'miss', None
+    
+    def _parse_report(self, data_list, year, reprt_code):
+        """
+        주요계정 응답 → {"revenue_bn", "op_bn", "source", "period"}
+        """
+        rev = 0
+        op = 0
+        
+        # 연결재무제표 우선 (CFS), 없으면 별도(OFS)
+        # DART API는 섞여서 오므로 'fs_div' 확인 필요
+        # 'CFS': 연결, 'OFS': 별도
+        
+        is_consolidated = False
+        
+        # 1차 패스: 연결(CFS) 찾기
+        for item in data_list:
+            if item.get('fs_div') == 'CFS':
+                is_consolidated = True
+                
+                v_rev = self._find_value_by_keys(item, self.ACCOUNT_MAP['revenue'])
+                if v_rev and rev == 0:
+                    rev = v_rev
+                
+                v_op = self._find_value_by_keys(item, self.ACCOUNT_MAP['profit'])
+                if v_op and op == 0:
+                    op = v_op
+        
+        # 연결 데이터가 없거나 0이면 별도(OFS)로 재시도
+        if rev == 0:
+            for item in data_list:
+                if item.get('fs_div') == 'OFS':
+                    v_rev = self._find_value_by_keys(item, self.ACCOUNT_MAP['revenue'])
+                    if v_rev and rev == 0:
+                        rev = v_rev
+                    
+                    v_op = self._find_value_by_keys(item, self.ACCOUNT_MAP['profit'])
+                    if v_op and op == 0:
+                        op = v_op
+        
+        # 단위 보정 (DART는 기본 단위가 원)
+        # 억 단위로 변환
+        rev_bn = rev / 100000000
+        op_bn = op / 100000000
+        
+        # 보고서 이름 매핑
+        report_name_map = {
+            '11011': '4Q(Year)', 
+            '11012': '2Q', 
+            '11013': '1Q', 
+            '11014': '3Q'
+        }
+        period_name = report_name_map.get(reprt_code, reprt_code)
+        
+        source_tag = f"DART {year}.{period_name} ({'CFS' if is_consolidated else 'OFS'})"
+        
+        return {
+            "revenue_bn": rev_bn,
+            "op_bn": op_bn,
+            "source": source_tag,
+            "period": f"{year}.{period_name}"
+        }
+    
+    def _probe_sequential(self, corp_code, probes):
+        """
+        우선순위 순서대로 1건씩 조회, 첫 hit/fatal 에서 중단
+        
+        Returns:
+            ('hit', final_data) / ('fatal', messages) / None (전부 miss)
+        """
+        for year, reprt_code in probes:
+            outcome = self._probe_report(corp_code, year, reprt_code)
+            if outcome[0] != 'miss':
+                return outcome
+        return None
+    
+    def _probe_concurrent(self, corp_code, probes):
+        """
+        우선순위 순서대로 max_workers 개씩 묶어 동시 조회 (pooled Session)
+        
+        [Priority]
+        순위 r 의 결과는 r 보다 높은 순위가 모두 miss 로 끝났을 때만 확정
+        → 순차 검색과 동일한 보고서 선택
+        
+        [Batching]
+        다음 묶음 (기본: 다음 연도) 은 현재 묶음이 전부 miss 일 때만 조회
+        → 상위 보고서 hit 시 호출 수는 최대 max_workers 회 (순차 검색 대비 호출 증가 제한)
+        확정 즉시 반환, 같은 묶음의 하위 순위 요청은 백그라운드에서 완료 후 캐시에만 저장
+        
+        Returns:
+            ('hit', final_data) / ('fatal', messages) / None (전부 miss)
+        """
+        batch_size = max(1, self.max_workers)
+        executor = ThreadPoolExecutor(max_workers=min(batch_size, len(probes)))
+        
+        try:
+            for start in range(0, len(probes), batch_size):
+                batch = probes[start:start + batch_size]
+                futures = {
+                    executor.submit(self._probe_report, corp_code, year, reprt_code): rank
+                    for rank, (year, reprt_code) in enumerate(batch)
+                }
+                outcomes = [None] * len(batch)
+                
+                for future in as_completed(futures):
+                    outcomes[futures[future]] = future.result()
+                    
+                    # 가장 높은 순위부터 확정 가능한 결과 확인
+                    for outcome in outcomes:
+                        if outcome is None:
+                            break  # 상위 순위 대기 중
+                        if outcome[0] != 'miss':
+                            return outcome
+            return None
+        finally:
+            executor.shutdown(wait=False)
+    
+    def _request_json(self, url, params, timeout=30):
+        """
+        DART API 호출 (rate limit + 지수 backoff 재시도)
+        
+        [Retry]
+        Timeout / 연결 오류 / HTTP 429·5xx / DART 020 (요청 제한 초과)
+        
+        Returns:
+            JSON dict or None (재시도 소진 / 비재시도 HTTP 오류)
+        """
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                delay = self.backoff * (2 ** (attempt - 1)) * (1 + random.random())
+                print(f"      🔁 DART retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+            
+            self._rate_limiter.wait()
+            
+            try:
+                response = self.session.get(url, params=params, timeout=timeout)
+            except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                print(f"      ⏱️ DART request failed: {e}")
+                continue
+            
+            if response.status_code in RETRY_HTTP_STATUS:
+                continue
+            if response.status_code != 200:
+                print(f"   ❌ DART API Error: HTTP {response.status_code}")
+                return None
+            
+            res = response.json()
+            if res.get('status') in RETRY_DART_STATUS:
+                continue
+            return res
+        
+        print(f"   ❌ DART API: retries exhausted")
+        return None
+    
+    def _fetch_multi(self, corp_codes, year, reprt_code):
+        """
+        다중회사 주요계정 조회 (캐시 → fnlttMultiAcnt, 100개 단위)
+        
+        Returns:
+            {corp_code: data_list} (데이터 있는 기업만)
+        """
+        found = {}
+        missing = []
+        
+        for corp_code in corp_codes:
+            res = self.cache.get(corp_code, str(year), reprt_code) if self.cache else None
+            if res is None:
+                missing.append(corp_code)
+            elif res.get('list'):
+                found[corp_code] = res['list']
+        
+        for start in range(0, len(missing), MULTI_ACNT_MAX_CORPS):
+            chunk = missing[start:start + MULTI_ACNT_MAX_CORPS]
+            res = self._request_json(MULTI_ACNT_URL, {
+                'crtfc_key': self.api_key,
+                'corp_code': ','.join(chunk),
+                'bsns_year': str(year),
+                'reprt_code': reprt_code,
+            })
+            
+            if res is None:
+                continue
+            
+            status = res.get('status')
+            if status == '800' or status == '900':
+                print(f"   ❌ DART API Error: {res.get('message', 'Unknown error')} (Status: {status})")
+                break
+            if status not in ('000', '013'):
+                continue
+            
+            grouped = {}
+            for item in res.get('list') or []:
+                grouped.setdefault(item.get('corp_code'), []).append(item)
+            
+            for corp_code in chunk:
+                if corp_code in grouped:
+                    found[corp_code] = grouped[corp_code]
+                    response = {'status': '000', 'list': grouped[corp_code]}
+                else:
+                    response = {'status': '013', 'list': []}  # 응답에 없는 기업 = 보고서 없음
+                if self.cache:
+                    self.cache.put(corp_code, str(year), reprt_code, response)
+        
+        return found
+    
+    def get_financial_summaries(self, companies, year=None, reprt_code='11011', fallback_years=1):
+        """
+        여러 기업 재무 데이터 일괄 조회 (다중회사 주요계정 API)
+        
+        [Logic]
+        1. 기업명/corp_code → CorpCodeIndex 로 일괄 변환
+        2. fnlttMultiAcnt 로 100개씩 조회 (500개 기업 → 5회 호출)
+        3. 데이터 없는 기업만 이전 연도로 재조회 (fallback_years)
+        
+        Args:
+            companies: 기업명 또는 8자리 corp_code 리스트
+            year: 사업연도 (default: 작년)
+            reprt_code: 보고서 코드 (default: 11011 사업보고서)
+            fallback_years: 이전 연도 재조회 횟수
+        
+        Returns:
+            DataFrame (BULK_COLUMNS, 입력 순서 유지)
+            status: 'ok' | 'not_found' (기업명 불일치) | 'no_data'
+        """
+        if not self.api_key:
+            print(f"   ❌ DART: API key not configured")
+            return pd.DataFrame(columns=BULK_COLUMNS)
+        
+        index = self._load_corp_index()
+        if index is None:
+            return pd.DataFrame(columns=BULK_COLUMNS)
+        
+        # 1. 기업명 → corp_code
+        rows = []
+        for query in companies:
+            query = str(query).strip()
+            if re.fullmatch(r'\d{8}', query):
+                match = (query, index.name_of(query) or '', 'code')
+            else:
+                match = index.lookup(query)
+            
+            row = dict.fromkeys(BULK_COLUMNS)
+            row.update(query=query, status='not_found')
+            if match:
+                row.update(corp_code=match[0], corp_name=match[1], match_type=match[2], status='no_data')
+            rows.append(row)
+        
+        # 2. 연도별 일괄 조회 (데이터 없는 기업만 다음 연도로)
+        year = int(year or datetime.now().year - 1)
+        
+        for target_year in range(year, year - fallback_years - 1, -1):
+            pending = list(dict.fromkeys(r['corp_code'] for r in rows if r['status'] == 'no_data'))
+            if not pending:
+                break
+            
+            print(f"   📦 DART bulk fetch: {len(pending)} companies ({target_year}.{reprt_code})")
+            found = self._fetch_multi(pending, target_year, reprt_code)
+            
+            for row in rows:
+                if row['status'] == 'no_data' and row['corp_code'] in found:
+                    data = self._parse_report(found[row['corp_code']], target_year, reprt_code)
+                    row.update(
+                        status='ok',
+                        bsns_year=str(target_year),
+                        period=data['period'],
+                        revenue_bn=data['revenue_bn'],
+                        op_bn=data['op_bn'],
+                        source=data['source']
+                    )
+        
+        df = pd.DataFrame(rows, columns=BULK_COLUMNS)
+        print(f"   ✅ DART bulk: {(df['status'] == 'ok').sum()}/{len(df)} companies with data")
+        
+        return df
+    
+    def prefetch(self, company_names):
+        """
+        여러 기업 재무 데이터 일괄 조회 (캐시 워밍)
+        
+        이후 동일 기업 조회(XrayValuation, SmartFinancialIngestor, Streamlit)는
+        네트워크 없이 캐시에서 응답
+        
+        Args:
+            company_names: 회사명 리스트
+        
+        Returns:
+            {company_name: get_financial_summary 결과 or None}
+        """
+        results = {}
+        for i, name in enumerate(company_names, start=1):
+            print(f"   [{i}/{len(company_names)}] Prefetching DART: {name}")
+            results[name] = self.get_financial_summary(name)
+        return results
@@ -0,0 +1,51 @@
+"""
+Fake HTTP helpers (tool 테스트 공용)
+
+[Purpose]
+DART / 네이버 테스트에서 requests.Session.get 을 대체하는 가짜 응답 + session.get 스텁
+(파일명에 test_ 접두사가 없으므로 pytest 수집 대상 아님)
+
+[Usage]
+from src.tools.fake_http import FakeResponse, fake_session_get
+
+def handler(url, params):
+    calls.append(params['bsns_year'])
+    return {'status': '013'}        # dict → json(), str → text, FakeResponse 는 그대로
+
+reader.session.get = fake_session_get(handler)
+"""
+
+from typing import Any, Callable, Dict, Optional
+
+
+class FakeResponse:
+    """requests.Response 대체 (status_code / json() / text)"""
+    
+    def __init__(self, payload: Any = None, status_code: int = 200, text: str = ''):
+        self._payload = payload
+        self.status_code = status_code
+        self.text = text
+    
+    def json(self) -> Any:
+        return self._payload
+
+
+def fake_session_get(handler: Callable[[str, Dict[str, Any]], Any]) -> Callable[..., FakeResponse]:
+    """
+    session.get 스텁 생성
+    
+    Args:
+        handler: (url, params) → FakeResponse / dict (JSON payload) / str (HTML text)
+    
+    Returns:
+        get(url, params=None, timeout=None) (timeout 누락 시 AssertionError)
+    """
+    def get(url: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[float] = None) -> FakeResponse:
+        assert timeout is not None, f"request without timeout: {url}"
+        result = handler(url, params or {})
+        if isinstance(result, FakeResponse):
+            return result
+        if isinstance(result, str):
+            return FakeResponse(text=result)
+        return FakeResponse(result)
+    return get
@@ -2,9 +2,22 @@
 import FinanceDataReader as fdr
 import pandas as pd
 import datetime
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .price_store import PriceStore, trading_day
 
 class MarketDataTerminal:
-    def __init__(self):
+    # 거래일 단위 섹터 조정계수 테이블 (프로세스 내 공유)
+    # {(trading_day, proxies): DataFrame}
+    _factor_tables = {}
+    _lock = threading.Lock()
+
+    def __init__(self, store=None, use_store=True, max_workers=8):
+        # 일봉 이력 로컬 저장소 (vault/cache/prices, 증분 업데이트)
+        self.store = store or (PriceStore() if use_store else None)
+        self.max_workers = max_workers
+        
         # 섹터별 대표 대장주(Proxy) Ticker
         self.proxies = {
             "K-Beauty": ["000900", "192820", "237690"], # 아모레, 코스맥스, 클리오
@@ -14,6 +27,69 @@ class MarketDataTerminal:
             "General": ["005930"]                        # 삼성전자 (지수 대용)
         }
 
+    def _sector_key(self, sector_name):
+        """섹터명 → proxies 키"""
+        if "Beauty" in sector_name or "화장품" in sector_name: return "K-Beauty"
+        elif "Tech" in sector_name or "SaaS" in sector_name: return "Tech/SaaS"
+        elif "F&B" in sector_name or "식품" in sector_name: return "F&B"
+        elif "Manu" in sector_name or "제조" in sector_name: return "Auto/Parts"
+        return "General"
+
+    def get_factor_table(self):
+        """
+        전 섹터 모멘텀 / 조정계수 테이블 (거래일 단위 메모이제이션)
+        
+        1. 전체 proxy 종목 일봉을 한 번에 조회 (저장소 우선, 부족분은 스레드 풀 병렬 조회)
+        2. 종가 wide matrix (날짜 × 종목) 에서 60일 수익률 일괄 계산
+        3. 섹터별 평균 → 조정계수 (±20% 캡)
+        
+        Returns:
+            DataFrame (index: 섹터 키) - trend, adjustment, tickers_used
+        """
+        key = (trading_day(), tuple((k, tuple(v)) for k, v in self.proxies.items()))
+        with self._lock:
+            table = self._factor_tables.get(key)
+        if table is not None:
+            return table
+        
+        tickers = list(dict.fromkeys(code for codes in self.proxies.values() for code in codes))
+        
+        # 데이터 조회 (최근 60일 = 약 3개월)
+        end_date = datetime.datetime.now()
+        start_date = end_date - datetime.timedelta(days=60)
+
+        if self.store:
+            history = self.store.get_histories(tickers, start_date, end_date, self._fetch_history, source='fdr', interval='1d')
+        else:
+            history = self._fetch_history(tickers, start_date, end_date)
+
+        closes = pd.DataFrame({code: df['Close'] for code, df in history.items() if 'Close' in df}).reindex(columns=tickers)
+        
+        # 종목별 첫/마지막 유효 종가 → 수익률 (10일 이하 데이터는 제외)
+        if closes.empty:
+            returns = pd.Series(float('nan'), index=tickers)
+        else:
+            returns = (closes.ffill().iloc[-1] / closes.bfill().iloc[0] - 1).where(closes.count() > 10)
+        
+        rows = {}
+        for sector, codes in self.proxies.items():
+            sector_returns = returns.reindex(codes).dropna()
+            if sector_returns.empty:
+                rows[sector] = {'trend': None, 'adjustment': 1.0, 'tickers_used': 0} # 데이터 없으면 중립
+                continue
+            sector_trend = float(sector_returns.mean())
+            # 조정 계수: -20% ~ +20% 사이로 캡(Cap) 적용 (안전장치)
+            adjustment = max(0.8, min(1.2, 1.0 + sector_trend))
+            rows[sector] = {'trend': sector_trend, 'adjustment': adjustment, 'tickers_used': len(sector_returns)}
+        
+        table = pd.DataFrame.from_dict(rows, orient='index')
+        
+        # 데이터를 전혀 못 받은 경우는 캐시하지 않음 (다음 호출에서 재시도)
+        if table['tickers_used'].sum() > 0:
+            with self._lock:
+                self._factor_tables[key] = table
+        return table
+
     def get_sector_momentum(self, sector_name):
         """
         해당 섹터의 최근 3개월 주가 수익률(Momentum)을 계산하여
@@ -23,38 +99,25 @@ class MarketDataTerminal:
         print(f"   📈 Market Data: Analyzing momentum for '{sector_name}'...")
         
         # 1. 섹터 매핑
-        target_key = "General"
-        if "Beauty" in sector_name or "화장품" in sector_name: target_key = "K-Beauty"
-        elif "Tech" in sector_name or "SaaS" in sector_name: target_key = "Tech/SaaS"
-        elif "F&B" in sector_name or "식품" in sector_name: target_key = "F&B"
-        elif "Manu" in sector_name or "제조" in sector_name: target_key = "Auto/Parts"
-
-        tickers = self.proxies.get(target_key, self.proxies["General"])
+        target_key = self._sector_key(sector_name)
+        if target_key not in self.proxies: target_key = "General"
         
-        # 2. 데이터 조회 (최근 60일 = 약 3개월)
-        avg_return = 0
-        count = 0
+        # 2. 당일 조정계수 테이블 조회
+        row = self.get_factor_table().loc[target_key]
+        if not row['tickers_used']: return 1.0 # 데이터 없으면 중립
         
-        end_date = datetime.datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.datetime.now() - datetime.timedelta(days=60)).strftime("%Y-%m-%d")
+        print(f"      👉 {target_key} Trend: {row['trend']*100:.1f}% -> Adj Factor: {row['adjustment']:.2f}x")
+        return row['adjustment']
 
-        for code in tickers:
+    def _fetch_history(self, tickers, start_date, end_date):
+        """FinanceDataReader 일봉 병렬 조회 → {code: DataFrame}"""
+        def fetch(code):
             try:
-                df = fdr.DataReader(code, start_date, end_date)
-                if not df.empty and len(df) > 10:
-                    first = df['Close'].iloc[0]
-                    last = df['Close'].iloc[-1]
-                    ret = (last - first) / first
-                    avg_return += ret
-                    count += 1
-            except:
-                continue
+                return code, fdr.DataReader(code, start_date.strftime("%Y-%m-%d"), end_date.strftime("%Y-%m-%d"))
+            except Exception:
+                return code, None
 
-        if count == 0: return 1.0 # 데이터 없으면 중립
-        
-        sector_trend = avg_return / count
-        # 조정 계수: -20% ~ +20% 사이로 캡(Cap) 적용 (안전장치)
-        adjustment = max(0.8, min(1.2, 1.0 + sector_trend))
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(tickers)))) as executor:
+            results = list(executor.map(fetch, tickers))
         
-        print(f"      👉 {target_key} Trend: {sector_trend*100:.1f}% -> Adj Factor: {adjustment:.2f}x")
-        return adjustment
\ No newline at end of file
+        return {code: df for code, df in results if df is not None and not df.empty}
\ No newline at end of file
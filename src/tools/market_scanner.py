@@ -7,18 +7,30 @@ This module calculates Adjusted Beta using:
 2. Linear regression (Covariance/Variance method)
 3. Blume's Adjustment: Adj Beta = 0.67 * Raw Beta + 0.33
 
+[Batch Mode]
+Peer 그룹 전체 + 시장지수를 한 번의 multi-ticker download 로 수집,
+수익률 행렬 (T × N) 에 대해 Raw/Adj Beta, R², 표준오차를 한 번에 계산
+
+[Beta Surface]
+일봉 1회 다운로드 → 주봉/월봉 리샘플 → 누적합(cumsum) 으로 전 구간 rolling beta 계산
+(윈도우별 회귀 반복 없음, tidy table 반환)
+
 [Data Source]
 - yfinance: Yahoo Finance API wrapper
 - Market Index: ^KS11 (KOSPI) for Korean stocks
+- Local Store: vault/cache/prices (PriceStore, 증분 업데이트)
 """
 
 import logging
 import warnings
+from functools import partial
 import numpy as np
 import pandas as pd
-from typing import Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
 
+from .price_store import PriceStore
+
 # Suppress yfinance warnings
 warnings.filterwarnings('ignore', category=FutureWarning)
 logging.getLogger('yfinance').setLevel(logging.ERROR)
@@ -46,22 +58,33 @@ class MarketScanner:
     - Ticker format: [6-digit code].KS (e.g., 005930.KS for Samsung)
     """
     
+    # Rolling window per frequency (beta_surface default)
+    SURFACE_WINDOWS = {'1d': 252, '1wk': 104, '1mo': 24}
+    
+    # Daily → weekly / monthly resampling rule
+    RESAMPLE_RULES = {'1d': None, '1wk': 'W-FRI', '1mo': 'ME'}
+    
     def __init__(
         self, 
         market_index: str = "^KS11",
         lookback_years: int = 5,
-        frequency: str = "1mo"
+        frequency: str = "1mo",
+        store: Optional[PriceStore] = None,
+        use_store: bool = True
     ):
         """
         Args:
             market_index: Market benchmark ticker (default: KOSPI)
             lookback_years: Historical data period (default: 5 years)
             frequency: Data frequency ('1d', '1wk', '1mo')
+            store: Price history store (default: shared vault/cache/prices)
+            use_store: False면 매번 yfinance 에서 전체 이력 다운로드
         """
         self.market_index = market_index
         self.lookback_years = lookback_years
         self.frequency = frequency
         self.min_data_points = 24  # Minimum 2 years of monthly data
+        self.store = store or (PriceStore() if use_store else None)
         
         # Cache for performance
         self._market_returns_cache = None
@@ -110,43 +133,27 @@ class MarketScanner:
         Returns:
             Series of returns, or None if failed
         """
-        try:
-            # Download data
-            data = yf.download(
-                ticker, 
-                start=start_date, 
-                end=end_date, 
-                interval=self.frequency,
-                progress=False,
-                show_errors=False
+        prices = self._download_prices([ticker], start_date, end_date)
+        
+        if prices is None:
+            logging.warning(f"Failed to fetch data for {ticker}")
+            return None
+        
+        prices = prices[ticker].dropna()
+        
+        if len(prices) < self.min_data_points:
+            logging.warning(
+                f"Insufficient data for {ticker}: {len(prices)} points "
+                f"(minimum: {self.min_data_points})"
             )
-            
-            if data.empty or len(data) < self.min_data_points:
-                logging.warning(
-                    f"Insufficient data for {ticker}: {len(data)} points "
-                    f"(minimum: {self.min_data_points})"
-                )
-                return None
-            
-            # Calculate returns
-            if 'Adj Close' in data.columns:
-                prices = data['Adj Close']
-            elif 'Close' in data.columns:
-                prices = data['Close']
-            else:
-                logging.error(f"No price data found for {ticker}")
-                return None
-            
-            returns = prices.pct_change().dropna()
-            
-            if len(returns) < self.min_data_points:
-                return None
-            
-            return returns
+            return None
         
-        except Exception as e:
-            logging.warning(f"Failed to fetch data for {ticker}: {e}")
+        returns = prices.pct_change().dropna()
+        
+        if len(returns) < self.min_data_points:
             return None
+        
+        return returns
     
     def _get_market_returns(self) -> Optional[pd.Series]:
         """
@@ -319,33 +326,402 @@ class MarketScanner:
         
         return adjusted_beta, "Live"
     
+    def _download_history(
+        self, 
+        tickers: List[str], 
+        start_date: datetime, 
+        end_date: datetime,
+        interval: Optional[str] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Download price history for several tickers in one request
+        
+        Args:
+            tickers: Normalized tickers
+            start_date: Start date
+            end_date: End date
+            interval: Bar interval (default: self.frequency)
+        
+        Returns:
+            {ticker: DataFrame with 'Adj Close' / 'Close' columns}
+        """
+        data = yf.download(
+            tickers, 
+            start=start_date, 
+            end=end_date, 
+            interval=interval or self.frequency,
+            auto_adjust=False,
+            group_by='column',
+            progress=False
+        )
+        
+        if data is None or data.empty:
+            return {}
+        
+        if not isinstance(data.columns, pd.MultiIndex):
+            # 단일 티커 응답 (구버전 yfinance)
+            data = pd.concat({tickers[0]: data}, axis=1).swaplevel(axis=1)
+        
+        fields = [f for f in ('Adj Close', 'Close') if f in data.columns.get_level_values(0)]
+        if not fields:
+            logging.error("No price data found in batch download")
+            return {}
+        
+        history = {}
+        for ticker in tickers:
+            if ticker not in data.columns.get_level_values(1):
+                continue
+            frame = data.xs(ticker, axis=1, level=1)[fields].dropna(how='all')
+            if not frame.empty:
+                history[ticker] = frame
+        
+        return history
+    
+    def _download_prices(
+        self, 
+        tickers: List[str], 
+        start_date: datetime, 
+        end_date: datetime,
+        interval: Optional[str] = None
+    ) -> Optional[pd.DataFrame]:
+        """
+        Price matrix for several tickers (local store first, one download for the rest)
+        
+        Args:
+            tickers: Normalized tickers (market index included)
+            start_date: Start date
+            end_date: End date
+            interval: Bar interval (default: self.frequency)
+        
+        Returns:
+            DataFrame (index: date, columns: ticker), or None if failed
+        """
+        interval = interval or self.frequency
+        fetch = partial(self._download_history, interval=interval)
+        
+        try:
+            if self.store:
+                history = self.store.get_histories(
+                    tickers, start_date, end_date, fetch,
+                    source='yfinance', interval=interval
+                )
+            else:
+                history = fetch(tickers, start_date, end_date)
+        except Exception as e:
+            logging.warning(f"Failed to fetch data for {len(tickers)} tickers: {e}")
+            return None
+        
+        if not history:
+            return None
+        
+        prices = pd.DataFrame({
+            ticker: frame['Adj Close'] if 'Adj Close' in frame.columns else frame['Close']
+            for ticker, frame in history.items()
+        })
+        
+        return prices.reindex(columns=tickers)
+    
+    def _calculate_beta_matrix(
+        self, 
+        stock_returns: pd.DataFrame, 
+        market_returns: pd.Series
+    ) -> pd.DataFrame:
+        """
+        OLS of every stock column on the market in one pass
+        
+        β = Σ(dx·dy) / Σdx²,  R² = Σ(dx·dy)² / (Σdx² · Σdy²)
+        SE(β) = sqrt( [Σdy² - β·Σ(dx·dy)] / (n-2) / Σdx² )
+        
+        종목별로 (종목, 시장) 둘 다 존재하는 날짜만 사용
+        → 종목별 inner join 후 회귀한 결과와 동일
+        
+        Args:
+            stock_returns: Returns matrix (index: date, columns: ticker)
+            market_returns: Market return series
+        
+        Returns:
+            DataFrame (index: ticker) with raw_beta, adjusted_beta, r_squared, std_error, n_obs
+            (데이터 부족 종목은 NaN)
+        """
+        y = stock_returns.to_numpy(dtype=float)
+        x = market_returns.reindex(stock_returns.index).to_numpy(dtype=float)[:, None]
+        
+        mask = ~np.isnan(y) & ~np.isnan(x)
+        n = mask.sum(axis=0)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x_masked = np.where(mask, x, 0.0)
+            y_masked = np.where(mask, y, 0.0)
+            dx = np.where(mask, x_masked - x_masked.sum(axis=0) / n, 0.0)
+            dy = np.where(mask, y_masked - y_masked.sum(axis=0) / n, 0.0)
+            
+            sxx = (dx * dx).sum(axis=0)
+            syy = (dy * dy).sum(axis=0)
+            sxy = (dx * dy).sum(axis=0)
+            
+            raw_beta = sxy / sxx
+            r_squared = sxy ** 2 / (sxx * syy)
+            std_error = np.sqrt(np.maximum(syy - raw_beta * sxy, 0.0) / (n - 2) / sxx)
+        
+        valid = (n >= self.min_data_points) & (sxx > 0)
+        
+        result = pd.DataFrame(
+            {
+                'raw_beta': raw_beta,
+                'adjusted_beta': self._apply_blume_adjustment(raw_beta),
+                'r_squared': r_squared,
+                'std_error': std_error,
+            },
+            index=stock_returns.columns
+        )
+        result.loc[~valid, :] = np.nan
+        result['n_obs'] = n
+        
+        return result
+    
+    def _calculate_rolling_beta_matrix(
+        self, 
+        stock_returns: pd.DataFrame, 
+        market_returns: pd.Series,
+        window: int,
+        step: int = 1,
+        min_periods: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Rolling OLS for every stock column and every window in one pass
+        
+        [Cumulative Sums]
+        n, Σx, Σy, Σx², Σy², Σxy 를 시간축 누적합으로 만든 뒤
+        윈도우 합 = C[t] - C[t - window] → 모든 (윈도우, 종목) 을 행렬 연산 1회로 계산
+        (열별 평균을 먼저 빼서 누적합 상쇄 오차 완화, 공분산은 이동 불변)
+        
+        Args:
+            stock_returns: Returns matrix (index: date, columns: ticker)
+            market_returns: Market return series
+            window: Window length in periods
+            step: Stride between window ends (마지막 윈도우는 항상 포함)
+            min_periods: Minimum paired observations per window (default: window)
+        
+        Returns:
+            Tidy DataFrame: ticker, end_date, raw_beta, adjusted_beta, r_squared, std_error, n_obs
+        """
+        min_periods = min_periods or window
+        
+        y = stock_returns.to_numpy(dtype=float)
+        x = market_returns.reindex(stock_returns.index).to_numpy(dtype=float)[:, None]
+        mask = ~np.isnan(y) & ~np.isnan(x)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            counts = mask.sum(axis=0)
+            x_centered = np.where(mask, x - np.nanmean(np.where(mask, x, np.nan), axis=0), 0.0)
+            y_centered = np.where(mask, y - np.nanmean(np.where(mask, y, np.nan), axis=0), 0.0)
+        
+        terms = np.stack([
+            mask.astype(float),
+            x_centered,
+            y_centered,
+            x_centered * x_centered,
+            y_centered * y_centered,
+            x_centered * y_centered,
+        ])
+        cumulative = np.concatenate(
+            [np.zeros((len(terms), 1, y.shape[1])), np.cumsum(terms, axis=1)],
+            axis=1
+        )
+        
+        n_periods = len(stock_returns)
+        ends = np.arange(n_periods - 1, window - 2, -step)[::-1]
+        if len(ends) == 0 or not counts.any():
+            return pd.DataFrame(columns=['ticker', 'end_date', 'raw_beta', 'adjusted_beta', 'r_squared', 'std_error', 'n_obs'])
+        
+        n, sx, sy, sxx, syy, sxy = cumulative[:, ends + 1] - cumulative[:, ends + 1 - window]
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sxx_c = sxx - sx * sx / n
+            syy_c = syy - sy * sy / n
+            sxy_c = sxy - sx * sy / n
+            
+            raw_beta = sxy_c / sxx_c
+            r_squared = sxy_c ** 2 / (sxx_c * syy_c)
+            std_error = np.sqrt(np.maximum(syy_c - raw_beta * sxy_c, 0.0) / (n - 2) / sxx_c)
+        
+        n = np.rint(n).astype(int)
+        invalid = (n < max(min_periods, 3)) | ~(sxx_c > 0)
+        for values in (raw_beta, r_squared, std_error):
+            values[invalid] = np.nan
+        
+        n_windows, n_stocks = raw_beta.shape
+        return pd.DataFrame({
+            'ticker': np.tile(stock_returns.columns.to_numpy(), n_windows),
+            'end_date': np.repeat(stock_returns.index.to_numpy()[ends], n_stocks),
+            'raw_beta': raw_beta.ravel(),
+            'adjusted_beta': self._apply_blume_adjustment(raw_beta).ravel(),
+            'r_squared': r_squared.ravel(),
+            'std_error': std_error.ravel(),
+            'n_obs': n.ravel(),
+        })
+    
+    def beta_surface(
+        self, 
+        tickers: List[str],
+        windows: Optional[Dict[str, int]] = None,
+        step: int = 1,
+        min_periods: Optional[Dict[str, int]] = None
+    ) -> pd.DataFrame:
+        """
+        Rolling multi-frequency beta surface (audit trail for the WACC beta)
+        
+        [Process]
+        1. 일봉 1회 다운로드 (peer 전체 + 시장지수, PriceStore 경유)
+        2. 주봉(W-FRI) / 월봉(ME) 종가로 리샘플
+        3. 주기별 rolling beta 를 누적합 커널로 일괄 계산
+        
+        Args:
+            tickers: List of ticker symbols
+            windows: {frequency: window periods} (default: SURFACE_WINDOWS
+                     → 252 trading days / 104 weeks / 24 months)
+            step: Stride between windows in periods of each frequency
+            min_periods: {frequency: minimum observations} (default: full window)
+        
+        Returns:
+            Tidy DataFrame (one row per ticker × frequency × window end):
+                ticker, frequency, window, end_date,
+                raw_beta, adjusted_beta, r_squared, std_error, n_obs
+        """
+        windows = windows or self.SURFACE_WINDOWS
+        min_periods = min_periods or {}
+        
+        tickers = [t for t in tickers if t]
+        normalized = {t: self._normalize_korean_ticker(t) for t in tickers}
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * self.lookback_years)
+        
+        symbols = list(dict.fromkeys([self.market_index, *normalized.values()]))
+        prices = self._download_prices(symbols, start_date, end_date, interval='1d')
+        
+        columns = ['ticker', 'frequency', 'window', 'end_date', 'raw_beta', 'adjusted_beta', 'r_squared', 'std_error', 'n_obs']
+        if prices is None or prices[self.market_index].count() == 0:
+            logging.warning(f"Failed to fetch market data for {self.market_index}")
+            return pd.DataFrame(columns=columns)
+        
+        prices.index = pd.DatetimeIndex(prices.index)
+        frames = []
+        
+        for frequency, window in windows.items():
+            rule = self.RESAMPLE_RULES[frequency]
+            sampled = prices if rule is None else prices.resample(rule).last()
+            returns = sampled.ffill().pct_change(fill_method=None).where(sampled.notna())
+            
+            rolled = self._calculate_rolling_beta_matrix(
+                returns.drop(columns=self.market_index),
+                returns[self.market_index],
+                window,
+                step=step,
+                min_periods=min_periods.get(frequency)
+            )
+            rolled['frequency'] = frequency
+            rolled['window'] = window
+            frames.append(rolled)
+        
+        surface = pd.concat(frames, ignore_index=True)
+        
+        # 정규화 티커 → 입력 티커
+        inputs = pd.DataFrame({'ticker': tickers, 'symbol': [normalized[t] for t in tickers]})
+        surface = inputs.merge(surface.rename(columns={'ticker': 'symbol'}), on='symbol', how='inner')
+        
+        return surface[columns].reset_index(drop=True)
+    
+    def calculate_betas(self, tickers: List[str]) -> pd.DataFrame:
+        """
+        Batch beta calculation (1 download + 1 matrix regression)
+        
+        Args:
+            tickers: List of ticker symbols (e.g., ["005930", "000660.KS"])
+        
+        Returns:
+            DataFrame indexed by input ticker:
+                raw_beta, adjusted_beta, r_squared, std_error, n_obs
+            (실패 종목은 NaN, n_obs = 0)
+        """
+        tickers = [t for t in tickers if t]
+        normalized = {t: self._normalize_korean_ticker(t) for t in tickers}
+        
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365 * self.lookback_years)
+        
+        symbols = list(dict.fromkeys([self.market_index, *normalized.values()]))
+        prices = self._download_prices(symbols, start_date, end_date)
+        
+        columns = ['raw_beta', 'adjusted_beta', 'r_squared', 'std_error', 'n_obs']
+        if prices is None or prices[self.market_index].count() <= self.min_data_points:
+            logging.warning(f"Failed to fetch market data for {self.market_index}")
+            empty = pd.DataFrame(np.nan, index=tickers, columns=columns)
+            empty['n_obs'] = 0
+            return empty
+        
+        # 종목별 결측 구간은 직전 가격 기준 수익률 (개별 다운로드 후 pct_change 와 동일)
+        returns = prices.ffill().pct_change(fill_method=None).where(prices.notna())
+        
+        stats = self._calculate_beta_matrix(
+            returns.drop(columns=self.market_index),
+            returns[self.market_index]
+        )
+        
+        result = stats.reindex([normalized[t] for t in tickers])
+        result.index = tickers
+        result['n_obs'] = result['n_obs'].fillna(0).astype(int)
+        
+        return result[columns]
+    
     def get_beta_batch(
         self, 
         tickers: list, 
         apply_blume: bool = True,
-        fallback_beta: float = 1.0
+        fallback_beta: Union[float, Dict[str, float]] = 1.0
     ) -> dict:
         """
-        Get betas for multiple tickers (sequential processing)
+        Get betas for multiple tickers (single download, vectorized regression)
         
         Args:
             tickers: List of ticker symbols
             apply_blume: Apply Blume's adjustment
-            fallback_beta: Fallback value
+            fallback_beta: Fallback value (float or {ticker: value})
         
         Returns:
-            {ticker: {"beta": float, "source": str}}
+            {ticker: {"beta": float, "source": str, "raw_beta": float,
+                      "r_squared": float, "std_error": float}}
         """
+        stats = self.calculate_betas(tickers)
         results = {}
         
-        for ticker in tickers:
-            if not ticker:
+        for ticker, row in stats.iterrows():
+            if pd.isna(row['raw_beta']):
+                fallback = fallback_beta.get(ticker, 1.0) if isinstance(fallback_beta, dict) else fallback_beta
+                logging.warning(
+                    f"Beta calculation failed for {ticker}, "
+                    f"using fallback beta: {fallback}"
+                )
+                results[ticker] = {
+                    "beta": fallback,
+                    "source": "Fallback",
+                    "raw_beta": None,
+                    "r_squared": None,
+                    "std_error": None
+                }
                 continue
             
-            beta, source = self.get_beta(ticker, apply_blume, fallback_beta)
+            beta = row['adjusted_beta'] if apply_blume else row['raw_beta']
+            logging.info(
+                f"✅ {ticker}: Raw Beta = {row['raw_beta']:.3f}, "
+                f"Beta = {beta:.3f}, R² = {row['r_squared']:.3f}"
+            )
             results[ticker] = {
-                "beta": beta,
-                "source": source
+                "beta": float(beta),
+                "source": "Live",
+                "raw_beta": float(row['raw_beta']),
+                "r_squared": float(row['r_squared']),
+                "std_error": float(row['std_error'])
             }
         
         return results
@@ -1,107 +1,300 @@
+import os
+import re
+import json
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-import re
+
+from .price_store import trading_day
+
+SEARCH_URL = "https://finance.naver.com/search/searchList.naver"
+ITEM_URL = "https://finance.naver.com/item/main.naver"
+
+
+def _default_cache_file():
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'cache', 'naver_multiples.json')
+
 
 class NaverStockScout:
-    def __init__(self):
+    """
+    네이버 금융 동일업종비교 PER 스크레이퍼
+    
+    [Cache]
+    - 기업명 → 종목코드: 영구 저장
+    - 종목코드 → 평균 PER / 비상장(검색 실패): 거래일 단위 (다음 거래일에 폐기)
+    - vault/cache/naver_multiples.json 에 저장 → 인스턴스/프로세스 간 공유
+    
+    [Batch]
+    prefetch(names): asyncio + Semaphore 로 동시 요청 수 제한,
+    pooled Session 위에서 검색/종목 페이지를 병렬 조회
+    """
+    
+    # 섹터별 대표주 매핑
+    PROXY_MAP = {
+        "Bio": "삼성바이오로직스",
+        "IT": "NAVER",
+        "Game": "크래프톤",
+        "Consumer": "아모레퍼시픽",
+        "Manufacturing": "LG에너지솔루션",
+        "Finance": "KB금융",
+        "Logistics": "CJ대한통운"
+    }
+    
+    _lock = threading.Lock()
+    _memory = {}  # {cache_file: cache dict} (프로세스 내 공유)
+
+    def __init__(self, max_concurrency=8, timeout=5, cache_file=None, use_cache=True):
+        """
+        Args:
+            max_concurrency: prefetch 동시 요청 수
+            timeout: 요청별 타임아웃 (초)
+            cache_file: 캐시 파일 경로 (default: vault/cache/naver_multiples.json)
+            use_cache: False면 매번 네이버 조회
+        """
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.cache_file = (cache_file or _default_cache_file()) if use_cache else None
+        if not use_cache:
+            self._memory = {}  # 인스턴스 전용 (저장 안 함)
+        
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+    def _cache(self):
+        """현재 거래일 캐시 (거래일이 바뀌면 PER / 검색 실패 기록 폐기)"""
+        today = trading_day()
+        
+        with self._lock:
+            cache = self._memory.get(self.cache_file)
+            
+            if cache is None and self.cache_file and os.path.exists(self.cache_file):
+                try:
+                    with open(self.cache_file, 'r', encoding='utf-8') as f:
+                        cache = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"   ⚠️ NaverStock cache unreadable, starting fresh: {e}")
+            
+            if cache is None:
+                cache = {'trading_day': today, 'codes': {}, 'unlisted': [], 'multiples': {}}
+            if cache['trading_day'] != today:
+                cache = {'trading_day': today, 'codes': cache['codes'], 'unlisted': [], 'multiples': {}}
+            
+            self._memory[self.cache_file] = cache
+            return cache
+
+    def _save_cache(self):
+        if not self.cache_file:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.cache_file), exist_ok=True)
+            tmp_file = f"{self.cache_file}.{threading.get_ident()}.tmp"
+            with self._lock:
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(self._memory[self.cache_file], f, ensure_ascii=False)
+            os.replace(tmp_file, self.cache_file)
+        except OSError as e:
+            print(f"   ⚠️ Could not save NaverStock cache: {e}")
+
+    # ------------------------------------------------------------------
+    # Fetch / Parse
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _clean_name(target_name):
+        """이름 정제 (주식회사 등 제거)"""
+        return re.sub(r'\(.*?\)|주식회사|\(주\)', '', target_name).strip()
+
+    @staticmethod
+    def _parse_code(html):
+        """검색 결과 테이블에서 첫 번째 종목 코드 추출"""
+        soup = BeautifulSoup(html, 'html.parser')
+        td = soup.select_one('td.tit > a')
+        if td:
+            href = td['href']
+            # href format: /item/main.naver?code=005930
+            return href.split('=')[-1]
+        return None
+
+    @staticmethod
+    def _parse_peer_pers(html):
+        """'동일업종비교' 테이블의 PER 행 → 유효 PER 리스트 (섹션 없으면 None)"""
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        # '동일업종비교' 섹션 찾기
+        compare_div = soup.select_one('div.section.trade_compare')
+        if not compare_div: return None
+        
+        # 테이블 행(Rows) 추출
+        rows = compare_div.select('table.tbl_home tr')
+        
+        pers = []
+        # 테이블을 순회하며 'PER' 행을 찾음
+        for row in rows:
+            th = row.select_one('th')
+            if th and 'PER' in th.text:
+                tds = row.select('td')
+                for td in tds:
+                    try:
+                        # 쉼표 제거 후 float 변환
+                        txt = td.text.replace(',', '').strip()
+                        if not txt or txt == 'N/A': continue
+                        val = float(txt)
+                        
+                        # 유효한 PER만 수집 (0 이하, 200 이상 아웃라이어 제외)
+                        if 0 < val < 200: 
+                            pers.append(val)
+                    except: pass
+                break
+        return pers
 
     def _get_code(self, company_name):
-        """기업명으로 네이버 종목코드 검색"""
+        """기업명으로 네이버 종목코드 검색 (None: 비상장 / 검색 실패)"""
+        cache = self._cache()
+        if company_name in cache['codes']:
+            return cache['codes'][company_name]
+        if company_name in cache['unlisted']:
+            return None
+        
+        code = None
         try:
             # 검색 페이지
-            url = f"https://finance.naver.com/search/searchList.naver?query={company_name}"
-            res = requests.get(url, headers=self.headers, timeout=5)
-            soup = BeautifulSoup(res.text, 'html.parser')
-            
-            # 검색 결과 테이블에서 첫 번째 종목 코드 추출
-            td = soup.select_one('td.tit > a')
-            if td:
-                href = td['href']
-                # href format: /item/main.naver?code=005930
-                code = href.split('=')[-1]
-                return code
+            res = self.session.get(SEARCH_URL, params={'query': company_name}, timeout=self.timeout)
+            code = self._parse_code(res.text)
+        except requests.RequestException:
+            return None  # 네트워크 오류는 캐시하지 않음
         except: pass
-        return None
+        
+        with self._lock:
+            if code:
+                cache['codes'][company_name] = code
+            else:
+                cache['unlisted'].append(company_name)
+        return code
 
+    def _fetch_multiple(self, code):
+        """종목 메인 페이지 → 평균 PER (거래일 캐시)"""
+        cache = self._cache()
+        if code in cache['multiples']:
+            return cache['multiples'][code]
+        
+        try:
+            # 종목 메인 페이지
+            res = self.session.get(ITEM_URL, params={'code': code}, timeout=self.timeout)
+            pers = self._parse_peer_pers(res.text)
+        except Exception as e:
+            print(f"      ⚠️ Peer Error: {e}")
+            return None  # 오류는 캐시하지 않음
+        
+        result = None
+        if pers:
+            # 평균 PER 계산
+            result = {"PER": sum(pers) / len(pers), "Peers_Count": len(pers)}
+        
+        with self._lock:
+            cache['multiples'][code] = result
+        return result
+
+    def _lookup(self, target_name):
+        """기업명 → (정제명, 종목코드, 멀티플) (print 없음)"""
+        clean_name = self._clean_name(target_name)
+        code = self._get_code(clean_name)
+        if not code:
+            return clean_name, None, None
+        return clean_name, code, self._fetch_multiple(code)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
     def get_market_multiple(self, target_name):
         """
         [Main] 기업명 -> 네이버 검색 -> 동일업종비교 -> 평균 PER 산출
         """
-        # 이름 정제 (주식회사 등 제거)
-        clean_name = re.sub(r'\(.*?\)|주식회사|\(주\)', '', target_name).strip()
-        
-        code = self._get_code(clean_name)
+        clean_name, code, result = self._lookup(target_name)
         if not code:
             # 상장사가 아니면 None 반환 (Proxy 로직으로 넘어감)
             return None
-
+        
         print(f"   🔎 NaverStock: Tracking Peers for '{clean_name}' ({code})...")
         
-        try:
-            # 종목 메인 페이지
-            url = f"https://finance.naver.com/item/main.naver?code={code}"
-            res = requests.get(url, headers=self.headers)
-            soup = BeautifulSoup(res.text, 'html.parser')
-            
-            # '동일업종비교' 섹션 찾기
-            compare_div = soup.select_one('div.section.trade_compare')
-            if not compare_div: return None
-            
-            # 테이블 행(Rows) 추출
-            rows = compare_div.select('table.tbl_home tr')
-            
-            pers = []
-            # 테이블을 순회하며 'PER' 행을 찾음
-            for row in rows:
-                th = row.select_one('th')
-                if th and 'PER' in th.text:
-                    tds = row.select('td')
-                    for td in tds:
-                        try:
-                            # 쉼표 제거 후 float 변환
-                            txt = td.text.replace(',', '').strip()
-                            if not txt or txt == 'N/A': continue
-                            val = float(txt)
-                            
-                            # 유효한 PER만 수집 (0 이하, 200 이상 아웃라이어 제외)
-                            if 0 < val < 200: 
-                                pers.append(val)
-                        except: pass
-                    break
-            
-            if not pers: return None
-            
-            # 평균 PER 계산
-            avg_per = sum(pers) / len(pers)
-            print(f"      📊 Live Peer PER (Avg): {avg_per:.2f}x (Based on {len(pers)} peers)")
-            
-            return {"PER": avg_per, "Peers_Count": len(pers)}
-
-        except Exception as e:
-            print(f"      ⚠️ Peer Error: {e}")
-            return None
+        if result:
+            print(f"      📊 Live Peer PER (Avg): {result['PER']:.2f}x (Based on {result['Peers_Count']} peers)")
+        
+        self._save_cache()
+        return result
 
     def get_proxy_multiple(self, sector_keyword):
         """
         비상장사를 위해 섹터 대표주(Proxy)의 PER를 가져옴
         """
-        # 섹터별 대표주 매핑
-        proxy_map = {
-            "Bio": "삼성바이오로직스",
-            "IT": "NAVER",
-            "Game": "크래프톤",
-            "Consumer": "아모레퍼시픽",
-            "Manufacturing": "LG에너지솔루션",
-            "Finance": "KB금융",
-            "Logistics": "CJ대한통운"
-        }
-        
-        proxy_name = proxy_map.get(sector_keyword)
+        proxy_name = self.PROXY_MAP.get(sector_keyword)
         if not proxy_name: return 15.0 # Fallback Default
         
         print(f"   🔄 NaverStock: Using Proxy '{proxy_name}' for sector '{sector_keyword}'")
         data = self.get_market_multiple(proxy_name)
-        return data['PER'] if data else 15.0
\ No newline at end of file
+        return data['PER'] if data else 15.0
+
+    async def fetch_market_multiples(self, target_names):
+        """
+        여러 기업 PER 동시 조회 (async)
+        
+        - asyncio.Semaphore(max_concurrency) 로 동시 요청 수 제한
+        - 요청은 pooled Session 위에서 전용 스레드 풀로 실행 (요청별 timeout)
+        
+        Returns:
+            {target_name: {"PER", "Peers_Count"} or None}
+        """
+        names = list(dict.fromkeys(target_names))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        loop = asyncio.get_running_loop()
+        
+        with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+            async def lookup(name):
+                async with semaphore:
+                    _, _, result = await loop.run_in_executor(executor, self._lookup, name)
+                    return result
+            
+            results = await asyncio.gather(*(lookup(name) for name in names))
+        
+        self._save_cache()
+        return dict(zip(names, results))
+
+    def prefetch(self, target_names, include_proxies=True):
+        """
+        여러 기업 PER 일괄 조회 (캐시 워밍, 동기 호출용)
+        
+        이후 get_market_multiple / get_proxy_multiple 은 당일 캐시에서 응답
+        
+        Args:
+            target_names: 기업명 리스트
+            include_proxies: 섹터 대표주(PROXY_MAP)도 함께 조회
+        
+        Returns:
+            {target_name: {"PER", "Peers_Count"} or None}
+        """
+        names = list(target_names)
+        if include_proxies:
+            names += list(self.PROXY_MAP.values())
+        
+        print(f"   🔎 NaverStock: Prefetching {len(names)} companies (x{self.max_concurrency})...")
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.fetch_market_multiples(names))
+        
+        # 이벤트 루프 안에서 호출된 경우 (예: Telegram 핸들러) 별도 스레드에서 실행
+        with ThreadPoolExecutor(max_workers=1) as runner:
+            return runner.submit(asyncio.run, self.fetch_market_multiples(names)).result()
@@ -0,0 +1,279 @@
+"""
+Price History Store
+
+[Purpose]
+yfinance / FinanceDataReader 가격 이력을 종목별 Feather (Arrow IPC) 파일로 저장하여
+매 요청마다 5년치 이력을 재다운로드하지 않도록 함
+
+[Layout]
+<root>/<source>_<interval>/<ticker>.feather
+- schema metadata: start (저장 구간 시작일), fetched_at (마지막 다운로드 일자)
+
+[Update]
+- 오늘 이미 받은 종목: 네트워크 호출 없음 (memory-mapped 읽기)
+- 그 외: 마지막 완성 봉(끝에서 두 번째)부터만 증분 다운로드 (마지막 봉은 미완성일 수 있어 덮어씀)
+- 재기준 감지: 겹치는 완성 봉의 가격이 달라졌으면 (배당/분할 후 Adj Close 재계산)
+  기존 이력과 이어 붙이지 않고 전체 재다운로드 → 접합일의 가짜 수익률 방지
+- 요청 시작일이 저장 구간보다 앞서면 전체 재다운로드
+- 갱신 대상 종목은 fetch 함수 1회 호출로 묶어서 조회
+
+[Offline]
+offline=True 또는 PRICE_STORE_OFFLINE=1 → 저장된 데이터만 반환 (테스트용)
+"""
+
+import os
+import re
+import threading
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+KST = timezone(timedelta(hours=9))
+MARKET_OPEN_HOUR = 9
+
+# fetch(tickers, start, end) -> {ticker: DataFrame (index: date)}
+FetchMany = Callable[[List[str], datetime, datetime], Dict[str, pd.DataFrame]]
+
+# 재기준 비교 대상 (없으면 공통 숫자 컬럼 전체)
+PRICE_COLUMNS = ('Adj Close', 'Close')
+REBASE_RTOL = 1e-6
+
+
+def _default_root() -> str:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'cache', 'prices')
+
+
+def trading_day(now: Optional[datetime] = None) -> str:
+    """
+    기준 거래일 (KST, 일 단위 캐시 키)
+    - 평일 09시 이후: 당일 / 그 외: 직전 평일 (공휴일은 무시)
+    """
+    now = now or datetime.now(KST)
+    day = now.date()
+    if now.weekday() >= 5 or now.hour < MARKET_OPEN_HOUR:
+        day -= timedelta(days=1)
+        while day.weekday() >= 5:
+            day -= timedelta(days=1)
+    return day.isoformat()
+
+
+class PriceStore:
+    """
+    종목별 가격 이력 로컬 저장소 (프로세스/인스턴스 간 공유)
+    
+    [Usage]
+    store = PriceStore()
+    frames = store.get_histories(["005930.KS", "^KS11"], start, end, fetch, source='yfinance', interval='1mo')
+    """
+    
+    def __init__(self, root: Optional[str] = None, offline: Optional[bool] = None):
+        """
+        Args:
+            root: 저장 디렉토리 (default: vault/cache/prices)
+            offline: True면 네트워크 호출 없이 저장된 데이터만 사용
+                     (default: PRICE_STORE_OFFLINE 환경변수)
+        """
+        self.root = root or _default_root()
+        if offline is None:
+            offline = os.getenv("PRICE_STORE_OFFLINE", "").lower() in ("1", "true", "yes")
+        self.offline = offline
+        
+        self.hits = 0
+        self.fetches = 0
+        self._lock = threading.Lock()
+    
+    def _path(self, ticker: str, source: str, interval: str) -> str:
+        safe = re.sub(r'[^0-9A-Za-z._-]', '_', ticker)
+        return os.path.join(self.root, f"{source}_{interval}", f"{safe}.feather")
+    
+    def load(self, ticker: str, source: str, interval: str):
+        """
+        저장된 이력 조회 (memory-mapped)
+        
+        Returns:
+            (DataFrame, start, fetched_at) 또는 None
+        """
+        path = self._path(ticker, source, interval)
+        if not PYARROW_AVAILABLE or not os.path.exists(path):
+            return None
+        
+        try:
+            table = feather.read_table(path, memory_map=True)
+            meta = table.schema.metadata or {}
+            frame = table.to_pandas().set_index('Date')
+            start = pd.Timestamp(meta[b'start'].decode())
+            fetched_at = pd.Timestamp(meta[b'fetched_at'].decode())
+        except Exception as e:
+            print(f"   ⚠️ Price store unreadable ({ticker}), refetching: {e}")
+            return None
+        
+        return frame, start, fetched_at
+    
+    def save(self, ticker: str, source: str, interval: str, frame: pd.DataFrame, start: pd.Timestamp):
+        """이력 저장 (임시 파일 → rename)"""
+        if not PYARROW_AVAILABLE:
+            return
+        
+        path = self._path(ticker, source, interval)
+        table = pa.Table.from_pandas(frame.rename_axis('Date').reset_index(), preserve_index=False)
+        table = table.replace_schema_metadata({
+            'start': start.isoformat(),
+            'fetched_at': pd.Timestamp.now().normalize().isoformat(),
+        })
+        
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_file = f"{path}.{threading.get_ident()}.tmp"
+            feather.write_feather(table, tmp_file, compression='uncompressed')
+            os.replace(tmp_file, path)
+        except OSError as e:
+            print(f"   ⚠️ Could not save price history ({ticker}): {e}")
+    
+    def get_histories(
+        self,
+        tickers: List[str],
+        start: datetime,
+        end: datetime,
+        fetch: FetchMany,
+        source: str,
+        interval: str = '1d'
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        가격 이력 조회 (저장소 우선, 부족분만 다운로드)
+        
+        Args:
+            tickers: 종목 리스트
+            start: 조회 시작일
+            end: 조회 종료일
+            fetch: 다운로드 함수 fetch(tickers, start, end) -> {ticker: DataFrame}
+            source: 데이터 출처 ('yfinance', 'fdr')
+            interval: 봉 주기 ('1d', '1mo' 등)
+        
+        Returns:
+            {ticker: DataFrame (index: date, start~end 구간)}
+            (조회 실패 종목은 제외)
+        """
+        start = pd.Timestamp(start).normalize()
+        end = pd.Timestamp(end)
+        today = pd.Timestamp.now().normalize()
+        
+        stored = {t: self.load(t, source, interval) for t in dict.fromkeys(tickers)}
+        
+        # 갱신 대상: {ticker: 다운로드 시작일}
+        stale = {}
+        for ticker, entry in stored.items():
+            if entry is None:
+                stale[ticker] = start
+                continue
+            frame, stored_start, fetched_at = entry
+            if stored_start > start or frame.empty:
+                stale[ticker] = start
+            elif fetched_at < today and frame.index[-1] < end:
+                # 완성 봉 1개 이상 재요청 → 재기준 여부 확인용 겹침 구간
+                stale[ticker] = frame.index[-2] if len(frame) > 1 else frame.index[-1]
+        
+        if stale and not self.offline:
+            rebased = self._update(stale, stored, start, end, today, fetch, source, interval)
+            if rebased:
+                print(f"   🔄 Price history re-based (dividend/split), full refetch: {rebased}")
+                # 재다운로드 실패 시 기존 이력 (단일 기준) 유지
+                self._update({ticker: start for ticker in rebased}, stored, start, end, today, fetch, source, interval, full=True)
+        
+        with self._lock:
+            self.hits += len(stored) - len(stale)
+        
+        return {
+            ticker: entry[0].loc[start:end]
+            for ticker, entry in stored.items()
+            if entry is not None and not entry[0].empty
+        }
+    
+    def _update(self, stale, stored, start, end, today, fetch, source, interval, full=False) -> List[str]:
+        """
+        stale 종목 일괄 다운로드 후 저장 (stored 갱신)
+        
+        Args:
+            full: True 면 기존 이력과 이어 붙이지 않고 교체 (재기준 후 재다운로드)
+        
+        Returns:
+            재기준 감지로 이어 붙이지 못한 종목 (전체 재다운로드 필요)
+        """
+        fetch_start = min(stale.values())
+        try:
+            fetched = fetch(list(stale), fetch_start.to_pydatetime(), end.to_pydatetime())
+        except Exception as e:
+            print(f"   ⚠️ Price download failed, using stored history: {e}")
+            fetched = {}
+        
+        with self._lock:
+            self.fetches += 1
+        
+        rebased = []
+        for ticker in stale:
+            new = fetched.get(ticker)
+            if new is None or new.empty:
+                continue
+            
+            new = new.copy()
+            new.index = pd.DatetimeIndex(new.index).tz_localize(None)
+            entry = stored[ticker]
+            
+            if not full and entry is not None and entry[1] <= start:
+                # 증분: 새로 받은 구간이 기존 이력을 덮어씀 (같은 기준일 때만)
+                old, stored_start, _ = entry
+                if self._is_rebased(old, new):
+                    rebased.append(ticker)
+                    continue
+                frame = pd.concat([old[old.index < new.index[0]], new])
+            else:
+                frame, stored_start = new, start
+            
+            self.save(ticker, source, interval, frame, min(stored_start, start))
+            stored[ticker] = (frame, stored_start, today)
+        
+        return rebased
+    
+    @staticmethod
+    def _is_rebased(old: pd.DataFrame, new: pd.DataFrame) -> bool:
+        """
+        겹치는 완성 봉 (old 의 마지막 봉 제외) 가격 비교
+        
+        다르면 (배당/분할 후 조정가격 재계산) True, 겹치는 봉이 없어 확인할 수 없어도 True
+        """
+        overlap = old.index[:-1].intersection(new.index)
+        if overlap.empty:
+            return True
+        
+        columns = [c for c in PRICE_COLUMNS if c in old.columns and c in new.columns]
+        if not columns:
+            columns = [
+                c for c in old.columns.intersection(new.columns)
+                if pd.api.types.is_numeric_dtype(old[c]) and pd.api.types.is_numeric_dtype(new[c])
+            ]
+        
+        before = old.loc[overlap, columns].to_numpy(dtype=float)
+        after = new.loc[overlap, columns].to_numpy(dtype=float)
+        return not np.allclose(before, after, rtol=REBASE_RTOL, atol=0.0, equal_nan=True)
+    
+    def get_history(
+        self,
+        ticker: str,
+        start: datetime,
+        end: datetime,
+        fetch: FetchMany,
+        source: str,
+        interval: str = '1d'
+    ) -> Optional[pd.DataFrame]:
+        """단일 종목 get_histories"""
+        return self.get_histories([ticker], start, end, fetch, source, interval).get(ticker)
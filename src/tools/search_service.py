@@ -0,0 +1,282 @@
+"""
+Shared Web Search Service (DuckDuckGo)
+
+[Purpose]
+ZULU / BRAVO / X-RAY / SmartIngestor 의 DuckDuckGo 검색을 한 곳으로 모음
+- 영구 TTL 캐시 (SQLite): TTL 안에 같은 검색어 재조회 시 네트워크 호출 0회 (/run 재실행, 에이전트 간 중복 검색 등)
+- 요청 병합 (coalescing): 동시에 들어온 동일 검색은 1회만 실행, 나머지는 결과 공유
+  (진행 중인 요청의 max_results 가 더 작으면 병합하지 않고 별도 조회)
+- 전역 토큰 버킷: 호출부별 time.sleep 대신 프로세스 전체 호출 속도 제한
+
+[Key]
+(query, region, timelimit, mode)
+- 저장된 결과 수(max_results)보다 많이 요청하면 miss 처리
+
+[TTL]
+- text: 24시간 / news: 6시간
+- 빈 결과: 1시간 (검색 실패/차단은 저장하지 않음)
+- 호출별 ttl 인자로 재정의 (예: 최신 뉴스가 필요한 알림은 짧게, ttl=0 이면 항상 새로 조회)
+"""
+
+import os
+import json
+import time
+import sqlite3
+import threading
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+try:
+    from ddgs import DDGS
+except ImportError:
+    from duckduckgo_search import DDGS
+
+
+DEFAULT_TTL = {'text': 24 * 3600, 'news': 6 * 3600}
+DEFAULT_EMPTY_TTL = 3600
+
+
+def _default_path() -> str:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'cache', 'search_results.sqlite')
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한 (스레드 안전): 초당 rate 개, 최대 burst 개 연속 허용"""
+    
+    def __init__(self, rate: float = 1.0, burst: int = 3):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """토큰 1개 소비 (부족하면 충전될 때까지 대기)"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+class SearchService:
+    """
+    DuckDuckGo 검색 (캐시 + 요청 병합 + 속도 제한)
+    
+    [Usage]
+    search = get_search_service()
+    results = search.text("삼성전자 실적", region='kr-kr', timelimit='y', max_results=5)
+    results = search.news("로봇 매각", region='kr-kr', timelimit='m', ttl=3600)
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        use_cache: bool = True,
+        ttl: Optional[Dict[str, float]] = None,
+        empty_ttl: float = DEFAULT_EMPTY_TTL,
+        rate: float = 1.0,
+        burst: int = 3
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (default: vault/cache/search_results.sqlite)
+            use_cache: False 면 항상 DuckDuckGo 직접 호출 (병합/속도 제한은 유지)
+            ttl: 모드별 유효기간 (초)
+            empty_ttl: 빈 결과 유효기간 (초)
+            rate: 초당 허용 검색 수 (전역 토큰 버킷)
+            burst: 연속 허용 검색 수
+        """
+        self.path = (path or _default_path()) if use_cache else None
+        self.ttl = dict(DEFAULT_TTL, **(ttl or {}))
+        self.empty_ttl = empty_ttl
+        self.limiter = TokenBucket(rate, burst)
+        
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[tuple, Tuple[Future, int]] = {}
+        
+        if self.path:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS results (
+                        query TEXT NOT NULL,
+                        region TEXT NOT NULL,
+                        timelimit TEXT NOT NULL,
+                        mode TEXT NOT NULL,
+                        max_results INTEGER NOT NULL,
+                        payload TEXT NOT NULL,
+                        fetched_at REAL NOT NULL,
+                        PRIMARY KEY (query, region, timelimit, mode)
+                    )
+                    """
+                )
+    
+    @contextmanager
+    def _connect(self):
+        # 호출마다 새 연결 → 스레드 간 공유 문제 없음
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    # ------------------------------------------------------------------
+    # Public API (DDGS 와 같은 시그니처)
+    # ------------------------------------------------------------------
+    def text(
+        self,
+        query: str,
+        region: str = 'kr-kr',
+        timelimit: Optional[str] = None,
+        max_results: int = 5,
+        ttl: Optional[float] = None
+    ) -> List[Dict]:
+        return self.search(query, 'text', region, timelimit, max_results, ttl)
+    
+    def news(
+        self,
+        query: str,
+        region: str = 'kr-kr',
+        timelimit: Optional[str] = None,
+        max_results: int = 5,
+        ttl: Optional[float] = None
+    ) -> List[Dict]:
+        return self.search(query, 'news', region, timelimit, max_results, ttl)
+    
+    def search(
+        self,
+        query: str,
+        mode: str = 'text',
+        region: str = 'kr-kr',
+        timelimit: Optional[str] = None,
+        max_results: int = 5,
+        ttl: Optional[float] = None
+    ) -> List[Dict]:
+        """
+        검색 결과 조회 (캐시 → 진행 중인 동일 요청 → DuckDuckGo)
+        
+        Args:
+            ttl: 이번 호출에서 허용할 캐시 최대 경과 시간 (초, None = 모드별 기본값)
+        
+        Returns:
+            [{'title', 'body'/'href'/'url', ...}] (검색 실패 시 [])
+        """
+        key = (query, region, timelimit or '', mode)
+        
+        cached = self._get(key, max_results, ttl)
+        if cached is not None:
+            return cached
+        
+        with self._lock:
+            inflight = self._inflight.get(key)
+            # 진행 중인 요청이 이번 요청만큼 결과를 가져올 때만 병합
+            if inflight is not None and inflight[1] >= max_results:
+                self.coalesced += 1
+                future = inflight[0]
+                owner = False
+            else:
+                future = Future()
+                self._inflight[key] = (future, max_results)
+                owner = True
+        
+        if not owner:
+            return future.result()[:max_results]
+        
+        results = None
+        try:
+            results = self._fetch(query, mode, region, timelimit, max_results)
+            if results is not None:
+                self._put(key, max_results, results)
+        finally:
+            with self._lock:
+                if self._inflight.get(key, (None,))[0] is future:
+                    del self._inflight[key]
+            future.set_result(results or [])
+        return results or []
+    
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced}
+    
+    def invalidate(self):
+        """캐시 전체 삭제"""
+        if self.path:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM results")
+    
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _fetch(self, query, mode, region, timelimit, max_results) -> Optional[List[Dict]]:
+        """DuckDuckGo 호출 (실패 시 None → 캐시하지 않음)"""
+        self.limiter.acquire()
+        try:
+            with DDGS() as ddgs:
+                method = ddgs.news if mode == 'news' else ddgs.text
+                return list(method(query, region=region, timelimit=timelimit, max_results=max_results) or [])
+        except Exception as e:
+            print(f"   ⚠️ Search Error ({mode}: {query}): {e}")
+            return None
+    
+    def _get(self, key, max_results, ttl=None) -> Optional[List[Dict]]:
+        row = None
+        if self.path:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT max_results, payload, fetched_at FROM results "
+                    "WHERE query = ? AND region = ? AND timelimit = ? AND mode = ?",
+                    key
+                ).fetchone()
+        
+        results = None
+        if row:
+            stored_max, payload, fetched_at = row
+            results = json.loads(payload)
+            if ttl is None:
+                ttl = self.ttl.get(key[3], DEFAULT_TTL['text']) if results else self.empty_ttl
+            # 적게 저장된 결과로 더 많은 요청을 채울 수 없음 (빈 결과 제외)
+            if time.time() - fetched_at > ttl or (stored_max < max_results and len(results) >= stored_max):
+                results = None
+        
+        with self._lock:
+            if results is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return results[:max_results]
+    
+    def _put(self, key, max_results, results):
+        if not self.path:
+            return
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (*key, max_results, json.dumps(results, ensure_ascii=False), time.time())
+            )
+
+
+_shared_service = None
+_shared_lock = threading.Lock()
+
+
+def get_search_service() -> SearchService:
+    """프로세스 공용 SearchService (캐시/요청 병합/속도 제한 공유)"""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            _shared_service = SearchService()
+        return _shared_service
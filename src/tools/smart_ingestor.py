@@ -17,11 +17,7 @@ import re
 from typing import Dict, Optional
 from .dart_reader import DartReader
 from src.utils.llm_handler import LLMHandler
-
-try:
-    from ddgs import DDGS
-except ImportError:
-    from duckduckgo_search import DDGS
+from .search_service import get_search_service
 
 
 class SmartFinancialIngestor:
@@ -34,6 +30,7 @@ class SmartFinancialIngestor:
     def __init__(self):
         self.dart = DartReader()
         self.llm = LLMHandler()
+        self.search = get_search_service()
     
     def ingest(self, company_name: str) -> Dict:
         """
@@ -159,16 +156,15 @@ class SmartFinancialIngestor:
             query = f"{company_name} 매출 영업이익 2024 실적"
             
             context = ""
-            with DDGS() as ddgs:
-                results = ddgs.text(query, region='kr-kr', timelimit='y', max_results=5)
-                if not results:
-                    return {
-                        "success": False,
-                        "reason": "No search results found"
-                    }
-                
-                for res in results:
-                    context += f"- {res.get('title', '')}: {res.get('body', '')}\n"
+            results = self.search.text(query, region='kr-kr', timelimit='y', max_results=5)
+            if not results:
+                return {
+                    "success": False,
+                    "reason": "No search results found"
+                }
+            
+            for res in results:
+                context += f"- {res.get('title', '')}: {res.get('body', '')}\n"
             
             if not context:
                 return {
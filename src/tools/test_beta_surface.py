@@ -0,0 +1,130 @@
+"""
+Test Market Scanner - Rolling Beta Surface
+
+Usage:
+    python -m src.tools.test_beta_surface
+"""
+
+import sys
+import os
+import time
+import numpy as np
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools import market_scanner
+from src.tools.market_scanner import MarketScanner
+
+
+PEERS = ["005930", "000660", "035720"]
+
+
+def _daily_prices(seed=11):
+    """5년 일봉 (종목별 베타가 중간에 변하도록 생성, 한 종목은 상장 16개월차)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.bdate_range(end=pd.Timestamp.now().normalize(), periods=1250)
+    
+    market = rng.normal(0.0003, 0.01, len(dates))
+    drift = np.linspace(0.6, 1.4, len(dates))
+    stocks = np.column_stack([
+        0.8 * market + rng.normal(0, 0.01, len(dates)),
+        drift * market + rng.normal(0, 0.015, len(dates)),
+        1.5 * market + rng.normal(0, 0.02, len(dates)),
+    ])
+    
+    prices = pd.DataFrame(
+        100 * np.cumprod(1 + np.column_stack([market, stocks]), axis=0),
+        index=dates,
+        columns=["^KS11"] + [f"{t}.KS" for t in PEERS]
+    )
+    prices.iloc[:900, -1] = np.nan
+    return prices
+
+
+def _naive_beta(returns, ticker, end, window):
+    """윈도우 1개 = pandas 회귀 1회 (비교 기준)"""
+    frame = returns[[f"{ticker}.KS", "^KS11"]].loc[:end].iloc[-window:].dropna()
+    return frame.iloc[:, 0].cov(frame.iloc[:, 1]) / frame.iloc[:, 1].var()
+
+
+def test_surface_matches_naive_regressions():
+    """Cumulative-sum rolling betas equal one regression per window, for every frequency"""
+    print("=" * 70)
+    print("🧪 Testing Beta Surface")
+    print("=" * 70)
+    
+    prices = _daily_prices()
+    downloads = []
+    
+    def download(tickers, **kwargs):
+        downloads.append(kwargs.get('interval'))
+        return pd.concat({'Adj Close': prices.reindex(columns=tickers)}, axis=1)
+    
+    original = market_scanner.yf.download
+    market_scanner.yf.download = download
+    
+    try:
+        scanner = MarketScanner(use_store=False)
+        start = time.perf_counter()
+        surface = scanner.beta_surface(PEERS)
+        elapsed = time.perf_counter() - start
+    finally:
+        market_scanner.yf.download = original
+    
+    summary = surface.dropna().groupby(['ticker', 'frequency'])['raw_beta'].agg(['last', 'mean', 'min', 'max', 'count'])
+    print(f"\n   {len(surface):,} rows in {elapsed * 1000:.0f} ms (downloads: {downloads})")
+    print(summary.round(3).to_string())
+    
+    assert downloads == ['1d']
+    assert set(surface['frequency']) == {'1d', '1wk', '1mo'}
+    
+    for frequency, rule in MarketScanner.RESAMPLE_RULES.items():
+        sampled = prices if rule is None else prices.resample(rule).last()
+        returns = sampled.pct_change()
+        window = MarketScanner.SURFACE_WINDOWS[frequency]
+        
+        rows = surface[(surface['frequency'] == frequency) & surface['raw_beta'].notna()]
+        for _, row in rows.sample(20, random_state=0).iterrows():
+            expected = _naive_beta(returns, row['ticker'], row['end_date'], window)
+            assert abs(row['raw_beta'] - expected) < 1e-8, (frequency, row['ticker'], row['end_date'])
+    
+    # 상장 16개월차 종목: 주봉 104주 / 월봉 24개월 윈도우 불가
+    assert ("035720", "1mo") not in summary.index
+    assert ("035720", "1wk") not in summary.index
+    assert ("035720", "1d") in summary.index
+    
+    # 베타 변화 추적: 초기 < 최근
+    drifting = surface[(surface['ticker'] == "000660") & (surface['frequency'] == '1d')].dropna()
+    assert drifting['raw_beta'].iloc[0] < 0.9 < 1.1 < drifting['raw_beta'].iloc[-1]
+    
+    print("\n   ✅ Rolling betas match per-window regressions")
+    print("=" * 70)
+
+
+def test_full_window_equals_batch_beta():
+    """A single window over the whole sample reproduces calculate_betas"""
+    rng = np.random.default_rng(3)
+    returns = pd.DataFrame(rng.normal(0, 0.05, (60, 4)), columns=list("ABCD"))
+    returns.iloc[[5, 17], 2] = np.nan
+    
+    scanner = MarketScanner(use_store=False)
+    full = scanner._calculate_rolling_beta_matrix(returns[list("ABC")], returns["D"], window=60, min_periods=24)
+    batch = scanner._calculate_beta_matrix(returns[list("ABC")], returns["D"])
+    
+    assert np.allclose(full['raw_beta'], batch['raw_beta'], atol=1e-12)
+    assert np.allclose(full['std_error'], batch['std_error'], atol=1e-12)
+    assert np.allclose(full['r_squared'], batch['r_squared'], atol=1e-12)
+
+
+if __name__ == "__main__":
+    try:
+        test_surface_matches_naive_regressions()
+        test_full_window_equals_batch_beta()
+        
+        print("\n✅ ALL BETA SURFACE TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
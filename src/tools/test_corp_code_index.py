@@ -0,0 +1,107 @@
+"""
+Test DART Corp Code Index
+
+Usage:
+    python -m src.tools.test_corp_code_index
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools.corp_code_index import CorpCodeIndex
+
+
+CORPS = [
+    ("00126380", "삼성전자"),
+    ("00252074", "삼성전자판매"),
+    ("00918444", "카카오"),
+    ("01133217", "카카오뱅크"),
+    ("00266961", "네이버(주)"),
+    ("00105624", "주식회사 모비릭스"),
+]
+
+
+def _write_xml(path, corps):
+    rows = "".join(
+        f"<list><corp_code>{code}</corp_code><corp_name>{name}</corp_name></list>"
+        for code, name in corps
+    )
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(f"<?xml version='1.0' encoding='UTF-8'?><result>{rows}</result>")
+
+
+def test_lookup_tiers():
+    """Exact → normalized → partial, XML order preserved"""
+    print("=" * 70)
+    print("🧪 Testing Corp Code Index Lookup")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = os.path.join(tmp, 'corp_code.xml')
+        _write_xml(xml_file, CORPS)
+        index = CorpCodeIndex.load(xml_file)
+        
+        assert index.lookup("삼성전자") == ("00126380", "삼성전자", "exact")
+        assert index.lookup("네이버") == ("00266961", "네이버(주)", "normalized")
+        assert index.lookup("모비릭스(주)") == ("00105624", "주식회사 모비릭스", "normalized")
+        
+        # 부분 일치: 입력 ⊂ 기업명 / 기업명 ⊂ 입력, XML 순서상 첫 번째
+        assert index.lookup("삼성전")[0] == "00126380"
+        assert index.lookup("카카오뱅크 본사")[0] == "00918444"
+        assert index.lookup("가") is None
+        assert index.lookup("없는회사") is None
+        
+        candidates = index.top_k("카카오뱅", k=2)
+        print(f"\n   top_k('카카오뱅'): {candidates}")
+        assert candidates[0][0] == "카카오뱅크"
+        
+        start = time.perf_counter()
+        for _ in range(10000):
+            index.lookup("삼성전자판매")
+        print(f"   Lookup: {(time.perf_counter() - start) / 10000 * 1e6:.1f} µs")
+    
+    print("   ✅ Lookup tiers OK")
+    print("=" * 70)
+
+
+def test_rebuild_on_xml_change():
+    """Index reloads from disk and rebuilds only when the XML changes"""
+    print("\n" + "=" * 70)
+    print("🧪 Testing Corp Code Index Persistence")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        xml_file = os.path.join(tmp, 'corp_code.xml')
+        _write_xml(xml_file, CORPS)
+        
+        first = CorpCodeIndex.load(xml_file)
+        assert os.path.exists(f"{xml_file}.idx.pkl")
+        assert CorpCodeIndex.load(xml_file) is first
+        
+        _write_xml(xml_file, CORPS + [("00999999", "신규상장")])
+        stat = os.stat(xml_file)
+        os.utime(xml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        second = CorpCodeIndex.load(xml_file)
+        assert second is not first
+        assert second.lookup("신규상장")[0] == "00999999"
+    
+    print("\n   ✅ Rebuilt after XML change")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_lookup_tiers()
+        test_rebuild_on_xml_change()
+        
+        print("\n✅ ALL CORP CODE INDEX TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
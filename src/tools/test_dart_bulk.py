@@ -0,0 +1,95 @@
+"""
+Test DART Bulk Multi-Company Fetch
+
+Usage:
+    python -m src.tools.test_dart_bulk
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools.dart_reader import DartReader
+from src.tools.dart_cache import DartStatementCache
+from src.tools.corp_code_index import CorpCodeIndex
+from src.tools.fake_http import fake_session_get
+
+
+N_CORPS = 250
+NAMES = [f"테스트기업{i:03d}" for i in range(N_CORPS)]
+CODES = [f"{i:08d}" for i in range(N_CORPS)]
+
+
+def _fake_multi(calls):
+    """짝수 기업: 2024 데이터 / 홀수 기업: 2023 데이터만, 첫 호출은 020 (요청 제한)"""
+    throttled = []
+    
+    def handler(url, params):
+        calls.append((params['bsns_year'], len(params['corp_code'].split(','))))
+        if not throttled:
+            throttled.append(True)
+            return {'status': '020', 'message': '요청 제한을 초과하였습니다.'}
+        
+        year = int(params['bsns_year'])
+        rows = []
+        for code in params['corp_code'].split(','):
+            i = int(code)
+            if (i % 2 == 0 and year == 2024) or (i % 2 == 1 and year == 2023):
+                rows += [
+                    {'corp_code': code, 'fs_div': 'CFS', 'account_nm': '매출액', 'thstrm_amount': f"{(i + 1) * 100000000:,}"},
+                    {'corp_code': code, 'fs_div': 'CFS', 'account_nm': '영업이익', 'thstrm_amount': f"{(i + 1) * 10000000:,}"},
+                ]
+        return {'status': '000' if rows else '013', 'list': rows}
+    return fake_session_get(handler)
+
+
+def test_bulk_fetch():
+    """250 companies → 3 calls per year, retry on 020, fallback year, cache reuse"""
+    print("=" * 70)
+    print("🧪 Testing DART Bulk Fetch (fnlttMultiAcnt)")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        reader = DartReader(cache=DartStatementCache(os.path.join(tmp, 'dart.sqlite')), min_interval=0, backoff=0)
+        reader.api_key = "x" * 40
+        reader.session.get = _fake_multi(calls)
+        reader._load_corp_index = lambda xml_file='corp_code.xml': CorpCodeIndex(NAMES, CODES)
+        
+        queries = NAMES[:-1] + [CODES[-1], "없는회사"]
+        df = reader.get_financial_summaries(queries, year=2024)
+        
+        print(f"\n   HTTP calls: {len(calls)} (incl. 1 retry) for {len(queries)} queries")
+        print(df.head(4).to_string(index=False))
+        
+        # 2024: 1 retry + 3 chunks (100/100/50), 2023: 1 chunk (125 odd)
+        assert [n for _, n in calls] == [100, 100, 100, 50, 100, 25]
+        assert len(df) == len(queries)
+        assert (df['status'] == 'ok').sum() == N_CORPS
+        assert df.iloc[-1]['status'] == 'not_found'
+        assert df.iloc[-2]['corp_name'] == NAMES[-1]
+        assert df.iloc[1]['bsns_year'] == '2023'
+        assert abs(df.iloc[1]['revenue_bn'] - 2.0) < 1e-9
+        
+        # 재조회: 데이터 / 보고서 없음(013) 모두 캐시 → HTTP 0회
+        calls.clear()
+        again = reader.get_financial_summaries(queries, year=2024)
+        assert calls == []
+        assert again.equals(df)
+    
+    print("\n   ✅ Bulk fetch OK")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_bulk_fetch()
+        
+        print("\n✅ ALL DART BULK TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,87 @@
+"""
+Test DART Statement Cache
+
+Usage:
+    python -m src.tools.test_dart_cache
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools.dart_reader import DartReader
+from src.tools.dart_cache import DartStatementCache
+from src.tools.fake_http import fake_session_get
+
+
+def _fake_dart(calls):
+    """작년 사업보고서만 존재, 나머지는 013"""
+    def handler(url, params):
+        calls.append((params['bsns_year'], params['reprt_code']))
+        if params['bsns_year'] == str(time.localtime().tm_year - 1) and params['reprt_code'] == '11011':
+            return {'status': '000', 'list': [
+                {'fs_div': 'CFS', 'account_nm': '매출액', 'thstrm_amount': '52,000,000,000'},
+                {'fs_div': 'CFS', 'account_nm': '영업이익', 'thstrm_amount': '7,500,000,000'},
+                {'fs_div': 'OFS', 'account_nm': '매출액', 'thstrm_amount': '40,000,000,000'},
+            ]}
+        return {'status': '013', 'message': '조회된 데이타가 없습니다.'}
+    return fake_session_get(handler)
+
+
+def test_repeat_lookup_hits_cache():
+    """Second valuation of the same target: zero network calls"""
+    print("=" * 70)
+    print("🧪 Testing DART Statement Cache")
+    print("=" * 70)
+    
+    calls = []
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = DartStatementCache(os.path.join(tmp, 'dart.sqlite'))
+        
+        reader = DartReader(cache=cache, concurrent=False)
+        reader.session.get = _fake_dart(calls)
+        reader.api_key = "x" * 40
+        reader._get_corp_code = lambda name: "00000001"
+        
+        first = reader.get_financial_summary("테스트")
+        first_calls = len(calls)
+        
+        # 새 인스턴스 (XrayValuation / SmartFinancialIngestor 와 동일 상황)
+        reader = DartReader(cache=DartStatementCache(cache.path), concurrent=False)
+        reader.session.get = _fake_dart(calls)
+        reader.api_key = "x" * 40
+        reader._get_corp_code = lambda name: "00000001"
+        
+        second = reader.get_financial_summary("테스트")
+        
+        print(f"\n   First run: {first_calls} API calls | Second run: {len(calls) - first_calls} API calls")
+        print(f"   Result: {second}")
+        
+        assert first_calls == 5  # 올해 4개 보고서(013) + 작년 사업보고서
+        assert len(calls) == first_calls
+        assert first == second
+        assert abs(second['revenue_bn'] - 520.0) < 1e-9
+        
+        # 013 (보고서 없음) 은 짧은 TTL 로 만료
+        cache.negative_ttl = 0
+        assert cache.get("00000001", str(time.localtime().tm_year), '11011') is None
+        assert cache.get("00000001", str(time.localtime().tm_year - 1), '11011')['status'] == '000'
+    
+    print("   ✅ Repeat lookup served from cache")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_repeat_lookup_hits_cache()
+        
+        print("\n✅ ALL DART CACHE TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
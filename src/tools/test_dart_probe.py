@@ -0,0 +1,123 @@
+"""
+Test DART Concurrent Report Probing
+
+Usage:
+    python -m src.tools.test_dart_probe
+"""
+
+import sys
+import os
+import time
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools.dart_reader import DartReader
+from src.tools.fake_http import fake_session_get
+
+
+YEAR = time.localtime().tm_year
+
+
+def _hit(amount):
+    return {'status': '000', 'list': [
+        {'fs_div': 'CFS', 'account_nm': '매출액', 'thstrm_amount': amount},
+        {'fs_div': 'CFS', 'account_nm': '영업이익', 'thstrm_amount': '1,000,000,000'},
+    ]}
+
+
+# (연도, 보고서) → (지연 초, 응답)
+SCENARIO = {
+    (str(YEAR), '11011'): (0.3, {'status': '013'}),        # 최우선: 느린 miss
+    (str(YEAR), '11014'): (0.05, _hit('30,000,000,000')),  # 2순위: 빠른 hit → 선택
+    (str(YEAR - 1), '11011'): (0.01, _hit('90,000,000,000')),  # 하위 순위 hit (무시)
+}
+SLOW_MISS = (1.5, {'status': '013'})
+
+
+def _fake_session_get(calls):
+    def handler(url, params):
+        key = (params['bsns_year'], params['reprt_code'])
+        calls.append(key)
+        delay, payload = SCENARIO.get(key, SLOW_MISS)
+        time.sleep(delay)
+        return payload
+    return fake_session_get(handler)
+
+
+def _reader(concurrent, calls):
+    reader = DartReader(use_cache=False, concurrent=concurrent)
+    reader.api_key = "x" * 40
+    reader._get_corp_code = lambda name: "00000001"
+    reader.session.get = _fake_session_get(calls)
+    return reader
+
+
+def test_concurrent_priority():
+    """Concurrent probe picks the same report as sequential, without waiting for slower lower-priority calls"""
+    print("=" * 70)
+    print("🧪 Testing Concurrent DART Probe")
+    print("=" * 70)
+
+    calls = []
+    start = time.perf_counter()
+    concurrent = _reader(True, calls).get_financial_summary("테스트")
+    concurrent_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sequential = _reader(False, []).get_financial_summary("테스트")
+    sequential_elapsed = time.perf_counter() - start
+
+    print(f"\n   Concurrent: {concurrent['source']} in {concurrent_elapsed:.2f}s")
+    print(f"   Sequential: {sequential['source']} in {sequential_elapsed:.2f}s")
+
+    assert concurrent == sequential
+    assert concurrent['period'] == f"{YEAR}.3Q"
+    assert concurrent_elapsed < 1.0  # 1.5초짜리 하위 순위 요청을 기다리지 않음
+    assert len(calls) == 4  # 올해 보고서 4종만 조회 (작년/재작년은 올해가 전부 miss 일 때만)
+
+    print("   ✅ Highest-priority report selected")
+    print("=" * 70)
+
+
+def test_next_year_only_after_misses():
+    """Next fiscal year is probed only when every report of the current year missed"""
+    calls = []
+    reader = _reader(True, calls)
+    
+    def handler(url, params):
+        calls.append((params['bsns_year'], params['reprt_code']))
+        if params['bsns_year'] == str(YEAR - 1) and params['reprt_code'] == '11011':
+            return _hit('90,000,000,000')
+        return {'status': '013'}
+    reader.session.get = fake_session_get(handler)
+    
+    result = reader.get_financial_summary("테스트")
+    
+    assert result['period'] == f"{YEAR - 1}.4Q(Year)"
+    assert sorted(calls[:4]) == sorted((str(YEAR), code) for code in ('11011', '11012', '11013', '11014'))
+    # 최우선 보고서 hit 후 같은 배치의 미시작 요청은 취소될 수 있음 → 상한만 확인
+    assert 4 < len(calls) <= 8
+    assert all(year != str(YEAR - 2) for year, _ in calls)
+
+
+def test_fatal_status_stops_search():
+    """Auth error (800) aborts the whole search"""
+    calls = []
+    reader = _reader(True, calls)
+    reader.session.get = fake_session_get(lambda url, params: {'status': '800', 'message': 'invalid key'})
+
+    assert reader.get_financial_summary("테스트") is None
+
+
+if __name__ == "__main__":
+    try:
+        test_concurrent_priority()
+        test_next_year_only_after_misses()
+        test_fatal_status_stops_search()
+
+        print("\n✅ ALL DART PROBE TESTS PASSED\n")
+
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,106 @@
+"""
+Test Market Scanner - Batch Beta Engine
+
+Usage:
+    python -m src.tools.test_market_beta_batch
+"""
+
+import sys
+import os
+import numpy as np
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools import market_scanner
+from src.tools.market_scanner import MarketScanner
+
+
+N_PEERS = 20
+TRUE_BETAS = np.linspace(0.4, 1.8, N_PEERS)
+PEERS = [f"{100000 + i:06d}" for i in range(N_PEERS)]
+
+
+def _synthetic_prices(seed=7, months=60):
+    """시장 + 20개 종목 월간 가격 (마지막 종목은 상장 2년차, 한 종목은 중간 결측)"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range("2020-01-01", periods=months, freq="MS")
+    
+    market = rng.normal(0.005, 0.05, months)
+    stocks = TRUE_BETAS[None, :] * market[:, None] + rng.normal(0, 0.04, (months, N_PEERS))
+    
+    prices = pd.DataFrame(
+        100 * np.cumprod(1 + np.column_stack([market, stocks]), axis=0),
+        index=dates,
+        columns=["^KS11"] + [f"{t}.KS" for t in PEERS]
+    )
+    prices.iloc[:45, -1] = np.nan           # 15개월 → 데이터 부족
+    prices.iloc[[10, 11, 30], 3] = np.nan   # 중간 결측
+    return prices
+
+
+def _fake_download(prices, calls):
+    def download(tickers, **kwargs):
+        calls.append(list(tickers))
+        frame = prices.reindex(columns=tickers)
+        return pd.concat({'Adj Close': frame, 'Close': frame}, axis=1)
+    return download
+
+
+def test_batch_matches_per_ticker():
+    """One download for the whole peer set; betas match the per-ticker regression"""
+    print("=" * 70)
+    print("🧪 Testing Batch Beta Engine")
+    print("=" * 70)
+    
+    prices = _synthetic_prices()
+    calls = []
+    original = market_scanner.yf.download
+    market_scanner.yf.download = _fake_download(prices, calls)
+    
+    try:
+        scanner = MarketScanner(use_store=False)
+        stats = scanner.calculate_betas(PEERS + ["INVALID"])
+        batch = scanner.get_beta_batch(PEERS, fallback_beta={PEERS[-1]: 0.9})
+    finally:
+        market_scanner.yf.download = original
+    
+    print(f"\n   Downloads: {len(calls)} per batch ({len(calls[0])} symbols)")
+    print(stats.head(5).round(4).to_string())
+    
+    assert len(calls) == 2
+    assert stats.loc["INVALID", 'n_obs'] == 0
+    assert batch[PEERS[-1]] == {"beta": 0.9, "source": "Fallback", "raw_beta": None, "r_squared": None, "std_error": None}
+    
+    market = prices["^KS11"].pct_change().dropna()
+    for ticker in PEERS[:-1]:
+        stock = prices[f"{ticker}.KS"].dropna().pct_change().dropna()
+        expected = scanner._calculate_raw_beta(stock, market)
+        
+        aligned = pd.concat([stock, market], axis=1, join='inner').to_numpy()
+        (slope, _), cov = np.polyfit(aligned[:, 1], aligned[:, 0], 1, cov=True)
+        
+        row = stats.loc[ticker]
+        assert abs(row['raw_beta'] - expected) < 1e-10
+        assert abs(row['raw_beta'] - slope) < 1e-10
+        assert abs(row['std_error'] - np.sqrt(cov[0, 0])) < 1e-10
+        assert abs(row['r_squared'] - np.corrcoef(aligned.T)[0, 1] ** 2) < 1e-10
+        assert abs(batch[ticker]['beta'] - (0.67 * expected + 0.33)) < 1e-10
+        assert batch[ticker]['source'] == "Live"
+    
+    assert stats.loc[PEERS[2], 'n_obs'] == 56
+    
+    print("\n   ✅ Batch betas match per-ticker regression")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_batch_matches_per_ticker()
+        
+        print("\n✅ ALL BATCH BETA TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
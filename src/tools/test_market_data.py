@@ -0,0 +1,112 @@
+"""
+Test Market Data - Sector Momentum Table
+
+Usage:
+    python -m src.tools.test_market_data
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+import numpy as np
+import pandas as pd
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools import market_data
+from src.tools.market_data import MarketDataTerminal
+from src.tools.price_store import PriceStore
+
+
+DELAY = 0.1
+
+
+def _fake_reader(calls, state):
+    """종목코드별 고정 추세 일봉 (192820 은 데이터 없음)"""
+    lock = threading.Lock()
+    
+    def reader(code, start, end):
+        with lock:
+            calls.append(code)
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(DELAY)
+        with lock:
+            state['active'] -= 1
+        
+        if code == "192820":
+            return pd.DataFrame(columns=['Close'])
+        dates = pd.bdate_range(end=pd.Timestamp(end), periods=40)
+        slope = (int(code) % 7 - 3) / 100
+        return pd.DataFrame({'Close': 10000 * (1 + slope * np.arange(40) / 39)}, index=dates)
+    return reader
+
+
+def _legacy_trend(reader, codes):
+    """기존 get_sector_momentum 루프와 동일한 계산"""
+    rets = []
+    for code in codes:
+        df = reader(code, None, pd.Timestamp.now().strftime("%Y-%m-%d"))
+        if not df.empty and len(df) > 10:
+            rets.append((df['Close'].iloc[-1] - df['Close'].iloc[0]) / df['Close'].iloc[0])
+    return sum(rets) / len(rets) if rets else None
+
+
+def test_factor_table():
+    """All sector baskets in one pooled fetch, memoized for the trading day"""
+    print("=" * 70)
+    print("🧪 Testing Sector Momentum Table")
+    print("=" * 70)
+    
+    calls, state = [], {'active': 0, 'peak': 0}
+    original = market_data.fdr.DataReader
+    market_data.fdr.DataReader = _fake_reader(calls, state)
+    MarketDataTerminal._factor_tables.clear()
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            terminal = MarketDataTerminal(store=PriceStore(tmp, offline=False))
+            
+            start = time.perf_counter()
+            table = terminal.get_factor_table()
+            elapsed = time.perf_counter() - start
+            
+            print(f"\n   {len(calls)} tickers fetched in {elapsed:.2f}s (peak concurrency: {state['peak']})")
+            print(table.round(4).to_string())
+            
+            n_tickers = len({c for codes in terminal.proxies.values() for c in codes})
+            assert sorted(calls) == sorted({c for codes in terminal.proxies.values() for c in codes})
+            assert 1 < state['peak'] <= 8
+            assert elapsed < n_tickers * DELAY / 2
+            
+            # 리드별 조회: 네트워크 0회, 새 인스턴스도 동일 테이블 사용
+            calls.clear()
+            factor = MarketDataTerminal(store=PriceStore(tmp, offline=True)).get_sector_momentum("화장품")
+            assert calls == []
+            
+            reader = _fake_reader([], {'active': 0, 'peak': 0})
+            for sector, codes in terminal.proxies.items():
+                expected = _legacy_trend(reader, codes)
+                assert abs(table.loc[sector, 'trend'] - expected) < 1e-12
+            assert table.loc["K-Beauty", 'tickers_used'] == 2
+            assert factor == max(0.8, min(1.2, 1.0 + table.loc["K-Beauty", 'trend']))
+    finally:
+        market_data.fdr.DataReader = original
+        MarketDataTerminal._factor_tables.clear()
+    
+    print("\n   ✅ Factor table OK")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_factor_table()
+        
+        print("\n✅ ALL MARKET DATA TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,133 @@
+"""
+Test NaverStock Concurrent Scraping
+
+Usage:
+    python -m src.tools.test_naver_stock
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+from datetime import datetime
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools import naver_stock
+from src.tools.naver_stock import NaverStockScout
+from src.tools.price_store import trading_day, KST
+from src.tools.fake_http import fake_session_get
+
+
+N_LEADS = 30
+DELAY = 0.1
+LEADS = [f"리드기업{i:02d}" for i in range(N_LEADS)]
+
+
+def _search_html(code):
+    if code is None:
+        return "<table></table>"
+    return f'<table><tr><td class="tit"><a href="/item/main.naver?code={code}">x</a></td></tr></table>'
+
+
+def _item_html(pers):
+    cells = "".join(f"<td>{p}</td>" for p in pers)
+    return (
+        '<div class="section trade_compare"><table class="tbl_home">'
+        f'<tr><th>PER(배)</th>{cells}</tr></table></div>'
+    )
+
+
+def _fake_get(calls, state):
+    """짝수 리드: 상장 (PER 10, 20, 300→제외) / 홀수 리드: 비상장"""
+    lock = threading.Lock()
+    
+    def handler(url, params):
+        with lock:
+            calls.append(url)
+            state['active'] += 1
+            state['peak'] = max(state['peak'], state['active'])
+        time.sleep(DELAY)
+        with lock:
+            state['active'] -= 1
+        
+        if url == naver_stock.SEARCH_URL:
+            name = params['query']
+            i = int(name[-2:]) if name.startswith("리드기업") else 0
+            return _search_html(f"{i:06d}" if i % 2 == 0 else None)
+        return _item_html(["10.0", "20.0", "300.0", "N/A"])
+    return fake_session_get(handler)
+
+
+def _scout(cache_file, calls, state):
+    scout = NaverStockScout(max_concurrency=8, cache_file=cache_file)
+    scout.session.get = _fake_get(calls, state)
+    return scout
+
+
+def test_prefetch_concurrent():
+    """30 leads with bounded parallelism, then served from the trading-day cache"""
+    print("=" * 70)
+    print("🧪 Testing NaverStock Prefetch")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'naver.json')
+        calls, state = [], {'active': 0, 'peak': 0}
+        
+        start = time.perf_counter()
+        results = _scout(cache_file, calls, state).prefetch(LEADS, include_proxies=False)
+        elapsed = time.perf_counter() - start
+        serial = len(calls) * DELAY
+        
+        print(f"\n   {len(calls)} requests in {elapsed:.2f}s (serial: {serial:.1f}s, peak concurrency: {state['peak']})")
+        
+        assert len(calls) == N_LEADS + N_LEADS // 2
+        assert state['peak'] <= 8
+        assert elapsed < serial / 3
+        assert results[LEADS[0]] == {"PER": 15.0, "Peers_Count": 2}
+        assert results[LEADS[1]] is None
+        
+        # 새 인스턴스 (다음 리드 처리): 네트워크 0회
+        calls.clear()
+        scout = _scout(cache_file, calls, state)
+        NaverStockScout._memory.clear()
+        assert scout.get_market_multiple(LEADS[2])["PER"] == 15.0
+        assert scout.get_market_multiple(LEADS[3]) is None
+        assert calls == []
+    
+    print("   ✅ Prefetch + cache OK")
+    print("=" * 70)
+
+
+def test_trading_day_rollover():
+    """PER and unlisted entries expire with the trading day; name → code mapping survives"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_file = os.path.join(tmp, 'naver.json')
+        calls, state = [], {'active': 0, 'peak': 0}
+        scout = _scout(cache_file, calls, state)
+        scout.get_market_multiple(LEADS[0])
+        
+        NaverStockScout._memory[cache_file]['trading_day'] = "2000-01-03"
+        calls.clear()
+        scout.get_market_multiple(LEADS[0])
+        assert calls == [naver_stock.ITEM_URL]
+    
+    # 월요일 08시 → 직전 금요일 / 토요일 → 금요일 / 평일 10시 → 당일
+    assert trading_day(datetime(2026, 10, 12, 8, tzinfo=KST)) == "2026-10-09"
+    assert trading_day(datetime(2026, 10, 10, 15, tzinfo=KST)) == "2026-10-09"
+    assert trading_day(datetime(2026, 10, 13, 10, tzinfo=KST)) == "2026-10-13"
+
+
+if __name__ == "__main__":
+    try:
+        test_prefetch_concurrent()
+        test_trading_day_rollover()
+        
+        print("\n✅ ALL NAVER STOCK TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,163 @@
+"""
+Test Price History Store
+
+Usage:
+    python -m src.tools.test_price_store
+"""
+
+import sys
+import os
+import tempfile
+import pandas as pd
+import pyarrow.feather as feather
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools import market_scanner
+from src.tools.price_store import PriceStore
+from src.tools.market_scanner import MarketScanner
+
+
+START = pd.Timestamp("2021-01-01")
+END = pd.Timestamp("2025-12-31")
+TICKERS = ["005930.KS", "000660.KS", "^KS11"]
+
+
+def _source(months):
+    dates = pd.date_range(START, periods=months, freq="MS")
+    return {
+        t: pd.DataFrame({'Close': [100.0 + i + k for k in range(months)]}, index=dates)
+        for i, t in enumerate(TICKERS)
+    }
+
+
+def _fake_fetch(source, calls):
+    def fetch(tickers, start, end):
+        calls.append((list(tickers), pd.Timestamp(start)))
+        return {t: source[t].loc[start:end] for t in tickers if t in source}
+    return fetch
+
+
+def _age(store, ticker, fetched_at):
+    """저장 파일의 fetched_at 을 과거로 변경 (다음 날 재실행 상황)"""
+    path = store._path(ticker, 'yfinance', '1mo')
+    table = feather.read_table(path)
+    meta = dict(table.schema.metadata)
+    meta[b'fetched_at'] = fetched_at.isoformat().encode()
+    feather.write_feather(table.replace_schema_metadata(meta), path, compression='uncompressed')
+
+
+def test_incremental_update():
+    """Cold fetch → same-day reuse → incremental fetch overlapping the stored bars → offline reads"""
+    print("=" * 70)
+    print("🧪 Testing Price Store")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(tmp, offline=False)
+        calls = []
+        
+        first = store.get_histories(TICKERS, START, END, _fake_fetch(_source(48), calls), source='yfinance', interval='1mo')
+        assert calls == [(TICKERS, START)]
+        assert all(len(frame) == 48 for frame in first.values())
+        
+        # 같은 날 재조회: 네트워크 0회
+        again = store.get_histories(TICKERS, START, END, _fake_fetch(_source(48), calls), source='yfinance', interval='1mo')
+        assert len(calls) == 1
+        assert again["005930.KS"].equals(first["005930.KS"])
+        
+        # 다음 날: 마지막 완성 봉부터 증분 조회 (신규 1개월, 겹침 봉으로 재기준 확인)
+        for ticker in TICKERS:
+            _age(store, ticker, pd.Timestamp.now().normalize() - pd.Timedelta(days=1))
+        source = _source(49)
+        source["005930.KS"].iloc[47] = 999.0  # 미완성 봉 수정
+        updated = store.get_histories(TICKERS, START, END, _fake_fetch(source, calls), source='yfinance', interval='1mo')
+        
+        last_bar = first["005930.KS"].index[-1]
+        print(f"\n   Fetch calls: {[(len(t), str(s.date())) for t, s in calls]}")
+        assert calls[1] == (TICKERS, first["005930.KS"].index[-2])
+        assert len(updated["005930.KS"]) == 49
+        assert updated["005930.KS"].loc[last_bar, 'Close'] == 999.0
+        assert updated["^KS11"].iloc[:47].equals(first["^KS11"].iloc[:47])
+        
+        # 오프라인: 저장분만 반환, 미보유 종목 제외
+        def _offline(*args):
+            raise AssertionError("network call in offline mode")
+        offline = PriceStore(tmp, offline=True)
+        frames = offline.get_histories(TICKERS + ["035720.KS"], START, END, _offline, source='yfinance', interval='1mo')
+        assert set(frames) == set(TICKERS)
+        assert frames["^KS11"].equals(updated["^KS11"])
+    
+    print("   ✅ Incremental update OK")
+    print("=" * 70)
+
+
+def test_dividend_rebase_refetches():
+    """Adjusted prices re-based between updates → full refetch instead of a spliced series"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PriceStore(tmp, offline=False)
+        calls = []
+        store.get_histories(TICKERS, START, END, _fake_fetch(_source(48), calls), source='yfinance', interval='1mo')
+        for ticker in TICKERS:
+            _age(store, ticker, pd.Timestamp.now().normalize() - pd.Timedelta(days=1))
+        
+        # 배당락: 이전 조정가격 전체가 2% 낮게 재계산됨
+        source = _source(49)
+        source["005930.KS"].iloc[:48] *= 0.98
+        updated = store.get_histories(TICKERS, START, END, _fake_fetch(source, calls), source='yfinance', interval='1mo')
+        
+        print(f"\n   Re-base fetch calls: {[(t, str(s.date())) for t, s in calls[1:]]}")
+        assert calls[2] == (["005930.KS"], START)
+        assert len(calls) == 3
+        assert updated["005930.KS"].equals(source["005930.KS"])
+        assert updated["^KS11"].equals(source["^KS11"])
+        
+        # 수익률에 가짜 점프 없음 (이어 붙였다면 마지막 달 +2% 왜곡)
+        returns = updated["005930.KS"]['Close'].pct_change().dropna()
+        expected = source["005930.KS"]['Close'].pct_change().dropna()
+        assert (returns - expected).abs().max() < 1e-12
+        
+        # 저장분도 새 기준으로 교체됨
+        offline = PriceStore(tmp, offline=True)
+        assert offline.get_histories(["005930.KS"], START, END, None, source='yfinance', interval='1mo')["005930.KS"].equals(source["005930.KS"])
+
+
+def test_scanner_uses_store():
+    """Second MarketScanner beta run is served from disk"""
+    dates = pd.date_range(end=pd.Timestamp.now(), periods=60, freq="MS")
+    source = {t: pd.DataFrame({'Close': [100.0 + (k % 7) * (i + 1) for k in range(60)]}, index=dates) for i, t in enumerate(TICKERS)}
+    downloads = []
+    
+    def download(tickers, **kwargs):
+        downloads.append(list(tickers))
+        frame = pd.DataFrame({t: source[t]['Close'] for t in tickers if t in source}).reindex(columns=tickers)
+        return pd.concat({'Adj Close': frame}, axis=1)
+    
+    original = market_scanner.yf.download
+    market_scanner.yf.download = download
+    
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            store = PriceStore(tmp, offline=False)
+            first = MarketScanner(store=store).calculate_betas(["005930", "000660"])
+            second = MarketScanner(store=store).calculate_betas(["005930", "000660"])
+    finally:
+        market_scanner.yf.download = original
+    
+    assert len(downloads) == 1
+    assert first.equals(second)
+    assert first['raw_beta'].notna().all()
+
+
+if __name__ == "__main__":
+    try:
+        test_incremental_update()
+        test_dividend_rebase_refetches()
+        test_scanner_uses_store()
+        
+        print("\n✅ ALL PRICE STORE TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,144 @@
+"""
+Test Shared Search Service
+
+Usage:
+    python -m src.tools.test_search_service
+"""
+
+import sys
+import os
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.tools import search_service
+from src.tools.search_service import SearchService, TokenBucket
+
+
+def _fake_ddgs(calls, latency=0.2):
+    class FakeDDGS:
+        def __enter__(self):
+            return self
+        
+        def __exit__(self, *args):
+            return False
+        
+        def _run(self, mode, query, max_results):
+            calls.append((mode, query))
+            time.sleep(latency)
+            if "없는" in query:
+                return []
+            if "차단" in query:
+                raise RuntimeError("202 Ratelimit")
+            return [{'title': f"{query} {i}", 'body': f"{mode} body {i}"} for i in range(max_results)]
+        
+        def text(self, query, region=None, timelimit=None, max_results=5):
+            return self._run('text', query, max_results)
+        
+        def news(self, query, region=None, timelimit=None, max_results=5):
+            return self._run('news', query, max_results)
+    return FakeDDGS
+
+
+def test_cache_and_coalescing():
+    """8 concurrent identical queries → 1 call; repeat across instances → 0 calls"""
+    print("=" * 70)
+    print("🧪 Testing Search Service")
+    print("=" * 70)
+    
+    calls = []
+    original = search_service.DDGS
+    search_service.DDGS = _fake_ddgs(calls)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'search.sqlite')
+            search = SearchService(path, rate=100, burst=10)
+            
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = list(pool.map(lambda _: search.text('"법인회생" 제조', timelimit='y', max_results=3), range(8)))
+            elapsed = time.perf_counter() - start
+            
+            print(f"\n   8 concurrent queries: {len(calls)} call(s) in {elapsed:.2f}s | {search.stats()}")
+            assert len(calls) == 1
+            assert all(r == results[0] for r in results) and len(results[0]) == 3
+            assert search.stats()['coalesced'] >= 1
+            
+            # 새 인스턴스 (다른 에이전트의 같은 검색): TTL 안이면 캐시 hit
+            again = SearchService(path).text('"법인회생" 제조', timelimit='y', max_results=2)
+            assert len(calls) == 1 and again == results[0][:2]
+            
+            # 키 구성: mode / timelimit 가 다르면 별도 조회, 더 많은 결과 요청은 재조회
+            search.news('"법인회생" 제조', timelimit='y', max_results=3)
+            search.text('"법인회생" 제조', timelimit='m', max_results=3)
+            search.text('"법인회생" 제조', timelimit='y', max_results=5)
+            assert len(calls) == 4
+            
+            # 빈 결과는 캐시, 오류는 캐시하지 않음
+            assert search.text("없는회사") == [] and search.text("없는회사") == []
+            assert search.text("차단") == [] and search.text("차단") == []
+            assert calls.count(('text', "없는회사")) == 1
+            assert calls.count(('text', "차단")) == 2
+            
+            # 호출별 ttl: 0 이면 캐시를 무시하고 새로 조회
+            search.text('"법인회생" 제조', timelimit='y', max_results=3, ttl=0)
+            assert calls.count(('text', '"법인회생" 제조')) == 4
+    finally:
+        search_service.DDGS = original
+    
+    print("   ✅ Cache + coalescing OK")
+    print("=" * 70)
+
+
+def test_coalescing_respects_max_results():
+    """A waiter asking for more results than the in-flight request fetches separately"""
+    calls = []
+    original = search_service.DDGS
+    search_service.DDGS = _fake_ddgs(calls, latency=0.3)
+    try:
+        search = SearchService(use_cache=False, rate=100, burst=10)
+        
+        def delayed(delay, max_results):
+            time.sleep(delay)
+            return search.text("로봇 매각", max_results=max_results)
+        
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            small = pool.submit(delayed, 0, 2)
+            large = pool.submit(delayed, 0.1, 5)
+            smaller = pool.submit(delayed, 0.15, 1)
+            small, large, smaller = small.result(), large.result(), smaller.result()
+        
+        print(f"\n   max_results 2 / 5 / 1: {len(calls)} call(s) | {search.stats()}")
+        assert (len(small), len(large), len(smaller)) == (2, 5, 1)
+        assert len(calls) == 2
+        assert search.stats()['coalesced'] == 1
+    finally:
+        search_service.DDGS = original
+
+
+def test_token_bucket():
+    """Burst passes immediately, then calls are paced at `rate` per second"""
+    bucket = TokenBucket(rate=20, burst=2)
+    start = time.perf_counter()
+    for _ in range(6):
+        bucket.acquire()
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n   6 acquisitions (burst 2, 20/s): {elapsed:.2f}s")
+    assert 0.18 <= elapsed < 0.35
+
+
+if __name__ == "__main__":
+    try:
+        test_cache_and_coalescing()
+        test_coalescing_respects_max_results()
+        test_token_bucket()
+        
+        print("\n✅ ALL SEARCH SERVICE TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,277 @@
+"""
+Job Queue (Multi-User Worker Pool)
+
+[Purpose]
+텔레그램 봇 작업(/run, /dcf, /struct_legacy)을 채팅당 1개 고정 대신
+우선순위 대기열 + 워커 풀로 실행
+- 워커 수 = 전체 동시 실행 작업 수 상한
+- 사용자(채팅)별 동시 실행 상한 → 초과 작업은 대기열에서 순서 대기
+- 우선순위: 숫자가 작을수록 먼저 (빠른 추정 /struct 가 전체 /run 보다 앞)
+- 같은 우선순위는 제출 순서 (FIFO)
+
+[Cancellation]
+cancel() 은 대기 작업을 대기열에서 제거하고,
+실행 중인 작업은 cancelled 이벤트 설정 + asyncio Task 취소
+→ 진행 중인 await (executor 호출, StageGraph 단계 대기) 가 즉시 중단되고 이후 단계는 시작되지 않음.
+스레드에서 이미 실행 중인 블로킹 호출은 강제 종료되지 않으므로(결과만 버림)
+장시간 루프는 job.is_cancelled() 를 직접 확인할 것.
+
+[Metrics]
+stats(): 대기열 깊이, 실행 중 작업 수, 대기시간 평균/p95/최대 (최근 작업 기준)
+"""
+
+import time
+import asyncio
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+# 작업 종류별 기본 우선순위 (작을수록 먼저)
+PRIORITIES = {
+    "struct": 0,
+    "dcf": 1,
+    "run": 2,
+}
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass
+class Job:
+    """
+    대기열 작업
+    
+    func(job) 는 코루틴을 반환하는 함수 (job.is_cancelled() 로 중단 여부 확인 가능)
+    """
+    id: int
+    chat_id: Any
+    kind: str
+    priority: int
+    func: Callable[["Job"], Awaitable[Any]]
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    status: str = PENDING
+    error: Optional[BaseException] = None
+    cancelled: threading.Event = field(default_factory=threading.Event, repr=False)
+    task: Optional[asyncio.Task] = field(default=None, repr=False)
+    
+    def is_cancelled(self) -> bool:
+        """스레드에서도 호출 가능 (threading.Event)"""
+        return self.cancelled.is_set()
+    
+    @property
+    def wait_seconds(self) -> float:
+        end = self.started_at if self.started_at is not None else time.time()
+        return end - self.submitted_at
+
+
+class JobQueue:
+    """
+    우선순위 작업 대기열 + asyncio 워커 풀
+    
+    [Usage]
+    queue = JobQueue(workers=4, per_user_limit=1)
+    queue.start()                                   # 실행 중인 이벤트 루프 안에서
+    job = queue.submit(chat_id, "run", lambda job: pipeline(update, query, job))
+    queue.position(job)                             # 1 = 다음 차례
+    queue.cancel(chat_id)                           # 해당 채팅 작업 전부 중단
+    queue.stats()                                   # 대기열 지표
+    """
+    
+    def __init__(self, workers: int = 4, per_user_limit: int = 1, history: int = 200):
+        """
+        Args:
+            workers: 동시에 실행할 수 있는 전체 작업 수
+            per_user_limit: 채팅별 동시 실행 작업 수
+            history: 대기시간 통계에 사용할 최근 작업 수
+        """
+        self.workers = max(1, int(workers))
+        self.per_user_limit = max(1, int(per_user_limit))
+        
+        self._pending: List[Job] = []
+        self._running: Dict[int, Job] = {}
+        self._ids = itertools.count(1)
+        self._waits = deque(maxlen=history)
+        self._counts = {DONE: 0, FAILED: 0, CANCELLED: 0}
+        self._cond: Optional[asyncio.Condition] = None
+        self._tasks: List[asyncio.Task] = []
+        self._closing = False
+    
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self):
+        """워커 시작 (이벤트 루프 안에서 호출, 중복 호출 무시)"""
+        if self._tasks:
+            return
+        self._closing = False
+        self._cond = asyncio.Condition()
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+    
+    async def shutdown(self):
+        """대기/실행 작업 전부 취소 후 워커 종료"""
+        self._closing = True
+        self.cancel()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+    
+    # ------------------------------------------------------------------
+    # Submit / Cancel
+    # ------------------------------------------------------------------
+    def submit(
+        self,
+        chat_id: Any,
+        kind: str,
+        func: Callable[[Job], Awaitable[Any]],
+        priority: Optional[int] = None
+    ) -> Job:
+        """
+        작업 등록
+        
+        Args:
+            kind: 'run' / 'dcf' / 'struct' (우선순위 미지정 시 PRIORITIES 사용)
+            func: job 을 받아 코루틴을 반환하는 함수
+        """
+        if priority is None:
+            priority = PRIORITIES.get(kind, max(PRIORITIES.values()) + 1)
+        job = Job(next(self._ids), chat_id, kind, priority, func)
+        self._pending.append(job)
+        self._notify()
+        return job
+    
+    def cancel(self, chat_id: Any = None, job_id: Optional[int] = None) -> int:
+        """
+        작업 취소 (chat_id / job_id 미지정 시 전체)
+        
+        Returns:
+            취소된 작업 수 (대기 + 실행 중)
+        """
+        def match(job):
+            return (chat_id is None or job.chat_id == chat_id) and (job_id is None or job.id == job_id)
+        
+        count = 0
+        for job in [j for j in self._pending if match(j)]:
+            self._pending.remove(job)
+            job.cancelled.set()
+            job.status = CANCELLED
+            job.finished_at = time.time()
+            self._counts[CANCELLED] += 1
+            count += 1
+        
+        for job in [j for j in self._running.values() if match(j)]:
+            job.cancelled.set()
+            if job.task:
+                job.task.cancel()
+            count += 1
+        
+        if count:
+            self._notify()
+        return count
+    
+    # ------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------
+    def active(self, chat_id: Any) -> int:
+        """채팅의 실행 중 작업 수"""
+        return sum(1 for job in self._running.values() if job.chat_id == chat_id)
+    
+    def jobs(self, chat_id: Any = None) -> List[Job]:
+        """실행 중 + 대기 작업 (대기 작업은 실행 예정 순서)"""
+        running = sorted(self._running.values(), key=lambda j: j.started_at)
+        pending = sorted(self._pending, key=lambda j: (j.priority, j.id))
+        return [j for j in running + pending if chat_id is None or j.chat_id == chat_id]
+    
+    def position(self, job: Job) -> int:
+        """대기 순번 (1 = 다음 차례, 0 = 실행 중/종료)"""
+        if job.status != PENDING:
+            return 0
+        return 1 + sum(1 for j in self._pending if (j.priority, j.id) < (job.priority, job.id))
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        대기열 지표
+        
+        Returns:
+            depth / running / workers / by_kind (대기 작업 종류별) /
+            wait_avg / wait_p95 / wait_max (최근 시작 작업 대기시간, 초) /
+            oldest_wait (현재 가장 오래 대기 중인 작업, 초) / done / failed / cancelled
+        """
+        waits = sorted(self._waits)
+        by_kind: Dict[str, int] = {}
+        for job in self._pending:
+            by_kind[job.kind] = by_kind.get(job.kind, 0) + 1
+        
+        return {
+            "depth": len(self._pending),
+            "running": len(self._running),
+            "workers": self.workers,
+            "by_kind": by_kind,
+            "wait_avg": sum(waits) / len(waits) if waits else 0.0,
+            "wait_p95": waits[min(len(waits) - 1, int(0.95 * len(waits)))] if waits else 0.0,
+            "wait_max": waits[-1] if waits else 0.0,
+            "oldest_wait": max((j.wait_seconds for j in self._pending), default=0.0),
+            "done": self._counts[DONE],
+            "failed": self._counts[FAILED],
+            "cancelled": self._counts[CANCELLED],
+        }
+    
+    # ------------------------------------------------------------------
+    # Worker
+    # ------------------------------------------------------------------
+    def _notify(self):
+        if self._cond is None:
+            return
+        
+        async def wake():
+            async with self._cond:
+                self._cond.notify_all()
+        asyncio.get_running_loop().create_task(wake())
+    
+    def _next_job(self) -> Optional[Job]:
+        # 사용자 한도에 걸리지 않은 작업 중 최우선 → 한 사용자가 대기열 앞을 막지 않음
+        ready = [j for j in self._pending if self.active(j.chat_id) < self.per_user_limit]
+        return min(ready, key=lambda j: (j.priority, j.id), default=None)
+    
+    async def _worker(self):
+        while True:
+            async with self._cond:
+                job = self._next_job()
+                while job is None:
+                    await self._cond.wait()
+                    job = self._next_job()
+                self._pending.remove(job)
+                job.status = RUNNING
+                job.started_at = time.time()
+                self._running[job.id] = job
+            
+            self._waits.append(job.wait_seconds)
+            job.task = asyncio.create_task(job.func(job))
+            try:
+                await job.task
+                job.status = DONE
+            except asyncio.CancelledError:
+                job.status = CANCELLED
+                if self._closing or not job.cancelled.is_set():
+                    # 작업이 아니라 워커 자체가 취소됨 (shutdown)
+                    job.task.cancel()
+                    raise
+            except Exception as e:
+                job.status = FAILED
+                job.error = e
+                print(f"❌ Job #{job.id} ({job.kind}) failed: {e}")
+            finally:
+                job.finished_at = time.time()
+                self._counts[job.status] = self._counts.get(job.status, 0) + 1
+                self._running.pop(job.id, None)
+                async with self._cond:
+                    self._cond.notify_all()
@@ -0,0 +1,343 @@
+"""
+LLM Backends
+
+[Purpose]
+LLMHandler / AsyncLLMHandler 의 실제 호출부를 교체 가능하게 분리
+→ 네트워크 없는 환경에서 /run 파이프라인 전체를 결정적으로 벤치마크/프로파일링
+
+[Backends]
+- OpenAIBackend: OpenAI API (base_url 지정 시 OpenAI 호환 로컬 서버, 예: http://localhost:11434/v1)
+- ReplayBackend: 디스크에 기록된 응답 재생 (record 지정 시 miss 를 실제 호출 후 기록)
+- MockBackend: 지연시간/오류 주입 (단독 고정 응답 또는 다른 백엔드 래핑)
+
+[Selection]
+get_backend() 는 환경변수로 선택
+- LLM_BACKEND: openai (default) / local / replay / record / mock
+- LLM_BASE_URL: local 백엔드 주소 (default: http://localhost:11434/v1)
+- LLM_MODEL: local 백엔드 모델명 (default: LLMHandler 기본 모델)
+- LLM_FIXTURE_DIR: replay/record 응답 디렉토리 (default: vault/fixtures/llm)
+- LLM_MOCK_LATENCY: mock 지연 (초, "0.8" 또는 "0.5,1.5")
+
+[Fixture Format]
+<fixture_dir>/<sha256 key>.json
+{"model": ..., "system_prompt": ..., "user_prompt": ..., "response": ...}
+key 는 LLMResponseCache.make_key 와 동일 (공백 정규화 프롬프트 해시)
+"""
+
+import os
+import json
+import time
+import random
+import asyncio
+import threading
+from typing import Callable, Optional, Tuple, Union
+
+from src.utils.llm_cache import LLMResponseCache
+
+
+DEFAULT_LOCAL_URL = "http://localhost:11434/v1"
+
+
+def _default_fixture_dir() -> str:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'fixtures', 'llm')
+
+
+class LLMBackend:
+    """
+    백엔드 인터페이스
+    
+    complete() 는 응답 텍스트를 반환하고 실패 시 예외를 던짐
+    (재시도/캐시/"{}" 폴백은 LLMHandler 가 담당)
+    """
+    name = "base"
+    model = None      # 지정 시 LLMHandler 기본 모델 대신 사용 (캐시 키에도 반영)
+    cacheable = True  # False 면 LLMHandler 가 영구 응답 캐시를 쓰지 않음 (가짜 응답 오염 방지)
+    
+    def complete(self, model: str, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> str:
+        raise NotImplementedError
+    
+    async def acomplete(self, model: str, system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> str:
+        return await asyncio.to_thread(self.complete, model, system_prompt, user_prompt, temperature, max_tokens)
+    
+    async def aclose(self):
+        """이벤트 루프별 리소스 정리 (map_llm 은 호출마다 새 루프 사용)"""
+        pass
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI / OpenAI 호환 엔드포인트"""
+    name = "openai"
+    
+    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None, model: Optional[str] = None):
+        from openai import OpenAI
+        
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY")
+        self.base_url = base_url
+        self.model = model
+        self.client = OpenAI(api_key=self.api_key, base_url=base_url)
+        self._async_client = None
+    
+    @staticmethod
+    def _messages(system_prompt, user_prompt):
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+    
+    def complete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        response = self.client.chat.completions.create(
+            model=model,
+            messages=self._messages(system_prompt, user_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return response.choices[0].message.content
+    
+    async def acomplete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        if self._async_client is None:
+            from openai import AsyncOpenAI
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        response = await self._async_client.chat.completions.create(
+            model=model,
+            messages=self._messages(system_prompt, user_prompt),
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        return response.choices[0].message.content
+    
+    async def aclose(self):
+        # AsyncOpenAI 연결 풀은 생성된 이벤트 루프에 묶임 → 루프 종료 전 정리
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+
+class ReplayBackend(LLMBackend):
+    """
+    기록된 응답 재생
+    
+    [Usage]
+    ReplayBackend()                                # 재생 전용 (miss → default 응답)
+    ReplayBackend(record=OpenAIBackend())          # miss 는 실제 호출 후 기록
+    ReplayBackend(strict=True)                     # miss → KeyError
+    """
+    name = "replay"
+    cacheable = False
+    
+    def __init__(
+        self,
+        fixture_dir: Optional[str] = None,
+        record: Optional[LLMBackend] = None,
+        strict: bool = False,
+        default: str = "{}"
+    ):
+        """
+        Args:
+            fixture_dir: 응답 파일 디렉토리 (default: vault/fixtures/llm)
+            record: miss 시 호출할 백엔드 (응답을 fixture 로 저장)
+            strict: True 면 miss 시 KeyError
+            default: miss 시 반환할 응답 (record / strict 미지정 시)
+        """
+        self.fixture_dir = fixture_dir or _default_fixture_dir()
+        self.record = record
+        self.strict = strict
+        self.default = default
+        
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(self.fixture_dir, exist_ok=True)
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.fixture_dir, f"{key}.json")
+    
+    def _load(self, key: str) -> Optional[str]:
+        try:
+            with open(self._path(key), 'r', encoding='utf-8') as f:
+                return json.load(f)['response']
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _save(self, key: str, model: str, system_prompt: str, user_prompt: str, response: str):
+        path = self._path(key)
+        tmp = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump({
+                'model': model,
+                'system_prompt': system_prompt,
+                'user_prompt': user_prompt,
+                'response': response,
+            }, f, ensure_ascii=False, indent=2)
+        os.replace(tmp, path)
+    
+    def _miss(self, key: str):
+        with self._lock:
+            self.misses += 1
+        if self.strict:
+            raise KeyError(f"No recorded LLM response for key {key[:12]}")
+    
+    def complete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        key = LLMResponseCache.make_key(model, system_prompt, user_prompt, temperature)
+        response = self._load(key)
+        if response is not None:
+            with self._lock:
+                self.hits += 1
+            return response
+        
+        self._miss(key)
+        if self.record is None:
+            return self.default
+        response = self.record.complete(model, system_prompt, user_prompt, temperature, max_tokens)
+        if response:
+            self._save(key, model, system_prompt, user_prompt, response)
+        return response
+    
+    async def acomplete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        key = LLMResponseCache.make_key(model, system_prompt, user_prompt, temperature)
+        response = self._load(key)
+        if response is not None:
+            with self._lock:
+                self.hits += 1
+            return response
+        
+        self._miss(key)
+        if self.record is None:
+            return self.default
+        response = await self.record.acomplete(model, system_prompt, user_prompt, temperature, max_tokens)
+        if response:
+            self._save(key, model, system_prompt, user_prompt, response)
+        return response
+    
+    async def aclose(self):
+        if self.record is not None:
+            await self.record.aclose()
+
+
+class MockBackendError(Exception):
+    """주입된 오류 (status_code 로 재시도 경로 검증)"""
+    
+    def __init__(self, status_code: int = 429):
+        self.status_code = status_code
+        super().__init__(f"Injected LLM error ({status_code})")
+
+
+class MockBackend(LLMBackend):
+    """
+    지연시간 / 오류 주입 백엔드
+    
+    [Usage]
+    MockBackend(latency=0.8)                                   # 고정 응답 "{}" + 0.8초
+    MockBackend(latency=(0.5, 1.5), seed=7)                    # 구간 내 랜덤 지연 (재현 가능)
+    MockBackend(inner=ReplayBackend(), latency=0.8)            # 기록 응답 + 실제와 비슷한 지연
+    MockBackend(responder=lambda system, user: '{"ok": 1}')    # 프롬프트별 응답 생성
+    """
+    name = "mock"
+    cacheable = False
+    
+    def __init__(
+        self,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        inner: Optional[LLMBackend] = None,
+        responder: Optional[Callable[[str, str], str]] = None,
+        response: str = "{}",
+        error_rate: float = 0.0,
+        error_status: int = 429,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            latency: 호출당 지연 (초) 또는 (min, max) 구간
+            inner: 응답을 생성할 백엔드 (지정 시 responder/response 무시)
+            responder: (system_prompt, user_prompt) → 응답 텍스트
+            response: 고정 응답
+            error_rate: 오류 주입 확률 (0~1)
+            error_status: 주입 오류의 status_code
+            seed: 지연/오류 난수 시드 (재현용)
+        """
+        self.latency = latency
+        self.inner = inner
+        self.responder = responder
+        self.response = response
+        self.error_rate = error_rate
+        self.error_status = error_status
+        
+        self.calls = 0
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def _draw(self) -> Tuple[float, bool]:
+        with self._lock:
+            self.calls += 1
+            if isinstance(self.latency, (tuple, list)):
+                delay = self._rng.uniform(*self.latency)
+            else:
+                delay = float(self.latency)
+            fail = self.error_rate > 0 and self._rng.random() < self.error_rate
+        return delay, fail
+    
+    def _respond(self, system_prompt, user_prompt):
+        if self.responder is not None:
+            return self.responder(system_prompt, user_prompt)
+        return self.response
+    
+    def complete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        delay, fail = self._draw()
+        time.sleep(delay)
+        if fail:
+            raise MockBackendError(self.error_status)
+        if self.inner is not None:
+            return self.inner.complete(model, system_prompt, user_prompt, temperature, max_tokens)
+        return self._respond(system_prompt, user_prompt)
+    
+    async def acomplete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        delay, fail = self._draw()
+        await asyncio.sleep(delay)
+        if fail:
+            raise MockBackendError(self.error_status)
+        if self.inner is not None:
+            return await self.inner.acomplete(model, system_prompt, user_prompt, temperature, max_tokens)
+        return self._respond(system_prompt, user_prompt)
+    
+    async def aclose(self):
+        if self.inner is not None:
+            await self.inner.aclose()
+
+
+def _parse_latency(value: str) -> Union[float, Tuple[float, float]]:
+    parts = [float(p) for p in value.split(",") if p.strip()]
+    if len(parts) == 2:
+        return (parts[0], parts[1])
+    return parts[0] if parts else 0.0
+
+
+def get_backend(name: Optional[str] = None) -> LLMBackend:
+    """
+    환경변수(LLM_BACKEND 등) 기반 백엔드 생성
+    
+    Args:
+        name: openai / local / replay / record / mock (None = LLM_BACKEND, 기본 openai)
+    """
+    name = (name or os.getenv("LLM_BACKEND") or "openai").lower()
+    fixture_dir = os.getenv("LLM_FIXTURE_DIR") or None
+    
+    if name == "openai":
+        return OpenAIBackend()
+    if name == "local":
+        # 로컬 서버는 키 검증 안 함 → 키 없으면 placeholder
+        return OpenAIBackend(
+            api_key=os.getenv("OPENAI_API_KEY") or "local",
+            base_url=os.getenv("LLM_BASE_URL", DEFAULT_LOCAL_URL),
+            model=os.getenv("LLM_MODEL") or None
+        )
+    if name == "replay":
+        return ReplayBackend(fixture_dir)
+    if name == "record":
+        return ReplayBackend(fixture_dir, record=OpenAIBackend())
+    if name == "mock":
+        # 기록 응답 재생 + 지연 주입 (기록 없으면 "{}")
+        latency = _parse_latency(os.getenv("LLM_MOCK_LATENCY", "0"))
+        return MockBackend(inner=ReplayBackend(fixture_dir), latency=latency)
+    
+    raise ValueError(f"Unknown LLM backend: {name}")
@@ -0,0 +1,167 @@
+"""
+LLM Response Cache
+
+[Purpose]
+동일 프롬프트 재호출(ZULU 분석, X-RAY 섹터 분류, BRAVO rationale, ALPHA 하이라이트 등)을
+로컬 SQLite 에서 즉시 반환 → 지연시간/토큰 비용 절감
+(/run, /dcf, 일일 알림, Streamlit rerun 간 공유)
+
+[Key]
+sha256(model, system_prompt, user_prompt, temperature)
+- 프롬프트는 공백 정규화 후 해시 (f-string 들여쓰기/줄바꿈 차이만 있는 프롬프트는 같은 키)
+
+[Eviction]
+- TTL: 기본 7일 (호출 단위로 지정 가능)
+- LRU: max_entries 초과 시 가장 오래 사용되지 않은 응답부터 삭제
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+
+DEFAULT_TTL = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 5000
+
+
+def _default_path() -> str:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'cache', 'llm_responses.sqlite')
+
+
+def _normalize(text: str) -> str:
+    return " ".join(str(text or "").split())
+
+
+class LLMResponseCache:
+    """
+    SQLite 기반 LLM 응답 캐시 (프로세스/인스턴스 간 공유)
+    
+    [Usage]
+    cache = LLMResponseCache()
+    key = cache.make_key(model, system_prompt, user_prompt, temperature)
+    text = cache.get(key)              # None = miss/만료
+    cache.put(key, text)
+    """
+    
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (default: vault/cache/llm_responses.sqlite)
+            ttl: 기본 유효기간 (초)
+            max_entries: 최대 저장 응답 수 (LRU)
+        """
+        self.path = path or _default_path()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses (last_used)")
+    
+    @contextmanager
+    def _connect(self):
+        # 호출마다 새 연결 → 스레드 간 공유 문제 없음
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+        """요청 내용 해시 (프롬프트 공백 정규화)"""
+        payload = json.dumps(
+            [model, _normalize(system_prompt), _normalize(user_prompt), round(float(temperature), 4)],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[str]:
+        """
+        캐시된 응답 조회 (hit 시 LRU 순서 갱신)
+        
+        Args:
+            ttl: 이번 조회에 적용할 유효기간 (None = 기본값)
+        
+        Returns:
+            응답 텍스트 / None: 미존재 또는 TTL 만료
+        """
+        ttl = self.ttl if ttl is None else ttl
+        now = time.time()
+        
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT response, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and now - row[1] <= ttl:
+                conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (now, key))
+            else:
+                row = None
+        
+        with self._lock:
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+    
+    def put(self, key: str, response: str, model: str = ""):
+        """응답 저장 후 max_entries 초과분을 LRU 순으로 삭제"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                (key, model, response, now, now)
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+    
+    def stats(self) -> Dict[str, float]:
+        """hit/miss 카운터 + 저장 응답 수"""
+        with self._connect() as conn:
+            size = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0,
+                'size': size,
+            }
+    
+    def invalidate(self):
+        """캐시 전체 삭제"""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
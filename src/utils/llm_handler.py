@@ -1,35 +1,175 @@
-import os
-from openai import OpenAI
+import random
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from openai import APIConnectionError
 from dotenv import load_dotenv
 
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.llm_backends import get_backend
+
 # 환경변수 로드
 load_dotenv()
 
+# 4o-mini는 속도(Flash급)와 지능(3.5 이상)을 모두 갖춤
+MODEL_NAME = "gpt-4o-mini"
+TEMPERATURE = 0.3 # Fact 위주
+MAX_TOKENS = 3000
+
+
+def _is_retryable(error):
+    """재시도 대상: 429 (Rate Limit) / 5xx / 연결 오류·타임아웃"""
+    status = getattr(error, "status_code", None) or 0
+    return isinstance(error, APIConnectionError) or status == 429 or status >= 500
+
+
 class LLMHandler:
-    def __init__(self):
-        # 안정적인 OpenAI 단일 클라이언트 사용
-        self.client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+    # 프로세스 공용 응답 캐시 (에이전트별 LLMHandler 인스턴스가 hit/miss 카운터 공유)
+    _shared_cache = None
+    _lock = threading.Lock()
+
+    def __init__(self, cache=None, use_cache=True, max_concurrency=8, backend=None):
+        """
+        Args:
+            cache: LLMResponseCache (default: 프로세스 공용, vault/cache/llm_responses.sqlite)
+            use_cache: False 면 항상 백엔드 직접 호출
+            max_concurrency: map_llm 동시 요청 수
+            backend: LLMBackend (default: get_backend() → LLM_BACKEND 환경변수, 기본 OpenAI)
+        """
+        self.backend = backend or get_backend()
+        # replay/mock 등 가짜 응답은 영구 캐시에 저장하지 않음
+        use_cache = use_cache and self.backend.cacheable
+        self.cache = (cache or self._default_cache()) if use_cache else None
+        self.max_concurrency = max_concurrency
+
+    @classmethod
+    def _default_cache(cls):
+        with cls._lock:
+            if cls._shared_cache is None:
+                cls._shared_cache = LLMResponseCache()
+            return cls._shared_cache
 
-    def call_llm(self, system_prompt, user_prompt, mode="smart"):
+    def cache_stats(self):
+        """응답 캐시 hit/miss 카운터 (캐시 미사용 시 None)"""
+        return self.cache.stats() if self.cache else None
+
+    def call_llm(self, system_prompt, user_prompt, mode="smart", use_cache=True, cache_ttl=None):
         """
         LLM 호출 라우터 (GPT-4o-mini 통합)
         :param mode: 'fast'든 'smart'든 가성비 최강인 4o-mini 사용
+        :param use_cache: False 면 캐시 조회/저장 생략 (대화형 응답 등)
+        :param cache_ttl: 캐시 유효기간 (초, None = 캐시 기본값)
         """
+        model_name = self.backend.model or MODEL_NAME
+        
+        cache = self.cache if use_cache else None
+        key = cache.make_key(model_name, system_prompt, user_prompt, TEMPERATURE) if cache else None
+        if cache:
+            cached = cache.get(key, ttl=cache_ttl)
+            if cached is not None:
+                return cached
+        
         try:
-            # 4o-mini는 속도(Flash급)와 지능(3.5 이상)을 모두 갖춤
-            model_name = "gpt-4o-mini"
-            
-            response = self.client.chat.completions.create(
-                model=model_name,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3, # Fact 위주
-                max_tokens=3000
-            )
-            return response.choices[0].message.content
+            content = self.backend.complete(model_name, system_prompt, user_prompt, TEMPERATURE, MAX_TOKENS)
             
+            # 빈 응답은 저장하지 않음 (에러 폴백 "{}" 도 캐시 대상 아님)
+            if cache and content:
+                cache.put(key, content, model=model_name)
+            return content
+        
         except Exception as e:
             print(f"   ⚠️ LLM Error ({model_name}): {e}")
-            return "{}" # 에러 시 빈 JSON 반환으로 시스템 다운 방지
\ No newline at end of file
+            return "{}" # 에러 시 빈 JSON 반환으로 시스템 다운 방지
+
+    def map_llm(self, system_prompt, user_prompts, mode="smart", use_cache=True, cache_ttl=None):
+        """
+        여러 프롬프트 동시 호출 (동기 코드용, 결과는 입력 순서)
+        
+        에이전트는 스레드 풀에서 실행되므로 호출마다 새 이벤트 루프에서 AsyncLLMHandler 사용
+        (이미 이벤트 루프가 도는 스레드에서 호출되면 별도 스레드에서 실행)
+        """
+        async def run():
+            handler = AsyncLLMHandler(
+                cache=self.cache,
+                use_cache=self.cache is not None,
+                max_concurrency=self.max_concurrency,
+                backend=self.backend
+            )
+            try:
+                return await handler.map(system_prompt, user_prompts, mode=mode, use_cache=use_cache, cache_ttl=cache_ttl)
+            finally:
+                await handler.close()
+        
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(run())
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, run()).result()
+
+
+class AsyncLLMHandler:
+    """
+    비동기 LLM 클라이언트 (LLMHandler 와 같은 모델/캐시/백엔드/에러 폴백)
+
+    [Usage]
+    brain = AsyncLLMHandler(max_concurrency=8)
+    text = await brain.call_llm(system_prompt, user_prompt)
+    texts = await brain.map(system_prompt, [p1, p2, p3])   # 입력 순서대로
+    await brain.close()
+    """
+
+    def __init__(self, cache=None, use_cache=True, max_concurrency=8, max_retries=3, backoff=1.0, backend=None):
+        """
+        Args:
+            cache: LLMResponseCache (default: LLMHandler 와 공용)
+            use_cache: False 면 항상 백엔드 직접 호출
+            max_concurrency: 동시 요청 수 (Semaphore)
+            max_retries: 429 / 5xx / 연결 오류 재시도 횟수
+            backoff: 재시도 대기 기본값 (초, 지수 증가 + jitter)
+            backend: LLMBackend (default: get_backend())
+        """
+        self.backend = backend or get_backend()
+        use_cache = use_cache and self.backend.cacheable
+        self.cache = (cache or LLMHandler._default_cache()) if use_cache else None
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def close(self):
+        await self.backend.aclose()
+
+    async def call_llm(self, system_prompt, user_prompt, mode="smart", use_cache=True, cache_ttl=None):
+        """LLMHandler.call_llm 의 async 버전 (실패 시 "{}")"""
+        model_name = self.backend.model or MODEL_NAME
+        
+        cache = self.cache if use_cache else None
+        key = cache.make_key(model_name, system_prompt, user_prompt, TEMPERATURE) if cache else None
+        if cache:
+            cached = cache.get(key, ttl=cache_ttl)
+            if cached is not None:
+                return cached
+        
+        for attempt in range(self.max_retries + 1):
+            try:
+                async with self._semaphore:
+                    content = await self.backend.acomplete(model_name, system_prompt, user_prompt, TEMPERATURE, MAX_TOKENS)
+                
+                if cache and content:
+                    cache.put(key, content, model=model_name)
+                return content
+            
+            except Exception as e:
+                if attempt < self.max_retries and _is_retryable(e):
+                    # 슬롯을 반납한 상태에서 대기 → 다른 요청은 계속 진행
+                    await asyncio.sleep(self.backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+                    continue
+                print(f"   ⚠️ LLM Error ({model_name}): {e}")
+                return "{}" # 에러 시 빈 JSON 반환으로 시스템 다운 방지
+
+    async def map(self, system_prompt, user_prompts, mode="smart", use_cache=True, cache_ttl=None):
+        """N개 프롬프트 동시 호출 (동시성은 Semaphore 로 제한), 결과는 입력 순서"""
+        return await asyncio.gather(*[
+            self.call_llm(system_prompt, prompt, mode=mode, use_cache=use_cache, cache_ttl=cache_ttl)
+            for prompt in user_prompts
+        ])
\ No newline at end of file
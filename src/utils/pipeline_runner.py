@@ -0,0 +1,376 @@
+"""
+Background Pipeline Runner
+
+[Purpose]
+Streamlit 'Deal Pipeline' 탭처럼 한 번의 스크립트 실행(버튼 콜백) 안에서
+수 분짜리 파이프라인을 돌릴 수 없는 UI 용 백그라운드 실행기
+- StageGraph 를 백그라운드 스레드(전용 이벤트 루프)에서 실행 → 버튼 콜백은 즉시 반환
+- 단계별 상태 (pending / running / done / failed / skipped) + 소요 시간
+- snapshot() 으로 완료된 단계 결과를 즉시 조회 → 화면에 단계별 점진 렌더링
+- 동일 job_key 로 submit 하면 실행 중인 Job 을 그대로 반환 (중복 실행 방지)
+
+[Persistence]
+Stage.cache_key(inputs) 가 있는 단계는 결과를 SQLite 에 저장
+(key = 단계명 + cache_key 해시, 기업/입력값이 같으면 재계산 없이 복원)
+cache_key 가 None 을 반환한 실행은 조회/저장 모두 생략 (세션 결과 재사용 등 입력 외 값에 의존하는 경우)
+→ 위젯 조작으로 스크립트가 다시 돌아도 수 분짜리 재계산이 일어나지 않음
+
+[Note]
+백그라운드 스레드에서는 st.session_state 접근 불가
+→ 단계 함수는 submit 전에 읽어 둔 입력값만 사용
+"""
+
+import os
+import json
+import time
+import pickle
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
+from typing import Any, Dict, List, Optional
+
+from src.utils.stage_graph import Stage, StageFailed, StageGraph, StageResult
+
+
+DEFAULT_TTL = 24 * 3600
+
+STATE_PENDING = 'pending'
+STATE_RUNNING = 'running'
+STATE_DONE = 'done'
+STATE_FAILED = 'failed'
+STATE_SKIPPED = 'skipped'
+STATE_CANCELLED = 'cancelled'
+
+
+def _default_path() -> str:
+    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    return os.path.join(project_root, 'vault', 'cache', 'pipeline_stages.sqlite')
+
+
+class StageResultStore:
+    """
+    SQLite 기반 단계 결과 저장소 (프로세스 재시작/세션 간 공유)
+    
+    [Usage]
+    store = StageResultStore()
+    key = store.make_key(("삼성전자", 120.5))
+    value = store.get("dcf", key)   # None = miss/만료
+    store.put("dcf", key, value)
+    """
+    
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL):
+        """
+        Args:
+            path: SQLite 파일 경로 (default: vault/cache/pipeline_stages.sqlite)
+            ttl: 결과 유효기간 (초, 공시/시장 데이터 갱신 주기 감안)
+        """
+        self.path = path or _default_path()
+        self.ttl = ttl
+        
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stage_results (
+                    stage TEXT NOT NULL,
+                    input_key TEXT NOT NULL,
+                    payload BLOB NOT NULL,
+                    saved_at REAL NOT NULL,
+                    PRIMARY KEY (stage, input_key)
+                )
+                """
+            )
+    
+    @contextmanager
+    def _connect(self):
+        # 호출마다 새 연결 → 스레드 간 공유 문제 없음
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+    
+    @staticmethod
+    def make_key(value: Any) -> str:
+        """입력값 → sha256 (dict 순서 무관, 직렬화 불가 값은 str)"""
+        raw = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def get(self, stage: str, key: str) -> Any:
+        """
+        저장된 단계 결과 조회
+        
+        Returns:
+            결과 값 / None: 미존재, TTL 만료 또는 역직렬화 실패
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT payload, saved_at FROM stage_results WHERE stage = ? AND input_key = ?",
+                (stage, key)
+            ).fetchone()
+        
+        value = None
+        if row and time.time() - row[1] <= self.ttl:
+            try:
+                value = pickle.loads(row[0])
+            except Exception:
+                value = None
+        
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+    
+    def put(self, stage: str, key: str, value: Any):
+        """단계 결과 저장 (None / 직렬화 불가 값은 저장하지 않음)"""
+        if value is None:
+            return
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ Stage result not persisted ({stage}): {e}")
+            return
+        
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO stage_results VALUES (?, ?, ?, ?)",
+                (stage, key, sqlite3.Binary(payload), time.time())
+            )
+    
+    def invalidate(self, stage: Optional[str] = None):
+        """저장 결과 삭제 (stage 지정 시 해당 단계만)"""
+        with self._connect() as conn:
+            if stage:
+                conn.execute("DELETE FROM stage_results WHERE stage = ?", (stage,))
+            else:
+                conn.execute("DELETE FROM stage_results")
+
+
+@dataclass
+class StageStatus:
+    name: str
+    state: str = STATE_PENDING
+    elapsed: float = 0.0
+    cached: bool = False
+    error: Optional[str] = None
+
+
+class PipelineJob:
+    """
+    백그라운드에서 실행되는 StageGraph 1회분
+    
+    UI 스레드는 snapshot() 만 읽고, 상태 갱신은 모두 _lock 아래에서 수행
+    """
+    
+    def __init__(
+        self,
+        key: str,
+        stages: List[Stage],
+        store: StageResultStore,
+        executor: ThreadPoolExecutor,
+        force: bool = False
+    ):
+        """
+        Args:
+            key: Job 식별자 (동일 입력 = 동일 key)
+            stages: 실행할 단계 목록
+            store: 단계 결과 저장소
+            executor: 블로킹 단계를 실행할 스레드 풀
+            force: True 면 저장된 결과를 무시하고 재계산 (결과는 덮어씀)
+        """
+        self.key = key
+        self.store = store
+        self.executor = executor
+        self.force = force
+        
+        self.graph = StageGraph([self._persisted(stage) for stage in stages])
+        self.status = {name: StageStatus(name) for name in self.graph.order}
+        self.results: Dict[str, Any] = {}
+        
+        self.state = STATE_RUNNING
+        self.error: Optional[str] = None
+        self.submitted_at = time.time()
+        self.finished_at: Optional[float] = None
+        
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=f"pipeline-{self.key[:8]}", daemon=True)
+        self._thread.start()
+    
+    def cancel(self):
+        """아직 시작하지 않은 단계 중단 (실행 중인 단계는 끝까지 실행)"""
+        self._stop.set()
+    
+    @property
+    def done(self) -> bool:
+        return self.state != STATE_RUNNING
+    
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if self._thread:
+            self._thread.join(timeout)
+        return self.done
+    
+    def _update(self, name: str, **fields):
+        with self._lock:
+            for field, value in fields.items():
+                setattr(self.status[name], field, value)
+    
+    def _persisted(self, stage: Stage) -> Stage:
+        """단계 함수 래핑: running 표시 + 저장 결과 복원/저장"""
+        def run(inputs: Dict[str, Any]) -> Any:
+            self._update(stage.name, state=STATE_RUNNING)
+            
+            key = None
+            if stage.cache_key is not None:
+                raw = stage.cache_key(inputs)
+                if raw is not None:
+                    key = self.store.make_key(raw)
+            
+            if key and not self.force:
+                value = self.store.get(stage.name, key)
+                if value is not None:
+                    self._update(stage.name, cached=True)
+                    return value
+            
+            value = stage.func(inputs)
+            if key:
+                self.store.put(stage.name, key, value)
+            return value
+        
+        return replace(stage, func=run)
+    
+    async def _on_result(self, result: StageResult):
+        with self._lock:
+            status = self.status[result.name]
+            status.elapsed = result.elapsed
+            if result.ok:
+                status.state = STATE_DONE
+                self.results[result.name] = result.value
+            else:
+                status.state = STATE_FAILED
+                status.error = "timeout" if isinstance(result.error, asyncio.TimeoutError) else repr(result.error)
+    
+    def _run(self):
+        state, error = STATE_DONE, None
+        try:
+            asyncio.run(self.graph.run(self.executor, on_result=self._on_result, should_stop=self._stop.is_set))
+        except StageFailed as e:
+            state, error = STATE_FAILED, str(e)
+        except InterruptedError:
+            state = STATE_CANCELLED
+        except Exception as e:
+            state, error = STATE_FAILED, repr(e)
+        
+        with self._lock:
+            # 선행 단계 실패/중단으로 결과를 버린 단계
+            for status in self.status.values():
+                if status.state in (STATE_PENDING, STATE_RUNNING):
+                    status.state = STATE_SKIPPED
+            self.error = error
+            self.finished_at = time.time()
+            self.state = state
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        렌더링용 현재 상태 (복사본)
+        
+        Returns:
+            {'key', 'state', 'error', 'elapsed',
+             'stages': [StageStatus dict (실행 순서)], 'results': {stage: value}}
+        """
+        with self._lock:
+            end = self.finished_at or time.time()
+            return {
+                'key': self.key,
+                'state': self.state,
+                'error': self.error,
+                'elapsed': end - self.submitted_at,
+                'stages': [asdict(self.status[name]) for name in self.graph.order],
+                'results': dict(self.results),
+            }
+
+
+class PipelineRunner:
+    """
+    백그라운드 파이프라인 실행기 (프로세스 공용, Streamlit 에서는 st.cache_resource 로 보관)
+    
+    [Usage]
+    runner = PipelineRunner()
+    job = runner.submit(runner.make_key(query, options), stages)
+    ...  # 다음 rerun 에서
+    snap = runner.get(job_key).snapshot()
+    """
+    
+    def __init__(
+        self,
+        store: Optional[StageResultStore] = None,
+        max_workers: int = 8,
+        history: int = 20
+    ):
+        """
+        Args:
+            store: 단계 결과 저장소 (default: vault/cache/pipeline_stages.sqlite)
+            max_workers: 모든 Job 이 공유하는 단계 실행 스레드 수
+            history: 보관할 완료 Job 수 (초과 시 오래된 것부터 제거)
+        """
+        self.store = store or StageResultStore()
+        self.history = history
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline-stage")
+        
+        self._jobs: "OrderedDict[str, PipelineJob]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        return StageResultStore.make_key(parts)
+    
+    def submit(self, key: str, stages: List[Stage], force: bool = False) -> PipelineJob:
+        """
+        Job 시작 (같은 key 의 Job 이 실행 중이면 그 Job 반환)
+        
+        완료된 Job 을 다시 submit 하면 새 Job 이 만들어지지만,
+        저장된 단계 결과가 복원되므로 바로 끝남
+        """
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and not job.done:
+                return job
+            
+            job = PipelineJob(key, stages, self.store, self.executor, force=force)
+            self._jobs[key] = job
+            self._jobs.move_to_end(key)
+            
+            finished = [k for k, j in self._jobs.items() if j.done]
+            for old in finished[:max(0, len(finished) - self.history)]:
+                del self._jobs[old]
+        
+        job.start()
+        return job
+    
+    def get(self, key: str) -> Optional[PipelineJob]:
+        with self._lock:
+            return self._jobs.get(key)
+    
+    def cancel(self, key: str) -> bool:
+        job = self.get(key)
+        if job is None or job.done:
+            return False
+        job.cancel()
+        return True
@@ -0,0 +1,170 @@
+"""
+Stage Graph Executor
+
+[Purpose]
+/run 파이프라인처럼 여러 에이전트 단계를 의존성 그래프로 실행
+- 선행 단계가 끝난 단계는 즉시 시작 (독립 단계는 동시 실행)
+- 블로킹 에이전트 호출은 전용(bounded) 스레드 풀에서 실행
+- 단계별 타임아웃
+- 단계가 끝나는 순서대로 콜백 호출 → 채팅으로 중간 결과 스트리밍
+
+[Failure]
+- required 단계 실패/타임아웃 → 나머지 단계 취소 후 StageFailed
+- optional 단계 실패/타임아웃 → 결과 None 으로 후속 단계 진행
+
+[Note]
+타임아웃된 단계의 스레드는 강제 종료되지 않음 (결과만 버림).
+풀 크기는 동시에 걸릴 수 있는 단계 수를 감안해 여유 있게 설정.
+"""
+
+import time
+import asyncio
+from dataclasses import dataclass
+from concurrent.futures import Executor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+@dataclass
+class Stage:
+    """
+    파이프라인 단계
+    
+    func(inputs) 는 선행 단계 결과 {dep_name: value} 를 받아 값을 반환하는 동기 함수
+    cache_key(inputs) 는 결과 저장용 키 (PipelineRunner 전용, None = 저장 안 함)
+    """
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    deps: Sequence[str] = ()
+    timeout: Optional[float] = None
+    required: bool = True
+    cache_key: Optional[Callable[[Dict[str, Any]], Any]] = None
+
+
+@dataclass
+class StageResult:
+    name: str
+    ok: bool
+    value: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+
+class StageFailed(Exception):
+    """required 단계 실패 (원인: result.error)"""
+    
+    def __init__(self, result: StageResult):
+        self.result = result
+        reason = "timeout" if isinstance(result.error, asyncio.TimeoutError) else repr(result.error)
+        super().__init__(f"Stage '{result.name}' failed: {reason}")
+
+
+class StageGraph:
+    """
+    의존성 그래프 실행기
+    
+    [Usage]
+    graph = StageGraph([
+        Stage("xray", lambda r: xray.run_valuation(target), timeout=180),
+        Stage("bravo", lambda r: bravo.find_potential_buyers(target, industry), required=False),
+        Stage("alpha", lambda r: alpha.generate_teaser(target, r["xray"], r["bravo"]), deps=("xray", "bravo")),
+    ])
+    results = await graph.run(executor, on_result=notify)
+    """
+    
+    def __init__(self, stages: List[Stage]):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names")
+        
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {missing}")
+        
+        self.order = self._topological_order()
+    
+    def _topological_order(self) -> List[str]:
+        order, visiting, done = [], set(), set()
+        
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Cycle detected at stage '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+        
+        for name in self.stages:
+            visit(name)
+        return order
+    
+    async def run(
+        self,
+        executor: Executor,
+        on_result: Optional[Callable[[StageResult], Awaitable[None]]] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Dict[str, StageResult]:
+        """
+        전체 그래프 실행
+        
+        Args:
+            executor: 블로킹 단계를 실행할 스레드 풀 (bounded)
+            on_result: 단계 완료 시 호출되는 async 콜백 (완료 순서대로)
+            should_stop: True 반환 시 아직 시작하지 않은 단계를 중단 (InterruptedError)
+        
+        Returns:
+            {stage_name: StageResult}
+        
+        Raises:
+            StageFailed: required 단계 실패/타임아웃
+            InterruptedError: should_stop() 에 의한 중단
+        """
+        loop = asyncio.get_running_loop()
+        tasks: Dict[str, asyncio.Task] = {}
+        results: Dict[str, StageResult] = {}
+        
+        async def execute(stage: Stage) -> StageResult:
+            inputs = {}
+            for dep in stage.deps:
+                inputs[dep] = (await tasks[dep]).value
+            
+            if should_stop and should_stop():
+                raise InterruptedError()
+            
+            start = time.perf_counter()
+            try:
+                value = await asyncio.wait_for(
+                    loop.run_in_executor(executor, stage.func, inputs),
+                    timeout=stage.timeout
+                )
+                result = StageResult(stage.name, True, value, elapsed=time.perf_counter() - start)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                result = StageResult(stage.name, False, error=e, elapsed=time.perf_counter() - start)
+            
+            results[stage.name] = result
+            if on_result:
+                await on_result(result)
+            
+            if not result.ok and stage.required:
+                raise StageFailed(result)
+            return result
+        
+        for name in self.order:
+            tasks[name] = asyncio.create_task(execute(self.stages[name]))
+        
+        try:
+            # 첫 예외(StageFailed / InterruptedError)에서 즉시 중단
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+        
+        return results
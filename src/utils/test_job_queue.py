@@ -0,0 +1,133 @@
+"""
+Test Job Queue (Multi-User Worker Pool)
+
+Usage:
+    python -m src.utils.test_job_queue
+"""
+
+import sys
+import os
+import time
+import asyncio
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.utils.job_queue import JobQueue, CANCELLED, DONE
+
+
+def _work(log, seconds=0.05):
+    async def run(job):
+        log.append(f"{job.chat_id}:{job.kind}")
+        await asyncio.sleep(seconds)
+    return run
+
+
+def test_priority_and_user_limit():
+    """Quick /struct jobs jump ahead of /run; one busy user does not block others"""
+    print("=" * 70)
+    print("🧪 Testing Job Queue Scheduling")
+    print("=" * 70)
+    
+    async def main():
+        log = []
+        queue = JobQueue(workers=1, per_user_limit=1)
+        queue.start()
+        
+        first = queue.submit("A", "run", _work(log, 0.1))
+        await asyncio.sleep(0.02)  # A:run 실행 시작
+        
+        queue.submit("A", "run", _work(log))
+        queue.submit("B", "dcf", _work(log))
+        struct = queue.submit("C", "struct", _work(log))
+        
+        assert queue.position(first) == 0
+        assert queue.position(struct) == 1
+        assert queue.stats()["depth"] == 3
+        
+        while queue.stats()["done"] < 4:
+            await asyncio.sleep(0.01)
+        await queue.shutdown()
+        return log, queue.stats()
+    
+    log, stats = asyncio.run(main())
+    print(f"\n   Order: {log}")
+    print(f"   Stats: {stats}")
+    
+    assert log == ["A:run", "C:struct", "B:dcf", "A:run"]
+    assert stats["wait_max"] >= 0.1
+    
+    # 사용자 한도: 워커 3개여도 A 의 두 번째 작업은 첫 작업 종료까지 대기
+    async def per_user():
+        log = []
+        queue = JobQueue(workers=3, per_user_limit=1)
+        queue.start()
+        queue.submit("A", "run", _work(log, 0.1))
+        queue.submit("A", "run", _work(log, 0.1))
+        queue.submit("B", "run", _work(log, 0.1))
+        await asyncio.sleep(0.05)
+        snapshot = (list(log), queue.stats()["running"])
+        await queue.shutdown()
+        return snapshot
+    
+    log, running = asyncio.run(per_user())
+    assert sorted(log) == ["A:run", "B:run"] and running == 2
+    
+    print("   ✅ Priority + per-user limit OK")
+    print("=" * 70)
+
+
+def test_cancel_interrupts_running_job():
+    """cancel() stops a running job mid-await and drops its pending jobs"""
+    print("\n" + "=" * 70)
+    print("🧪 Testing Job Queue Cancellation")
+    print("=" * 70)
+    
+    async def main():
+        queue = JobQueue(workers=2, per_user_limit=1)
+        queue.start()
+        
+        async def slow(job):
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, time.sleep, 0.3)
+            await asyncio.sleep(5)
+        
+        running = queue.submit("A", "run", slow)
+        pending = queue.submit("A", "run", slow)
+        other = queue.submit("B", "struct", _work([]))
+        await asyncio.sleep(0.05)
+        
+        start = time.perf_counter()
+        assert queue.cancel("A") == 2
+        while running.status != CANCELLED:
+            await asyncio.sleep(0.01)
+        elapsed = time.perf_counter() - start
+        
+        while other.status != DONE:
+            await asyncio.sleep(0.01)
+        stats = queue.stats()
+        await queue.shutdown()
+        return running, pending, elapsed, stats
+    
+    running, pending, elapsed, stats = asyncio.run(main())
+    print(f"\n   Cancelled running job in {elapsed * 1000:.0f}ms | {stats}")
+    
+    assert running.is_cancelled() and pending.status == CANCELLED
+    assert pending.started_at is None
+    assert elapsed < 0.2  # 블로킹 호출(0.3s) 종료를 기다리지 않음
+    assert stats["cancelled"] == 2 and stats["done"] == 1
+    
+    print("   ✅ Cancellation OK")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    try:
+        test_priority_and_user_limit()
+        test_cancel_interrupts_running_job()
+        
+        print("\n✅ ALL JOB QUEUE TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,151 @@
+"""
+Test Async / Batched LLM Client
+
+Usage:
+    python -m src.utils.test_llm_async
+"""
+
+import sys
+import os
+import time
+import asyncio
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.utils.llm_handler import LLMHandler, AsyncLLMHandler
+from src.utils.llm_backends import LLMBackend
+from src.agents.zulu_scout import ZuluScout, ANALYSIS_BATCH
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+class _BadRequest(Exception):
+    status_code = 400
+
+
+class _FakeAsyncBackend(LLMBackend):
+    """프롬프트별 고정 지연, 'flaky' 는 첫 호출 429, 'bad' 는 항상 400"""
+    
+    def __init__(self, latency=0.2):
+        self.latency = latency
+        self.calls = []
+        self.in_flight = 0
+        self.peak = 0
+    
+    async def acomplete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        prompt = user_prompt
+        self.calls.append(prompt)
+        if prompt == "bad":
+            raise _BadRequest("invalid request")
+        if prompt == "flaky" and self.calls.count(prompt) == 1:
+            raise _RateLimited("rate limited")
+        
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        return f"re:{prompt}"
+
+
+def test_map_concurrent_and_ordered():
+    """7 prompts at concurrency 4: ~2 round trips, results in input order, 429 retried, 400 not retried"""
+    print("=" * 70)
+    print("🧪 Testing Async LLM Map")
+    print("=" * 70)
+    
+    backend = _FakeAsyncBackend()
+    prompts = [f"buyer{i}" for i in range(5)] + ["flaky", "bad"]
+    
+    async def main():
+        brain = AsyncLLMHandler(use_cache=False, max_concurrency=4, backoff=0.01, backend=backend)
+        return await brain.map("BRAVO", prompts)
+    
+    start = time.perf_counter()
+    results = asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    
+    print(f"\n   {len(prompts)} prompts in {elapsed:.2f}s (serial: {0.2 * 6:.1f}s) | peak in-flight: {backend.peak}")
+    
+    assert results[:6] == [f"re:{p}" for p in prompts[:6]]
+    assert results[6] == "{}"
+    assert backend.peak == 4
+    assert backend.calls.count("flaky") == 2 and backend.calls.count("bad") == 1
+    assert elapsed < 0.9
+    
+    print("   ✅ Ordered fan-out OK")
+    print("=" * 70)
+
+
+def test_sync_map_llm():
+    """LLMHandler.map_llm works from plain threads and from inside a running loop"""
+    handler = LLMHandler(use_cache=False, backend=_FakeAsyncBackend(latency=0.1))
+    
+    start = time.perf_counter()
+    assert handler.map_llm("ZULU", ["a", "b", "c"]) == ["re:a", "re:b", "re:c"]
+    assert time.perf_counter() - start < 0.25
+    
+    async def inside_loop():
+        return handler.map_llm("ZULU", ["d"])
+    assert asyncio.run(inside_loop()) == ["re:d"]
+
+
+class _SnippetBackend(LLMBackend):
+    """'News: hit' 스니펫만 유효 리드 JSON 반환"""
+    
+    def __init__(self):
+        self.calls = []
+    
+    async def acomplete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        self.calls.append(user_prompt)
+        if "News: hit" in user_prompt:
+            return '{"company_name": "테스트바이오", "summary": "진단키트", "sector": "Bio"}'
+        return '{}'
+
+
+class _FakeSearch:
+    def __init__(self, titles):
+        self.titles = titles
+    
+    def news(self, query, **kwargs):
+        return [{'title': t, 'body': t, 'url': f"https://news/{i}"} for i, t in enumerate(self.titles)]
+
+
+def test_zulu_batches_stop_early():
+    """ZULU analyses snippets in small batches and stops at the first batch with a valid lead"""
+    def scout(titles):
+        backend = _SnippetBackend()
+        zulu = ZuluScout.__new__(ZuluScout)
+        zulu.brain = LLMHandler(use_cache=False, backend=backend)
+        zulu.search = _FakeSearch(titles)
+        zulu.role_prompt = "ZULU"
+        zulu.blacklist = []
+        return zulu._execute_search("테스트바이오", None, 'HOT', "테스트바이오"), backend
+    
+    # 첫 배치에서 리드 발견 → 나머지 스니펫은 LLM 호출 없음
+    leads, backend = scout(["hit", "miss", "miss", "miss", "miss"])
+    assert [l['url'] for l in leads] == ["https://news/0"]
+    assert len(backend.calls) == ANALYSIS_BATCH
+    
+    # 뒤쪽 배치의 리드: 앞 배치 모두 실패한 뒤에만 호출
+    leads, backend = scout(["miss", "miss", "miss", "hit", "miss"])
+    assert [l['url'] for l in leads] == ["https://news/3"]
+    assert len(backend.calls) == 4
+    
+    leads, backend = scout(["miss"] * 5)
+    assert leads == [] and len(backend.calls) == 5
+
+
+if __name__ == "__main__":
+    try:
+        test_map_concurrent_and_ordered()
+        test_sync_map_llm()
+        test_zulu_batches_stop_early()
+        
+        print("\n✅ ALL ASYNC LLM TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
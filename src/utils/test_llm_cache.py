@@ -0,0 +1,111 @@
+"""
+Test LLM Response Cache
+
+Usage:
+    python -m src.utils.test_llm_cache
+"""
+
+import sys
+import os
+import time
+import tempfile
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.utils.llm_handler import LLMHandler
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.llm_backends import LLMBackend, MockBackend
+
+
+class _FakeBackend(LLMBackend):
+    """실제 API 처럼 캐시 대상 (cacheable)"""
+    
+    def __init__(self, calls, latency=0.05):
+        self.calls = calls
+        self.latency = latency
+    
+    def complete(self, model, system_prompt, user_prompt, temperature, max_tokens):
+        self.calls.append(user_prompt)
+        time.sleep(self.latency)
+        return "" if "empty" in user_prompt else f"answer({len(self.calls)})"
+
+
+def _handler(cache, calls):
+    return LLMHandler(cache=cache, backend=_FakeBackend(calls))
+
+
+def test_repeat_prompt_hits_cache():
+    """Same prompt across handler instances: one API call, whitespace-only differences dedupe"""
+    print("=" * 70)
+    print("🧪 Testing LLM Response Cache")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        calls = []
+        cache = LLMResponseCache(os.path.join(tmp, 'llm.sqlite'))
+        
+        start = time.perf_counter()
+        first = _handler(cache, calls).call_llm("Sector Analyst", "Classify: 삼성전자", mode="fast")
+        cold = time.perf_counter() - start
+        
+        # 새 인스턴스 (에이전트별 LLMHandler 와 동일 상황) + 들여쓰기만 다른 프롬프트
+        start = time.perf_counter()
+        second = _handler(LLMResponseCache(cache.path), calls).call_llm(
+            "  Sector Analyst\n", "\n        Classify:   삼성전자\n        ", mode="fast"
+        )
+        warm = time.perf_counter() - start
+        
+        print(f"\n   Cold: {cold * 1000:.1f}ms | Warm: {warm * 1000:.1f}ms | API calls: {len(calls)}")
+        assert first == second == "answer(1)"
+        assert len(calls) == 1
+        
+        # 호출 단위 opt-out / 빈 응답은 저장 안 함
+        handler = _handler(cache, calls)
+        assert handler.call_llm("Sector Analyst", "Classify: 삼성전자", use_cache=False) == "answer(2)"
+        handler.call_llm("A", "empty")
+        handler.call_llm("A", "empty")
+        assert len(calls) == 4
+        
+        # 호출 단위 TTL
+        assert handler.call_llm("Sector Analyst", "Classify: 삼성전자", cache_ttl=0) == "answer(5)"
+        
+        stats = handler.cache_stats()
+        print(f"   Stats: {stats}")
+        assert stats['hits'] == 0 and stats['misses'] == 4 and stats['size'] == 1
+        assert LLMHandler(cache=cache, use_cache=False, backend=_FakeBackend(calls)).cache_stats() is None
+        assert LLMHandler(cache=cache, backend=MockBackend()).cache_stats() is None  # 가짜 응답은 캐시 안 함
+    
+    print("   ✅ Repeat prompt served from cache")
+    print("=" * 70)
+
+
+def test_lru_eviction():
+    """Least recently used responses are evicted beyond max_entries"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = LLMResponseCache(os.path.join(tmp, 'llm.sqlite'), max_entries=2)
+        keys = [cache.make_key("m", "s", f"u{i}", 0.3) for i in range(3)]
+        
+        cache.put(keys[0], "a")
+        time.sleep(0.01)
+        cache.put(keys[1], "b")
+        time.sleep(0.01)
+        assert cache.get(keys[0]) == "a"  # keys[0] 최근 사용 → keys[1] 이 LRU
+        time.sleep(0.01)
+        cache.put(keys[2], "c")
+        
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) == "a" and cache.get(keys[2]) == "c"
+        assert cache.make_key("m", "s", "u0", 0.7) != keys[0]
+
+
+if __name__ == "__main__":
+    try:
+        test_repeat_prompt_hits_cache()
+        test_lru_eviction()
+        
+        print("\n✅ ALL LLM CACHE TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
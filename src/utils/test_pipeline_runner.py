@@ -0,0 +1,164 @@
+"""
+Test Background Pipeline Runner
+
+Usage:
+    python -m src.utils.test_pipeline_runner
+"""
+
+import sys
+import os
+import time
+import tempfile
+import threading
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+
+from src.utils.stage_graph import Stage
+from src.utils.pipeline_runner import PipelineRunner, StageResultStore
+
+
+def _stages(calls, revenue=100.0, gate=None):
+    """웹 파이프라인과 같은 모양: zulu → xray → (dcf ∥ bravo) → alpha"""
+    def stage(name, value, seconds=0.05):
+        def run(inputs):
+            calls.append(name)
+            if gate is not None and name == "dcf":
+                gate.wait()
+            time.sleep(seconds)
+            return value(inputs)
+        return run
+    
+    return [
+        Stage("zulu", stage("zulu", lambda r: {"company_name": "테스트"}), cache_key=lambda r: "테스트"),
+        Stage("xray", stage("xray", lambda r: {"revenue_bn": revenue}), deps=("zulu",),
+              cache_key=lambda r: (r["zulu"], revenue)),
+        Stage("dcf", stage("dcf", lambda r: {"ev_base": r["xray"]["revenue_bn"] * 2}), deps=("xray",),
+              required=False, cache_key=lambda r: r["xray"]),
+        Stage("bravo", stage("bravo", lambda r: ["buyer"]), deps=("zulu", "xray"),
+              cache_key=lambda r: (r["zulu"], r["xray"])),
+        Stage("alpha", stage("alpha", lambda r: f"teaser({r['dcf']['ev_base']:.0f})"), deps=("dcf", "bravo")),
+    ]
+
+
+def test_background_progress_and_persistence():
+    """submit returns immediately, stages report progress, finished results are restored on resubmit"""
+    print("=" * 70)
+    print("🧪 Testing Pipeline Runner")
+    print("=" * 70)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = PipelineRunner(store=StageResultStore(os.path.join(tmp, 'stages.sqlite')), max_workers=4)
+        calls, gate = [], threading.Event()
+        
+        start = time.perf_counter()
+        job = runner.submit("job-1", _stages(calls, gate=gate))
+        assert time.perf_counter() - start < 0.05
+        assert runner.submit("job-1", _stages([])) is job  # 실행 중 중복 submit
+        
+        # dcf 대기 중: zulu / xray 결과는 이미 조회 가능
+        deadline = time.time() + 2
+        while job.snapshot()['results'].keys() < {"zulu", "xray", "bravo"} and time.time() < deadline:
+            time.sleep(0.01)
+        partial = job.snapshot()
+        states = {s['name']: s['state'] for s in partial['stages']}
+        print(f"\n   Partial: {states}")
+        assert partial['state'] == 'running'
+        assert states == {"zulu": "done", "xray": "done", "dcf": "running", "bravo": "done", "alpha": "pending"}
+        
+        gate.set()
+        assert job.wait(2)
+        final = job.snapshot()
+        print(f"   Final: {final['state']} in {final['elapsed']:.2f}s → {final['results']['alpha']}")
+        assert final['state'] == 'done'
+        assert final['results']['alpha'] == "teaser(200)"
+        
+        # 재실행 (rerun / 다른 세션): cache_key 가 있는 단계는 복원, alpha 만 재계산
+        calls.clear()
+        again = runner.submit("job-1", _stages(calls))
+        assert again is not job and again.wait(2)
+        cached = [s['name'] for s in again.snapshot()['stages'] if s['cached']]
+        print(f"   Resubmit calls: {calls}, restored: {cached}")
+        assert calls == ["alpha"]
+        assert cached == ["zulu", "xray", "dcf", "bravo"]
+        
+        # 입력 변경 → 해당 단계 이후만 재계산
+        calls.clear()
+        changed = runner.submit("job-2", _stages(calls, revenue=150.0))
+        changed.wait(2)
+        assert changed.snapshot()['results']['alpha'] == "teaser(300)"
+        assert sorted(calls) == ["alpha", "bravo", "dcf", "xray"]
+        
+        # force → 저장 결과 무시
+        calls.clear()
+        runner.submit("job-2", _stages(calls, revenue=150.0), force=True).wait(2)
+        assert len(calls) == 5
+    
+    print("   ✅ Background execution + persistence OK")
+    print("=" * 70)
+
+
+def test_none_cache_key_not_persisted():
+    """cache_key → None (reused session result) skips both restore and persist for that run"""
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = PipelineRunner(store=StageResultStore(os.path.join(tmp, 'stages.sqlite')))
+        
+        def stages(existing):
+            return [Stage(
+                "dcf",
+                lambda r: existing if existing is not None else {"ev_base": 200},
+                cache_key=lambda r: None if existing is not None else ("WOOD_V2", "테스트"),
+            )]
+        
+        reuse = runner.submit("reuse", stages({"ev_base": 999, "timestamp": "old"}))
+        reuse.wait(2)
+        assert reuse.snapshot()['results']['dcf']['ev_base'] == 999
+        assert runner.store.misses == 0  # 조회 자체를 하지 않음
+        
+        # Reuse 끈 실행: 세션 결과가 아니라 새로 계산한 결과
+        fresh = runner.submit("fresh", stages(None))
+        fresh.wait(2)
+        assert fresh.snapshot()['results']['dcf'] == {"ev_base": 200}
+        assert fresh.snapshot()['stages'][0]['cached'] is False
+
+
+def test_failures():
+    """Optional failure keeps going; required failure skips dependents and marks the job failed"""
+    with tempfile.TemporaryDirectory() as tmp:
+        runner = PipelineRunner(store=StageResultStore(os.path.join(tmp, 'stages.sqlite')))
+        
+        def boom(inputs):
+            raise RuntimeError("DART down")
+        
+        job = runner.submit("ok", [
+            Stage("xray", lambda r: 1),
+            Stage("dcf", boom, deps=("xray",), required=False),
+            Stage("alpha", lambda r: r["dcf"], deps=("dcf",)),
+        ])
+        job.wait(2)
+        snap = job.snapshot()
+        assert snap['state'] == 'done'
+        assert snap['stages'][1]['state'] == 'failed' and 'DART down' in snap['stages'][1]['error']
+        assert snap['results'] == {"xray": 1, "alpha": None}
+        
+        job = runner.submit("fail", [
+            Stage("xray", boom),
+            Stage("alpha", lambda r: r["xray"], deps=("xray",)),
+        ])
+        job.wait(2)
+        snap = job.snapshot()
+        assert snap['state'] == 'failed' and "xray" in snap['error']
+        assert [s['state'] for s in snap['stages']] == ['failed', 'skipped']
+
+
+if __name__ == "__main__":
+    try:
+        test_background_progress_and_persistence()
+        test_none_cache_key_not_persisted()
+        test_failures()
+        
+        print("\n✅ ALL PIPELINE RUNNER TESTS PASSED\n")
+    
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
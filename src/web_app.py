@@ -180,6 +180,274 @@ def _safe_float(v: Any, default: float = 0.0) -> float:
     except Exception:
         return default
 
+
+@st.cache_resource(show_spinner=False)
+def get_pipeline_runner():
+    """Process-wide background pipeline runner (jobs survive reruns; stage results persisted)."""
+    from src.utils.pipeline_runner import PipelineRunner
+    return PipelineRunner()
+
+
+PIPELINE_STAGE_LABELS = {
+    "zulu": "🚀 ZULU: Targeting",
+    "xray": "⚡ X-RAY: Financials (LTM)",
+    "dcf": "🌲 WOOD: DCF (V2)",
+    "live_v3": "🧮 WOOD V3: Live Excel",
+    "bravo": "🤝 BRAVO: Buyer matching",
+    "alpha": "🖋️ ALPHA: Teaser",
+}
+PIPELINE_STATE_ICONS = {"pending": "⏳", "running": "🔄", "done": "✅", "failed": "❌", "skipped": "⏭️"}
+PIPELINE_POLL_SECONDS = 1.5
+
+
+def _pipeline_base_revenue(xray_result: Dict[str, Any], ctx: Dict[str, Any]) -> float:
+    """Prefer X-RAY LTM revenue; fallback to collected_data if exists."""
+    return float(
+        (xray_result or {}).get("financials", {}).get("revenue_bn")
+        or ctx.get("collected_revenue")
+        or 0
+    )
+
+
+def _build_pipeline_stages(zulu, query: str, include_wood_dcf: bool, include_wood_v3: bool, ctx: Dict[str, Any]):
+    """
+    Build the /run stage graph for the background pipeline runner.
+
+    Graph: ZULU → X-RAY → (WOOD V2 ∥ WOOD V3 ∥ BRAVO) → ALPHA
+
+    Stages run in worker threads, so they only read `ctx` (a session_state snapshot
+    taken at submit time) and never touch st.session_state. `cache_key` = company +
+    stage inputs → finished results are restored instead of recomputed. Stages that
+    return a reused session result (Reuse toggles) return None from `cache_key`, so
+    that object is never persisted under the company/inputs key.
+    """
+    from src.utils.stage_graph import Stage
+
+    def pname(r):
+        return r["zulu"].get("company_name") or query
+
+    def run_zulu(r):
+        leads = zulu.search_leads(query)
+        if not leads:
+            raise ValueError("Target Not Found")
+        return leads[0]
+
+    def run_xray(r):
+        from src.agents.xray_val import XrayValuation
+        return XrayValuation().run_valuation(r["zulu"])
+
+    def reused(r, name):
+        """Session result to reuse for this company (ctx[name]), else None."""
+        existing = ctx.get(name)
+        if isinstance(existing, dict) and existing.get("project_name") == (r["zulu"].get("company_name") or ctx.get("company_name")):
+            return existing
+        return None
+
+    def dcf_source(r):
+        return str(r["xray"].get("financials", {}).get("source") or "X-RAY LTM")
+
+    def run_dcf(r):
+        existing = reused(r, "existing_dcf")
+        if existing is not None:
+            return existing
+
+        filepath, summary = ctx["orchestrator"].run_valuation(
+            project_name=pname(r),
+            base_revenue=_pipeline_base_revenue(r["xray"], ctx),
+            data_source=dcf_source(r),
+        )
+        return {
+            "filepath": filepath,
+            "summary": summary,
+            "timestamp": datetime.now().isoformat(),
+            "engine": "WOOD_V2",
+            "project_name": pname(r),
+            "dcf_info": _extract_dcf_info_from_wood_v2_summary(summary),
+        }
+
+    def run_live_v3(r):
+        existing = reused(r, "existing_live")
+        if existing is not None:
+            return existing
+
+        from src.engines.wood.exporter_v3 import LiveExcelBuilder
+
+        reports_dir = os.path.join(project_root, "vault", "reports")
+        os.makedirs(reports_dir, exist_ok=True)
+        filename = f"{pname(r)}_DCF_WOOD_V3_LIVE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        filepath = os.path.join(reports_dir, filename)
+
+        builder = LiveExcelBuilder(filepath)
+        builder.build(
+            project_name=pname(r),
+            base_revenue=_pipeline_base_revenue(r["xray"], ctx),
+            assumptions=ctx["v3_assumptions"],
+            scenarios=ctx["v3_scenarios"],
+            historical_data=ctx["historical_data"],
+        )
+
+        with open(filepath, "rb") as f:
+            excel_bytes = f.read()
+
+        return {
+            "filepath": filepath,
+            "filename": filename,
+            "bytes": excel_bytes,
+            "timestamp": datetime.now().isoformat(),
+            "engine": "WOOD_V3_LIVE",
+            "project_name": pname(r),
+        }
+
+    def target_info(r):
+        lead = r["zulu"]
+        return {
+            "company_name": lead.get("company_name"),
+            "sector": lead.get("sector"),
+            "summary": lead.get("summary"),
+            "revenue": (r["xray"].get("financials", {}).get("revenue_bn") or 0),
+        }
+
+    def run_bravo(r):
+        from src.agents.bravo_matchmaker import BravoMatchmaker
+        buyers = BravoMatchmaker().find_buyers(target_info=target_info(r), valuation_info=r["xray"].get("valuation"))
+
+        # Normalize buyer objects to dicts for display
+        buyer_dicts = []
+        for b in buyers or []:
+            if hasattr(b, "dict"):
+                buyer_dicts.append(b.dict())
+            elif isinstance(b, dict):
+                buyer_dicts.append(b)
+            else:
+                buyer_dicts.append({"name": str(b)})
+        return buyer_dicts
+
+    def alpha_inputs(r):
+        lead = r["zulu"]
+        dcf_info = (r.get("dcf") or {}).get("dcf_info")
+        return {
+            "target": {"company_name": lead.get("company_name"), "sector": lead.get("sector"), "summary": lead.get("summary")},
+            "financials": r["xray"].get("financials", {}),
+            "valuation": r["xray"].get("valuation", {}),
+            "buyers": r["bravo"],
+            "dcf_info": dcf_info or ctx.get("fallback_dcf") or None,
+        }
+
+    def run_alpha(r):
+        from src.agents.alpha_vp import AlphaChief
+        return AlphaChief().generate_report(**alpha_inputs(r))
+
+    stages = [
+        Stage("zulu", run_zulu, cache_key=lambda r: ("ZULU", query)),
+        Stage("xray", run_xray, deps=("zulu",), cache_key=lambda r: ("XRAY", r["zulu"])),
+    ]
+    alpha_deps = ("zulu", "xray", "bravo")
+    if include_wood_dcf:
+        stages.append(Stage(
+            "dcf", run_dcf, deps=("zulu", "xray"), required=False,
+            cache_key=lambda r: None if reused(r, "existing_dcf") is not None else (
+                "WOOD_V2", pname(r), _pipeline_base_revenue(r["xray"], ctx), dcf_source(r), ctx["use_live_beta"],
+            ),
+        ))
+        alpha_deps += ("dcf",)
+    if include_wood_v3:
+        stages.append(Stage(
+            "live_v3", run_live_v3, deps=("zulu", "xray"), required=False,
+            cache_key=lambda r: None if reused(r, "existing_live") is not None else (
+                "WOOD_V3_LIVE", pname(r), _pipeline_base_revenue(r["xray"], ctx),
+                ctx["v3_assumptions"], ctx["v3_scenarios"], ctx["historical_data"],
+            ),
+        ))
+    stages += [
+        Stage("bravo", run_bravo, deps=("zulu", "xray"),
+              cache_key=lambda r: ("BRAVO", target_info(r), r["xray"].get("valuation"))),
+        Stage("alpha", run_alpha, deps=alpha_deps, cache_key=lambda r: ("ALPHA", alpha_inputs(r))),
+    ]
+    return stages
+
+
+def _render_pipeline_stages(snap: Dict[str, Any]):
+    """Per-stage status lines (state, elapsed, restored-from-disk marker)."""
+    for s in snap["stages"]:
+        line = f"{PIPELINE_STATE_ICONS.get(s['state'], '•')} **{PIPELINE_STAGE_LABELS.get(s['name'], s['name'])}** — {s['state']}"
+        if s["state"] in ("done", "failed"):
+            line += f" ({s['elapsed']:.1f}s)"
+        if s["cached"]:
+            line += " · 💾 saved result"
+        if s["error"]:
+            line += f" · `{s['error']}`"
+        st.markdown(line)
+
+
+def _render_pipeline_partials(snap: Dict[str, Any]):
+    """Render each finished stage's output as soon as it is available."""
+    results = snap["results"]
+
+    lead = results.get("zulu")
+    if lead:
+        st.markdown(f"**🎯 Target:** {lead.get('company_name', 'N/A')} ({lead.get('sector') or 'N/A'})")
+
+    xray_result = results.get("xray")
+    if xray_result:
+        fin = xray_result.get("financials", {})
+        val = xray_result.get("valuation", {})
+        c1, c2 = st.columns(2)
+        with c1:
+            st.metric("Revenue (LTM)", f"{fin.get('revenue_bn', 0):,.0f}억" if fin.get("revenue_bn") else "N/A")
+        with c2:
+            st.metric("X-RAY Value", f"{val.get('target_value', 0):,.0f}억" if val.get("target_value") else "N/A")
+
+    dcf_info = (results.get("dcf") or {}).get("dcf_info") or {}
+    if dcf_info:
+        c1, c2 = st.columns(2)
+        with c1:
+            st.metric("EV (Base)", f"{dcf_info.get('ev_base', 0):,.0f}억" if dcf_info.get("ev_base") else "N/A")
+        with c2:
+            st.metric("WACC", f"{dcf_info.get('wacc', 0):.2f}%" if dcf_info.get("wacc") else "N/A")
+
+    if results.get("live_v3"):
+        st.caption(f"🧮 Live Excel ready: {results['live_v3'].get('filename', '')}")
+
+    buyers = results.get("bravo")
+    if buyers:
+        st.markdown("**🤝 Buyers:** " + ", ".join(str(b.get("name", "N/A")) for b in buyers[:5]))
+
+
+@st.fragment(run_every=PIPELINE_POLL_SECONDS)
+def _poll_pipeline_job(job):
+    """Re-render only the progress block while the job runs; full rerun once it finishes."""
+    if job.done:
+        st.rerun()
+
+    snap = job.snapshot()
+    finished = sum(s["state"] != "pending" and s["state"] != "running" for s in snap["stages"])
+    running = [PIPELINE_STAGE_LABELS.get(s["name"], s["name"]) for s in snap["stages"] if s["state"] == "running"]
+    st.progress(
+        finished / max(len(snap["stages"]), 1),
+        text=f"{', '.join(running) or 'Pipeline'}... ({snap['elapsed']:.0f}s)"
+    )
+    _render_pipeline_stages(snap)
+    _render_pipeline_partials(snap)
+
+
+def _apply_pipeline_result(snap: Dict[str, Any]):
+    """Publish a finished job to session_state (same shape as the former synchronous run)."""
+    results = snap["results"]
+    if results.get("dcf"):
+        st.session_state["dcf_result"] = results["dcf"]
+    if results.get("live_v3"):
+        st.session_state["dcf_v3_live"] = results["live_v3"]
+
+    st.session_state["pipeline_result"] = {
+        "lead": results.get("zulu"),
+        "xray": results.get("xray"),
+        "buyers": results.get("bravo") or [],
+        "teaser": results.get("alpha") or "",
+        "dcf": results.get("dcf"),
+        "live_v3": results.get("live_v3"),
+        "timestamp": datetime.now().isoformat(),
+    }
+
 # ==============================================================================
 # 🔒 ACCESS CONTROL (Mellon Gate)
 # ==============================================================================
@@ -672,6 +940,8 @@ with tab2:
                             'engine': 'WOOD_V2',
                             'project_name': company,
                             'dcf_info': _extract_dcf_info_from_wood_v2_summary(summary),
+                            # Cached FCF vector: heatmap redraws without re-running the DCF
+                            'surface': getattr(orchestrator, 'sensitivity_surfaces', {}).get('Base'),
                         }
 
                         st.success("✅ DCF Valuation Completed (WOOD V2)")
@@ -785,6 +1055,35 @@ with tab2:
             # Full summary
             st.markdown(result['summary'])
             
+            # WACC × Terminal Growth heatmap (Base scenario)
+            surface = result.get('surface')
+            if surface is not None:
+                st.markdown("#### 🌡️ Sensitivity Heatmap (WACC × Terminal Growth)")
+                
+                h1, h2, h3 = st.columns(3)
+                with h1:
+                    grid_points = st.slider("Grid Resolution", 5, 100, 50, key="sens_points")
+                with h2:
+                    wacc_span = st.slider("WACC Range (±%p)", 0.5, 5.0, 2.0, 0.5, key="sens_wacc_span") / 100
+                with h3:
+                    growth_span = st.slider("Growth Range (±%p)", 0.25, 2.0, 1.0, 0.25, key="sens_growth_span") / 100
+                
+                grid = surface.grid(grid_points, grid_points, wacc_span, growth_span)
+                heat = grid.stack().rename('EV').reset_index()
+                
+                import altair as alt
+                chart = alt.Chart(heat).mark_rect().encode(
+                    x=alt.X('WACC:Q', bin=alt.Bin(maxbins=grid_points), axis=alt.Axis(format='.1%')),
+                    y=alt.Y('Terminal_Growth:Q', bin=alt.Bin(maxbins=grid_points), axis=alt.Axis(format='.2%')),
+                    color=alt.Color('EV:Q', scale=alt.Scale(scheme='redyellowgreen'), title='EV (억)'),
+                    tooltip=[
+                        alt.Tooltip('WACC:Q', format='.2%'),
+                        alt.Tooltip('Terminal_Growth:Q', format='.2%'),
+                        alt.Tooltip('EV:Q', format=',.1f')
+                    ]
+                )
+                st.altair_chart(chart, use_container_width=True)
+            
             st.divider()
             
             # Download Section
@@ -1395,7 +1694,7 @@ with tab6:
     )
 
     st.markdown("#### ⚙️ Pipeline Options")
-    opt1, opt2, opt3, opt4 = st.columns([1, 1, 1, 1])
+    opt1, opt2, opt3, opt4, opt5 = st.columns([1, 1, 1, 1, 1])
     with opt1:
         include_wood_dcf = st.toggle(
             "Include DCF (V2)",
@@ -1424,12 +1723,22 @@ with tab6:
             help="이미 생성된 WOOD V3 Live가 있으면 재사용합니다.",
             key="pipeline_reuse_v3"
         )
+    with opt5:
+        force_recompute = st.toggle(
+            "Recompute",
+            value=False,
+            help="저장된 단계 결과를 무시하고 다시 계산합니다 (기업/입력값이 같으면 기본적으로 재사용).",
+            key="pipeline_force"
+        )
 
     col1, col2 = st.columns([1, 2])
     with col1:
         run_pipeline = st.button("🚀 Run Full Pipeline", use_container_width=True, type="primary")
     with col2:
         st.caption("결과는 Teaser(스토리) + DCF(V2) + Live Excel(V3)까지 결합되어 ZIP 패키지로 다운로드 가능합니다.")
+        st.caption("백그라운드에서 실행되며, 단계별 결과가 완료되는 대로 표시됩니다.")
+
+    runner = get_pipeline_runner()
 
     if run_pipeline:
         missing = check_api_keys(require_openai=True, require_dart=False)
@@ -1438,211 +1747,91 @@ with tab6:
         elif not pipeline_query.strip():
             st.warning("타겟을 입력해 주세요.")
         else:
-            try:
-                import traceback
-
-                zulu = get_zulu_scout()
-                if not zulu:
-                    st.error("ZuluScout 초기화 실패")
-                    st.stop()
-
-                with st.status("🚀 Running Pipeline...", expanded=True) as status:
-                    status.update(label="🚀 ZULU: Targeting...", state="running")
-                    leads = zulu.search_leads(pipeline_query.strip())
-                    if not leads:
-                        status.update(label="❌ ZULU: Target Not Found", state="error")
-                        st.stop()
-
-                    lead = leads[0]
-                    status.update(label=f"✅ ZULU: Found {lead.get('company_name', 'N/A')}", state="running")
-
-                    status.update(label="⚡ X-RAY: Analyzing financials (LTM)...", state="running")
-                    from src.agents.xray_val import XrayValuation
-                    xray = XrayValuation()
-                    xray_result = xray.run_valuation(lead)
-
-                    # Optional: WOOD DCF (V2) - auto-run or reuse
-                    dcf_info = None
-                    v3_live = None
-                    if include_wood_dcf:
-                        status.update(label="🌲 WOOD: Preparing DCF...", state="running")
-
-                        existing = st.session_state.get("dcf_result") if reuse_existing_dcf else None
-                        existing_ok = False
-                        if existing and isinstance(existing, dict):
-                            if existing.get("project_name") == (lead.get("company_name") or st.session_state.get("company_name")):
-                                existing_ok = True
-
-                        if existing_ok:
-                            status.update(label="🌲 WOOD: Reusing existing DCF result", state="running")
-                            dcf_info = (existing.get("dcf_info") or {}) if isinstance(existing, dict) else None
-                        else:
-                            status.update(label="🌲 WOOD: Running DCF (WOOD V2)...", state="running")
-                            orchestrator = get_wood_orchestrator(use_live_beta=use_live_beta)
-
-                            # Prefer X-RAY LTM revenue; fallback to collected_data if exists
-                            base_rev = (
-                                xray_result.get("financials", {}).get("revenue_bn")
-                                or st.session_state.get("collected_data", {}).get("revenue")
-                                or 0
-                            )
-                            data_source = xray_result.get("financials", {}).get("source") or "X-RAY LTM"
-
-                            filepath, summary = orchestrator.run_valuation(
-                                project_name=lead.get("company_name") or pipeline_query.strip(),
-                                base_revenue=float(base_rev),
-                                data_source=str(data_source),
-                            )
-
-                            dcf_info = _extract_dcf_info_from_wood_v2_summary(summary)
-                            st.session_state["dcf_result"] = {
-                                "filepath": filepath,
-                                "summary": summary,
-                                "timestamp": datetime.now().isoformat(),
-                                "engine": "WOOD_V2",
-                                "project_name": lead.get("company_name") or pipeline_query.strip(),
-                                "dcf_info": dcf_info,
-                            }
-                            status.update(label="✅ WOOD: DCF complete", state="running")
-
-                    # Optional: WOOD V3 Live Excel (Formula-Linked)
-                    if include_wood_v3:
-                        status.update(label="🧮 WOOD V3: Preparing Live Excel...", state="running")
-
-                        existing_live = st.session_state.get("dcf_v3_live") if reuse_existing_v3 else None
-                        live_ok = False
-                        if existing_live and isinstance(existing_live, dict):
-                            if existing_live.get("project_name") == (lead.get("company_name") or st.session_state.get("company_name")):
-                                live_ok = True
-
-                        if live_ok:
-                            status.update(label="🧮 WOOD V3: Reusing existing Live model", state="running")
-                            v3_live = existing_live
-                        else:
-                            status.update(label="🧮 WOOD V3: Building Live model (Formula-Linked)...", state="running")
-                            from src.engines.wood.exporter_v3 import LiveExcelBuilder
-
-                            # Scenario inputs: reuse DCF tab inputs if present; else use defaults
-                            bg = _safe_float(st.session_state.get("base_growth", 0.10), 0.10)
-                            bm = _safe_float(st.session_state.get("base_margin", 0.15), 0.15)
-                            bulg = _safe_float(st.session_state.get("bull_growth", 0.15), 0.15)
-                            bulm = _safe_float(st.session_state.get("bull_margin", 0.20), 0.20)
-                            beg = _safe_float(st.session_state.get("bear_growth", 0.05), 0.05)
-                            bem = _safe_float(st.session_state.get("bear_margin", 0.08), 0.08)
-
-                            base_rev_for_v3 = (
-                                xray_result.get("financials", {}).get("revenue_bn")
-                                or st.session_state.get("collected_data", {}).get("revenue")
-                                or 0
-                            )
-
-                            assumptions = {
-                                "tax_rate": 0.22,
-                                "terminal_growth": _safe_float(terminal_growth, 1.5) / 100.0,
-                                "projection_years": int(projection_years),
-                                # WACC inputs (editable in Excel)
-                                "risk_free_rate": 0.035,
-                                "market_risk_premium": 0.08,
-                                "beta": 1.0,
-                                "cost_of_debt": 0.045,
-                            }
-
-                            scenarios = {
-                                "Base": {"revenue_growth": float(bg), "ebit_margin": float(bm)},
-                                "Bull": {"revenue_growth": float(bulg), "ebit_margin": float(bulm)},
-                                "Bear": {"revenue_growth": float(beg), "ebit_margin": float(bem)},
-                            }
-
-                            historical_data = None
-                            if "historical_data" in st.session_state:
-                                try:
-                                    df_hist = st.session_state["historical_data"]
-                                    if isinstance(df_hist, pd.DataFrame):
-                                        historical_data = {"raw": df_hist.to_dict(orient="list")}
-                                except Exception:
-                                    historical_data = None
-
-                            reports_dir = os.path.join(project_root, "vault", "reports")
-                            os.makedirs(reports_dir, exist_ok=True)
-                            pname = lead.get("company_name") or pipeline_query.strip()
-                            filename = f"{pname}_DCF_WOOD_V3_LIVE_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                            filepath = os.path.join(reports_dir, filename)
-
-                            builder = LiveExcelBuilder(filepath)
-                            builder.build(
-                                project_name=pname,
-                                base_revenue=float(base_rev_for_v3),
-                                assumptions=assumptions,
-                                scenarios=scenarios,
-                                historical_data=historical_data,
-                            )
-
-                            with open(filepath, "rb") as f:
-                                excel_bytes = f.read()
-
-                            v3_live = {
-                                "filepath": filepath,
-                                "filename": filename,
-                                "bytes": excel_bytes,
-                                "timestamp": datetime.now().isoformat(),
-                                "engine": "WOOD_V3_LIVE",
-                                "project_name": pname,
-                            }
-                            st.session_state["dcf_v3_live"] = v3_live
-                            status.update(label="✅ WOOD V3: Live model built", state="running")
-
-                    status.update(label="🤝 BRAVO: Matching buyers...", state="running")
-                    from src.agents.bravo_matchmaker import BravoMatchmaker
-                    bravo = BravoMatchmaker()
-
-                    target_info = {
-                        "company_name": lead.get("company_name"),
-                        "sector": lead.get("sector"),
-                        "summary": lead.get("summary"),
-                        "revenue": (xray_result.get("financials", {}).get("revenue_bn") or 0),
-                    }
-                    buyers = bravo.find_buyers(target_info=target_info, valuation_info=xray_result.get("valuation"))
-
-                    # Normalize buyer objects to dicts for display
-                    buyer_dicts = []
-                    for b in buyers or []:
-                        if hasattr(b, "dict"):
-                            buyer_dicts.append(b.dict())
-                        elif isinstance(b, dict):
-                            buyer_dicts.append(b)
-                        else:
-                            buyer_dicts.append({"name": str(b)})
-
-                    status.update(label="🖋️ ALPHA: Writing teaser...", state="running")
-                    from src.agents.alpha_vp import AlphaChief
-                    alpha = AlphaChief()
-                    teaser_md = alpha.generate_report(
-                        target={"company_name": lead.get("company_name"), "sector": lead.get("sector"), "summary": lead.get("summary")},
-                        financials=xray_result.get("financials", {}),
-                        valuation=xray_result.get("valuation", {}),
-                        buyers=buyer_dicts,
-                        dcf_info=dcf_info or (st.session_state.get("dcf_result", {}) if isinstance(st.session_state.get("dcf_result"), dict) else None) or None,
-                    )
-
-                    st.session_state["pipeline_result"] = {
-                        "lead": lead,
-                        "xray": xray_result,
-                        "buyers": buyer_dicts,
-                        "teaser": teaser_md,
-                        "dcf": st.session_state.get("dcf_result") if include_wood_dcf else None,
-                        "live_v3": v3_live if include_wood_v3 else None,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-
-                    status.update(label="✅ Pipeline Complete", state="complete")
-                    st.success("✅ Full pipeline completed")
-                    st.rerun()
+            zulu = get_zulu_scout()
+            if not zulu:
+                st.error("ZuluScout 초기화 실패")
+                st.stop()
+
+            # Snapshot session inputs now: stages run in background threads (no st.session_state access)
+            historical_data = None
+            if "historical_data" in st.session_state:
+                try:
+                    df_hist = st.session_state["historical_data"]
+                    if isinstance(df_hist, pd.DataFrame):
+                        historical_data = {"raw": df_hist.to_dict(orient="list")}
+                except Exception:
+                    historical_data = None
+
+            existing_dcf = st.session_state.get("dcf_result")
+            ctx = {
+                "company_name": st.session_state.get("company_name"),
+                "use_live_beta": bool(use_live_beta),
+                "orchestrator": get_wood_orchestrator(use_live_beta=use_live_beta) if include_wood_dcf else None,
+                "collected_revenue": (st.session_state.get("collected_data") or {}).get("revenue"),
+                "existing_dcf": existing_dcf if reuse_existing_dcf else None,
+                "existing_live": st.session_state.get("dcf_v3_live") if reuse_existing_v3 else None,
+                "fallback_dcf": existing_dcf if isinstance(existing_dcf, dict) else None,
+                "v3_assumptions": {
+                    "tax_rate": 0.22,
+                    "terminal_growth": _safe_float(terminal_growth, 1.5) / 100.0,
+                    "projection_years": int(projection_years),
+                    # WACC inputs (editable in Excel)
+                    "risk_free_rate": 0.035,
+                    "market_risk_premium": 0.08,
+                    "beta": 1.0,
+                    "cost_of_debt": 0.045,
+                },
+                # Scenario inputs: reuse DCF tab inputs if present; else use defaults
+                "v3_scenarios": {
+                    "Base": {
+                        "revenue_growth": _safe_float(st.session_state.get("base_growth", 0.10), 0.10),
+                        "ebit_margin": _safe_float(st.session_state.get("base_margin", 0.15), 0.15),
+                    },
+                    "Bull": {
+                        "revenue_growth": _safe_float(st.session_state.get("bull_growth", 0.15), 0.15),
+                        "ebit_margin": _safe_float(st.session_state.get("bull_margin", 0.20), 0.20),
+                    },
+                    "Bear": {
+                        "revenue_growth": _safe_float(st.session_state.get("bear_growth", 0.05), 0.05),
+                        "ebit_margin": _safe_float(st.session_state.get("bear_margin", 0.08), 0.08),
+                    },
+                },
+                "historical_data": historical_data,
+            }
+
+            query = pipeline_query.strip()
+            job_key = runner.make_key(
+                query, include_wood_dcf, include_wood_v3, reuse_existing_dcf, reuse_existing_v3,
+                ctx["use_live_beta"], ctx["collected_revenue"],
+                ctx["v3_assumptions"], ctx["v3_scenarios"], ctx["historical_data"],
+            )
+            st.session_state["pipeline_job"] = runner.submit(
+                job_key,
+                _build_pipeline_stages(zulu, query, include_wood_dcf, include_wood_v3, ctx),
+                force=force_recompute,
+            )
+            st.session_state["pipeline_applied"] = False
 
-            except Exception as e:
-                st.session_state["last_error"] = traceback.format_exc()
-                st.error(f"❌ Pipeline Error: {e}")
-                with st.expander("🔍 Error Details"):
-                    st.code(st.session_state["last_error"])
+    # Background job: poll while running, publish results once (widget reruns reuse them)
+    job = st.session_state.get("pipeline_job")
+    if job is not None:
+        if not job.done:
+            _poll_pipeline_job(job)
+        else:
+            snap = job.snapshot()
+            if snap["state"] == "done":
+                if not st.session_state.get("pipeline_applied"):
+                    _apply_pipeline_result(snap)
+                    st.session_state["pipeline_applied"] = True
+
+                restored = sum(1 for s in snap["stages"] if s["cached"])
+                with st.expander(f"✅ Pipeline complete · {snap['elapsed']:.0f}s · {restored} stage(s) restored"):
+                    _render_pipeline_stages(snap)
+            else:
+                st.session_state["last_error"] = snap["error"] or snap["state"]
+                st.error(f"❌ Pipeline Error: {snap['error'] or snap['state']}")
+                _render_pipeline_stages(snap)
+                _render_pipeline_partials(snap)
 
     if "pipeline_result" in st.session_state:
         res = st.session_state["pipeline_result"]